@@ -35,11 +35,28 @@ enabling operations like downloading, installing, updating, and removing AppImag
 with support for history, undo functionality, and command composition.
 """
 
+import asyncio
+import json
 import os
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 
 # Reusing AppImageData from previous examples
@@ -141,6 +158,55 @@ class AppImage:
         # Return old values for potential undo
         return file_path, old_version, old_url
 
+    async def download_async(self, destination_dir: str) -> str:
+        """Download the AppImage without blocking the event loop.
+
+        Args:
+            destination_dir: Directory to download the AppImage to
+
+        Returns:
+            str: The path to the downloaded file
+        """
+        print(f"Downloading {self.name} from {self.download_url}...")
+        file_path = os.path.join(
+            destination_dir, f"{self.name}-{self.version}.AppImage"
+        )
+
+        # Simulate download
+        await asyncio.sleep(0.2)
+
+        print(f"Downloaded to {file_path}")
+        return file_path
+
+    async def update_async(
+        self, destination_dir: str, new_version: str, new_url: str
+    ) -> Tuple[str, str, str]:
+        """Update the AppImage to a new version without blocking the event loop.
+
+        Args:
+            destination_dir: Directory to download the update to
+            new_version: The new version
+            new_url: URL for the new version
+
+        Returns:
+            Tuple[str, str, str]: The updated file's path, old version and old URL
+        """
+        old_version = self.version
+        old_url = self.download_url
+
+        print(f"Updating {self.name} from version {old_version} to {new_version}...")
+
+        # Update AppImage data
+        self.data.version = new_version
+        self.data.download_url = new_url
+        self.version = new_version
+        self.download_url = new_url
+
+        # Download the updated version
+        file_path = await self.download_async(destination_dir)
+
+        return file_path, old_version, old_url
+
     def remove(self, file_path: str) -> bool:
         """Remove the AppImage.
 
@@ -189,6 +255,16 @@ class Command(ABC):
         """
         pass
 
+    @property
+    def coalesce_key(self) -> Optional[Hashable]:
+        """Identify equivalent commands that can share a single execution.
+
+        Returns:
+            Optional[Hashable]: Key shared by equivalent commands, or None if
+            every request must run the command (the default)
+        """
+        return None
+
     @property
     @abstractmethod
     def description(self) -> str:
@@ -248,6 +324,20 @@ class DownloadCommand(Command):
         print(f"Deleted {self.downloaded_path}")
         return True
 
+    @property
+    def coalesce_key(self) -> Optional[Hashable]:
+        """Downloads of the same AppImage version to the same place are equivalent.
+
+        Returns:
+            Optional[Hashable]: The coalescing key
+        """
+        return (
+            "download",
+            self.app_image.name,
+            self.app_image.version,
+            self.destination_dir,
+        )
+
     @property
     def description(self) -> str:
         """Get a description of the command.
@@ -455,39 +545,216 @@ class CompositeCommand(Command):
 
     This demonstrates how commands can be combined into more complex operations,
     while maintaining the same interface.
+
+    By default each command depends on the one before it, so they run strictly
+    in order. Passing dependencies replaces that chain with an explicit graph
+    (command -> commands it needs to run after), and commands whose
+    dependencies are done run concurrently on up to max_workers threads.
+    If any command fails, the ones that already ran are undone in reverse
+    completion order, so dependents are always undone before what they
+    depend on.
     """
 
-    def __init__(self, commands: List[Command], description: str):
+    def __init__(
+        self,
+        commands: List[Command],
+        description: str,
+        dependencies: Optional[Dict[Command, Iterable[Command]]] = None,
+        max_workers: int = 1,
+    ):
         """Initialize with a list of commands.
 
         Args:
             commands: The commands to execute in sequence
             description: Human-readable description of the macro
+            dependencies: Command -> commands that must finish before it starts
+                (defaults to each command depending on the previous one)
+            max_workers: Maximum number of commands running at once
+
+        Raises:
+            ValueError: If a command is listed twice, a dependency is unknown or
+                the dependencies form a cycle
         """
         self.commands = commands
         self._description = description
+        self.max_workers = max_workers
         self.executed_commands = []
 
+        if dependencies is None:
+            dependencies = {
+                command: [previous]
+                for previous, command in zip(commands, commands[1:], strict=False)
+            }
+        # Listing a dependency twice means the same as listing it once
+        self.dependencies: Dict[Command, List[Command]] = {
+            command: list(dict.fromkeys(dependencies.get(command, ())))
+            for command in commands
+        }
+        self._check_dependencies()
+
+    def _check_dependencies(self) -> None:
+        """Make sure the dependency graph only uses known commands and is acyclic.
+
+        Raises:
+            ValueError: If a command is listed twice, a dependency is unknown or
+                the dependencies form a cycle
+        """
+        if len(self.dependencies) != len(self.commands):
+            seen = set()
+            for command in self.commands:
+                if command in seen:
+                    raise ValueError(
+                        f"{command.description} is listed twice in "
+                        f"{self._description}"
+                    )
+                seen.add(command)
+
+        for command, needs in self.dependencies.items():
+            for needed in needs:
+                if needed not in self.dependencies:
+                    raise ValueError(
+                        f"{command.description} depends on {needed.description}, "
+                        f"which is not part of {self._description}"
+                    )
+
+        # Kahn's algorithm: if not every command can be ordered, there's a cycle
+        waiting = {command: len(needs) for command, needs in self.dependencies.items()}
+        ready = [command for command, count in waiting.items() if not count]
+        ordered = 0
+        while ready:
+            done = ready.pop()
+            ordered += 1
+            for command in self._dependents(done):
+                waiting[command] -= 1
+                if not waiting[command]:
+                    ready.append(command)
+        if ordered != len(self.dependencies):
+            raise ValueError(f"Dependencies of {self._description} form a cycle")
+
+    def _dependents(self, done: Command) -> List[Command]:
+        """List the commands that depend on a command.
+
+        Args:
+            done: The command
+
+        Returns:
+            List[Command]: Commands with done among their dependencies
+        """
+        return [
+            command for command, needs in self.dependencies.items() if done in needs
+        ]
+
     def execute(self) -> List[Any]:
-        """Execute all commands in sequence.
+        """Execute all commands, each once its dependencies have finished.
 
         Returns:
-            List[Any]: Results from all commands
+            List[Any]: Results from all commands, in the order of self.commands
         """
-        results = []
+        results: Dict[Command, Any] = {}
+        waiting = {command: len(needs) for command, needs in self.dependencies.items()}
+        running: Dict[Future, Command] = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+
+            def submit_ready(commands: Iterable[Command]) -> None:
+                for command in commands:
+                    if not waiting[command]:
+                        running[pool.submit(command.execute)] = command
+
+            submit_ready(self.commands)
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    command = running.pop(future)
+                    try:
+                        results[command] = future.result()
+                    except Exception as e:
+                        print(f"Error executing {command.description}: {e}")
+                        error = error or e
+                        continue
+
+                    self.executed_commands.append(command)
+                    if error is None:
+                        dependents = self._dependents(command)
+                        for dependent in dependents:
+                            waiting[dependent] -= 1
+                        submit_ready(dependents)
+
+        if error is not None:
+            # Undo already executed commands
+            self._undo_executed()
+            raise error
+
+        return [results[command] for command in self.commands]
+
+    async def execute_async(self) -> List[Any]:
+        """Execute all commands on the running event loop.
+
+        Works like execute(), except async commands are awaited on the loop
+        and only blocking commands take a worker thread, so sync and async
+        commands can be mixed freely. If the composite is cancelled, its
+        running commands are cancelled and the executed ones undone; blocking
+        commands already running in a thread are waited for and undone too.
 
-        for command in self.commands:
-            try:
-                result = command.execute()
-                results.append(result)
+        Returns:
+            List[Any]: Results from all commands, in the order of self.commands
+        """
+        results: Dict[Command, Any] = {}
+        waiting = {command: len(needs) for command, needs in self.dependencies.items()}
+        running: Dict["asyncio.Future[Any]", Command] = {}
+        error: Optional[BaseException] = None
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run(command: Command) -> Any:
+            async with semaphore:
+                return await run_command_async(command)
+
+        def start_ready(commands: Iterable[Command]) -> None:
+            for command in commands:
+                if not waiting[command]:
+                    running[asyncio.ensure_future(run(command))] = command
+
+        def collect(finished: Iterable["asyncio.Future[Any]"]) -> None:
+            nonlocal error
+            for future in finished:
+                command = running.pop(future)
+                if future.cancelled():
+                    continue
+                e = future.exception()
+                if e is not None:
+                    print(f"Error executing {command.description}: {e}")
+                    error = error or e
+                    continue
+
+                results[command] = future.result()
                 self.executed_commands.append(command)
-            except Exception as e:
-                print(f"Error executing {command.description}: {e}")
-                # Undo already executed commands
-                self._undo_executed()
-                raise
-
-        return results
+                if error is None:
+                    dependents = self._dependents(command)
+                    for dependent in dependents:
+                        waiting[dependent] -= 1
+                    start_ready(dependents)
+
+        start_ready(self.commands)
+        try:
+            while running:
+                finished, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                collect(finished)
+        except asyncio.CancelledError as e:
+            for future in running:
+                future.cancel()
+            await asyncio.wait(list(running))
+            collect(list(running))
+            error = e
+
+        if error is not None:
+            # Undo in a worker thread, where async commands can run their own loop
+            await asyncio.to_thread(self._undo_executed)
+            raise error
+
+        return [results[command] for command in self.commands]
 
     def _undo_executed(self):
         """Undo all commands that were executed successfully."""
@@ -529,6 +796,496 @@ class CompositeCommand(Command):
         return self._description
 
 
+# Async Commands - overlap I/O without a thread per command
+class AsyncCommand(Command):
+    """A command whose work is a coroutine - an asynchronous 'Concrete Command'.
+
+    Subclasses implement execute_async() and undo_async(). run() awaits
+    execute_async() within the command's timeout. execute() and undo() run
+    the coroutines to completion with asyncio.run(), so an async command
+    still works wherever a Command does (history, redo, CompositeCommand),
+    as long as those are not called from a thread running an event loop.
+
+    Cancellation is cooperative: cancel() sets a flag that execute_async()
+    checks at safe points with raise_if_cancelled(), and
+    AsyncCommandInvoker.cancel() also cancels the running task. A cancelled
+    or timed out command must leave its receiver as it found it.
+    """
+
+    timeout: Optional[float] = None
+    cancelled: bool = False
+
+    @abstractmethod
+    async def execute_async(self) -> Any:
+        """Execute the command on the running event loop.
+
+        Returns:
+            Any: Command-specific result
+        """
+        pass
+
+    @abstractmethod
+    async def undo_async(self) -> bool:
+        """Undo the command on the running event loop.
+
+        Returns:
+            bool: True if undo was successful
+        """
+        pass
+
+    async def run(self) -> Any:
+        """Execute the command, giving up once its timeout expires.
+
+        Returns:
+            Any: Command-specific result
+
+        Raises:
+            asyncio.TimeoutError: If the command took longer than its timeout
+            asyncio.CancelledError: If the command was cancelled
+        """
+        self.raise_if_cancelled()
+        return await asyncio.wait_for(self.execute_async(), self.timeout)
+
+    def cancel(self) -> None:
+        """Ask the command to stop at its next cancellation point."""
+        self.cancelled = True
+
+    def raise_if_cancelled(self) -> None:
+        """Raise asyncio.CancelledError if cancel() was called."""
+        if self.cancelled:
+            raise asyncio.CancelledError(f"{self.description} was cancelled")
+
+    def execute(self) -> Any:
+        """Execute the command to completion on a new event loop.
+
+        Returns:
+            Any: Command-specific result
+        """
+        return asyncio.run(self.run())
+
+    def undo(self) -> bool:
+        """Undo the command to completion on a new event loop.
+
+        Returns:
+            bool: True if undo was successful
+        """
+        return asyncio.run(self.undo_async())
+
+
+class AsyncDownloadCommand(AsyncCommand, DownloadCommand):
+    """Downloads an AppImage without blocking the event loop."""
+
+    def __init__(
+        self, app_image: AppImage, destination_dir: str, timeout: Optional[float] = None
+    ):
+        """Initialize with AppImage, destination directory and timeout.
+
+        Args:
+            app_image: The AppImage to download
+            destination_dir: Directory to download to
+            timeout: Seconds after which the download is abandoned
+        """
+        super().__init__(app_image, destination_dir)
+        self.timeout = timeout
+
+    async def execute_async(self) -> str:
+        """Execute the download.
+
+        Returns:
+            str: Path to the downloaded file
+        """
+        self.raise_if_cancelled()
+        self.downloaded_path = await self.app_image.download_async(
+            self.destination_dir
+        )
+        return self.downloaded_path
+
+    async def undo_async(self) -> bool:
+        """Undo the download by deleting the file.
+
+        Returns:
+            bool: True if undo was successful
+        """
+        return DownloadCommand.undo(self)
+
+
+class AsyncUpdateCommand(AsyncCommand, UpdateCommand):
+    """Updates an AppImage without blocking the event loop.
+
+    If the update is cancelled or times out while downloading, the AppImage
+    is reverted to its previous version before the error propagates.
+    """
+
+    def __init__(
+        self,
+        app_image: AppImage,
+        destination_dir: str,
+        new_version: str,
+        new_url: str,
+        timeout: Optional[float] = None,
+    ):
+        """Initialize with AppImage, update information and timeout.
+
+        Args:
+            app_image: The AppImage to update
+            destination_dir: Directory to download the update to
+            new_version: The new version
+            new_url: URL for the new version
+            timeout: Seconds after which the update is abandoned
+        """
+        super().__init__(app_image, destination_dir, new_version, new_url)
+        self.timeout = timeout
+
+    async def execute_async(self) -> str:
+        """Execute the update.
+
+        Returns:
+            str: Path to the updated file
+        """
+        self.raise_if_cancelled()
+        self.old_version = self.app_image.version
+        self.old_url = self.app_image.download_url
+        try:
+            self.updated_path, _, _ = await self.app_image.update_async(
+                self.destination_dir, self.new_version, self.new_url
+            )
+        except BaseException:
+            # Stopped halfway: put the previous version back
+            UpdateCommand.undo(self)
+            self.old_version = self.old_url = None
+            raise
+        return self.updated_path
+
+    async def undo_async(self) -> bool:
+        """Undo the update by reverting to the previous version.
+
+        Returns:
+            bool: True if undo was successful
+        """
+        return UpdateCommand.undo(self)
+
+
+async def run_command_async(command: Command) -> Any:
+    """Execute any command from a coroutine.
+
+    Async commands and composites are awaited on the running loop; other
+    commands block, so they run in a worker thread. A thread can't be
+    interrupted, so cancelling a blocking command waits for it to finish and
+    undoes it if it succeeded before the cancellation is passed on.
+
+    Args:
+        command: The command to execute
+
+    Returns:
+        Any: The result of the command execution
+    """
+    if isinstance(command, AsyncCommand):
+        return await command.run()
+    if isinstance(command, CompositeCommand):
+        return await command.execute_async()
+
+    execution = asyncio.ensure_future(asyncio.to_thread(command.execute))
+    try:
+        return await asyncio.shield(execution)
+    except asyncio.CancelledError:
+        await _wait_through_cancel(execution)
+        if not execution.cancelled() and execution.exception() is None:
+            print(f"Undoing cancelled {command.description}")
+            undo = asyncio.ensure_future(asyncio.to_thread(command.undo))
+            await _wait_through_cancel(undo)
+            if not undo.cancelled() and undo.exception() is not None:
+                print(f"Error undoing {command.description}: {undo.exception()}")
+        raise
+
+
+async def _wait_through_cancel(future: "asyncio.Future[Any]") -> None:
+    """Wait for a future to finish, even if the waiting task is cancelled again.
+
+    Args:
+        future: The future, usually a worker thread's
+    """
+    while not future.done():
+        try:
+            await asyncio.wait([future])
+        except asyncio.CancelledError:
+            pass
+
+
+# Command journal - persists the command history
+def _command_class(name: str) -> type:
+    """Find a Command subclass by name.
+
+    Args:
+        name: The class name stored in the journal
+
+    Returns:
+        type: The command class
+
+    Raises:
+        KeyError: If no loaded Command subclass has that name
+    """
+    pending = [Command]
+    while pending:
+        cls = pending.pop()
+        if cls.__name__ == name:
+            return cls
+        pending.extend(cls.__subclasses__())
+    raise KeyError(f"Unknown command type in journal: {name}")
+
+
+def encode_command(command: Command) -> Dict[str, Any]:
+    """Encode a command and its current state as JSON-compatible data.
+
+    Commands and AppImages are stored once in an object table and referenced
+    by index, so objects shared inside a command (e.g. the AppImage of a
+    download and an install in one composite) stay shared when decoded.
+
+    Args:
+        command: The command to encode
+
+    Returns:
+        Dict[str, Any]: The encoded command
+
+    Raises:
+        TypeError: If the command holds state that can't be journaled
+    """
+    objects: List[Any] = []
+    refs: Dict[int, int] = {}
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, (Command, AppImage)):
+            ref = refs.get(id(value))
+            if ref is None:
+                ref = refs[id(value)] = len(objects)
+                objects.append(None)
+                if isinstance(value, AppImage):
+                    objects[ref] = {"appimage": asdict(value.data)}
+                else:
+                    state = {key: encode(item) for key, item in vars(value).items()}
+                    objects[ref] = {"command": type(value).__name__, "state": state}
+            return {"$ref": ref}
+        if isinstance(value, dict):
+            items = value.items()
+            return {"$dict": [[encode(key), encode(item)] for key, item in items]}
+        if isinstance(value, (list, tuple)):
+            return [encode(item) for item in value]
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        raise TypeError(f"Cannot journal {type(value).__name__} state")
+
+    root = encode(command)["$ref"]
+    return {"root": root, "objects": objects}
+
+
+def decode_command(
+    record: Dict[str, Any], receivers: Optional[Mapping[str, AppImage]] = None
+) -> Command:
+    """Rebuild a command from encode_command() output.
+
+    Args:
+        record: The encoded command
+        receivers: Live AppImages by name; the decoded command acts on these
+            instead of on copies rebuilt from the journaled data
+
+    Returns:
+        Command: The decoded command
+    """
+
+    def create(entry: Dict[str, Any]) -> Any:
+        if "command" in entry:
+            return object.__new__(_command_class(entry["command"]))
+        live = receivers.get(entry["appimage"]["name"]) if receivers else None
+        if live is not None:
+            return live
+        return AppImage(data=AppImageData(**entry["appimage"]))
+
+    # Create every object first so references can point at any of them
+    objects = [create(entry) for entry in record["objects"]]
+
+    def decode(value: Any) -> Any:
+        if isinstance(value, list):
+            return [decode(item) for item in value]
+        if isinstance(value, dict):
+            if "$ref" in value:
+                return objects[value["$ref"]]
+            return {decode(key): decode(item) for key, item in value["$dict"]}
+        return value
+
+    for obj, entry in zip(objects, record["objects"], strict=True):
+        if "command" in entry:
+            vars(obj).update(
+                {key: decode(item) for key, item in entry["state"].items()}
+            )
+    return objects[record["root"]]
+
+
+def _receivers_of(command: Command) -> List[AppImage]:
+    """List the AppImages a command, or any command inside it, acts on.
+
+    Args:
+        command: The command
+
+    Returns:
+        List[AppImage]: The AppImages, each listed once
+    """
+    receivers: List[AppImage] = []
+    seen: Set[int] = set()
+    pending: List[Any] = [command]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (Command, AppImage)):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if isinstance(value, AppImage):
+                receivers.append(value)
+            else:
+                pending.extend(vars(value).values())
+        elif isinstance(value, dict):
+            pending.extend(value.keys())
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+    return receivers
+
+
+class CommandJournal:
+    """Append-only JSONL write-ahead journal of command history events.
+
+    Every event is one line, {"seq": n, "op": ..., ...}:
+
+        begin   a command is about to execute (with its encoded state)
+        commit  it executed successfully (with its state afterwards); a commit
+                without a txn is its own transaction, for a command that was
+                only recorded after it executed
+        abort   it failed
+        undo    it was undone (with its state afterwards)
+        redo    it was executed again (with its state afterwards)
+        clear   the history was cleared
+
+    Appends only go to the file's buffer. sync() makes them durable with a
+    group commit: the first caller fsyncs everything written so far while
+    concurrent callers wait for that fsync instead of issuing their own.
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the journal.
+
+        Args:
+            path: Path to the journal file
+        """
+        self.path = path
+        journal_dir = os.path.dirname(path)
+        if journal_dir:
+            os.makedirs(journal_dir, exist_ok=True)
+
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._synced_seq = 0
+        self._syncing = False
+
+        self._truncate_torn_tail()
+        self._writer = open(path, "ab")
+        self._reader = open(path, "rb")
+
+    def _truncate_torn_tail(self) -> None:
+        """Drop a partially written last line left by a crash."""
+        if not os.path.exists(self.path):
+            return
+        valid = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                valid += len(line)
+                self._seq = json.loads(line)["seq"]
+        if valid != os.path.getsize(self.path):
+            print(f"Warning: truncating torn journal record at offset {valid}")
+            os.truncate(self.path, valid)
+        self._synced_seq = self._seq
+
+    def append(self, op: str, **fields: Any) -> Tuple[int, int]:
+        """Append an event to the journal buffer.
+
+        Args:
+            op: The event type
+            **fields: Event data
+
+        Returns:
+            Tuple[int, int]: Sequence number and byte offset of the event
+        """
+        with self._cond:
+            self._seq += 1
+            line = json.dumps({"seq": self._seq, "op": op, **fields}) + "\n"
+            offset = self._writer.tell()
+            self._writer.write(line.encode())
+            return self._seq, offset
+
+    def sync(self, seq: Optional[int] = None) -> None:
+        """Block until the journal is durable up to seq (default: everything).
+
+        Args:
+            seq: Sequence number that must reach the disk
+        """
+        with self._cond:
+            if seq is None:
+                seq = self._seq
+            while self._synced_seq < seq and self._syncing:
+                # Another thread's fsync may cover us; wait and re-check
+                self._cond.wait()
+            if self._synced_seq >= seq:
+                return
+
+            self._syncing = True
+            target = self._seq
+            self._writer.flush()
+
+        synced = False
+        try:
+            os.fsync(self._writer.fileno())
+            synced = True
+        finally:
+            with self._cond:
+                self._syncing = False
+                if synced:
+                    self._synced_seq = max(self._synced_seq, target)
+                self._cond.notify_all()
+
+    def read_at(self, offset: int) -> Dict[str, Any]:
+        """Read the event stored at a byte offset.
+
+        Args:
+            offset: Offset returned by append() or replay()
+
+        Returns:
+            Dict[str, Any]: The event
+        """
+        with self._cond:
+            self._writer.flush()
+            self._reader.seek(offset)
+            return json.loads(self._reader.readline())
+
+    def replay(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Iterate over all events in order.
+
+        Yields:
+            Tuple[int, Dict[str, Any]]: Byte offset and event
+        """
+        with self._cond:
+            self._writer.flush()
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                yield offset, json.loads(line)
+                offset += len(line)
+
+    def close(self) -> None:
+        """Make everything durable and close the journal."""
+        self.sync()
+        self._writer.close()
+        self._reader.close()
+
+
 # Command History - keeps track of executed commands
 class CommandHistory:
     """Maintains a history of executed commands for undo operations.
@@ -540,12 +1297,158 @@ class CommandHistory:
     - Track what operations have been performed
     - Undo operations in reverse order
     - Potentially persist operations for audit or recovery
+
+    With a journal_path, every change is written ahead to a CommandJournal,
+    which doubles as an audit log. On startup the journal is replayed, and
+    commands that began but never committed (e.g. because of a crash) are
+    executed again with recovery="replay". With recovery="undo" they are
+    only marked aborted: the journal holds their state from before they
+    executed, so whatever they did before the crash can't be undone from it.
+
+    max_in_memory bounds how many history entries are kept as objects. Older
+    entries stay in the journal only and are loaded back when undo reaches
+    them; without a journal they are dropped. The AppImages they act on are
+    remembered (weakly) by name, so a command loaded back from the journal
+    undoes its changes on the same live objects as the rest of the program.
     """
 
-    def __init__(self):
-        """Initialize an empty command history."""
+    def __init__(
+        self,
+        journal_path: Optional[str] = None,
+        max_in_memory: Optional[int] = None,
+        recovery: str = "undo",
+    ):
+        """Initialize the command history.
+
+        Args:
+            journal_path: Path of the journal file (in-memory only if None)
+            max_in_memory: Maximum number of history entries kept in memory
+            recovery: "undo" (abort) or "replay" commands left incomplete by
+                a crash
+        """
         self.history: List[Command] = []
         self.undone: List[Command] = []  # For potential redo functionality
+        self.max_in_memory = max_in_memory
+
+        self.journal = CommandJournal(journal_path) if journal_path else None
+        # Command -> (transaction id, offset of its latest journaled state)
+        self._entries: Dict[Command, Tuple[int, int]] = {}
+        # Older history entries that only live in the journal, oldest first
+        self._paged: List[Tuple[int, int]] = []
+        # Live AppImages acted on by paged-out entries, by name
+        self._receivers: "weakref.WeakValueDictionary[str, AppImage]" = (
+            weakref.WeakValueDictionary()
+        )
+
+        if self.journal:
+            self._recover(recovery)
+
+    @property
+    def size(self) -> int:
+        """Number of history entries, including those paged out to the journal."""
+        return len(self._paged) + len(self.history)
+
+    def _log(self, op: str, txn: int, command: Command) -> int:
+        """Durably journal an event that records a command's current state.
+
+        Args:
+            op: The event type
+            txn: The command's transaction id
+            command: The command
+
+        Returns:
+            int: Byte offset of the event
+        """
+        seq, offset = self.journal.append(op, txn=txn, command=encode_command(command))
+        self.journal.sync(seq)
+        return offset
+
+    def _push(self, command: Command, entry: Optional[Tuple[int, int]]) -> None:
+        """Append a command to the history, paging out the oldest if needed.
+
+        Args:
+            command: The command
+            entry: Its transaction id and state offset, if journaled
+        """
+        self.history.append(command)
+        if entry:
+            self._entries[command] = entry
+
+        while self.max_in_memory is not None and len(self.history) > self.max_in_memory:
+            oldest = self.history.pop(0)
+            entry = self._entries.pop(oldest, None)
+            if entry:
+                self._paged.append(entry)
+                for receiver in _receivers_of(oldest):
+                    self._receivers[receiver.name] = receiver
+
+    def _pop(self) -> Optional[Command]:
+        """Take the most recent command off the history.
+
+        Returns:
+            Optional[Command]: The command, loaded from the journal if it was
+            paged out, or None if the history is empty
+        """
+        if self.history:
+            return self.history.pop()
+        if not self._paged:
+            return None
+
+        txn, offset = self._paged.pop()
+        command = decode_command(
+            self.journal.read_at(offset)["command"], self._receivers
+        )
+        self._entries[command] = (txn, offset)
+        return command
+
+    def begin(self, command: Command) -> Optional[int]:
+        """Journal that a command is about to execute.
+
+        Args:
+            command: The command about to execute
+
+        Returns:
+            Optional[int]: Transaction id to pass to commit() or abort()
+        """
+        if not self.journal:
+            return None
+        seq, _ = self.journal.append("begin", command=encode_command(command))
+        self.journal.sync(seq)
+        return seq
+
+    def commit(self, txn: Optional[int], command: Command) -> None:
+        """Add a command to the history after it executed successfully.
+
+        Args:
+            txn: Transaction id returned by begin()
+            command: The command that was executed
+        """
+        entry = None
+        if self.journal:
+            entry = (txn, self._log("commit", txn, command))
+        self._committed(command, entry)
+
+    def _committed(self, command: Command, entry: Optional[Tuple[int, int]]) -> None:
+        """Add a committed command to the history and drop the redo history.
+
+        Args:
+            command: The command
+            entry: Its transaction id and state offset, if journaled
+        """
+        self._push(command, entry)
+        for undone in self.undone:
+            self._entries.pop(undone, None)
+        self.undone = []  # Clear redo history
+
+    def abort(self, txn: Optional[int]) -> None:
+        """Journal that a command failed to execute.
+
+        Args:
+            txn: Transaction id returned by begin()
+        """
+        if self.journal:
+            seq, _ = self.journal.append("abort", txn=txn)
+            self.journal.sync(seq)
 
     def add(self, command: Command):
         """Add a command to the history after execution.
@@ -553,8 +1456,14 @@ class CommandHistory:
         Args:
             command: The command that was executed
         """
-        self.history.append(command)
-        self.undone = []  # Clear redo history
+        if not self.journal:
+            self._committed(command, None)
+            return
+        # It already ran, so there's nothing to write ahead: one commit record
+        # that is its own transaction costs a single fsync
+        seq, offset = self.journal.append("commit", command=encode_command(command))
+        self.journal.sync(seq)
+        self._committed(command, (seq, offset))
 
     def undo_last(self) -> bool:
         """Undo the last executed command.
@@ -562,19 +1471,23 @@ class CommandHistory:
         Returns:
             bool: True if undo was successful
         """
-        if not self.history:
+        command = self._pop()
+        if command is None:
             print("Nothing to undo")
             return False
 
-        command = self.history.pop()
         print(f"Undoing: {command.description}")
 
         success = command.undo()
+        entry = self._entries.pop(command, None)
         if success:
+            if entry:
+                entry = (entry[0], self._log("undo", entry[0], command))
+                self._entries[command] = entry
             self.undone.append(command)
         else:
             # If undo failed, put the command back in history
-            self.history.append(command)
+            self._push(command, entry)
 
         return success
 
@@ -592,23 +1505,98 @@ class CommandHistory:
         print(f"Redoing: {command.description}")
 
         result = command.execute()
-        self.history.append(command)
+        entry = self._entries.pop(command, None)
+        if entry:
+            entry = (entry[0], self._log("redo", entry[0], command))
+        self._push(command, entry)
 
         return result
 
     def clear(self):
         """Clear the command history."""
+        if self.journal:
+            self.journal.sync(self.journal.append("clear")[0])
         self.history = []
         self.undone = []
+        self._entries.clear()
+        self._paged.clear()
+
+    def close(self) -> None:
+        """Close the journal, if there is one."""
+        if self.journal:
+            self.journal.close()
+
+    def _recover(self, recovery: str) -> None:
+        """Rebuild the history from the journal and resolve incomplete commands.
+
+        Args:
+            recovery: "undo" (abort) or "replay" commands that never committed
+        """
+        states: Dict[int, int] = {}  # txn -> offset of its latest state
+        incomplete: Dict[int, int] = {}  # txn -> offset of its begin event
+        history: List[int] = []
+        undone: List[int] = []
+
+        for offset, event in self.journal.replay():
+            op = event["op"]
+            if op == "begin":
+                incomplete[event["seq"]] = offset
+            elif op == "clear":
+                history.clear()
+                undone.clear()
+                states.clear()
+            elif op == "abort":
+                incomplete.pop(event["txn"], None)
+            else:
+                txn = event.get("txn", event["seq"])
+                incomplete.pop(txn, None)
+                states[txn] = offset
+                if op == "commit":
+                    history.append(txn)
+                    undone.clear()
+                elif op == "undo":
+                    history.remove(txn)
+                    undone.append(txn)
+                elif op == "redo":
+                    undone.remove(txn)
+                    history.append(txn)
+
+        for txn in history:
+            self._push(
+                decode_command(self.journal.read_at(states[txn])["command"]),
+                (txn, states[txn]),
+            )
+        for txn in undone:
+            command = decode_command(self.journal.read_at(states[txn])["command"])
+            self._entries[command] = (txn, states[txn])
+            self.undone.append(command)
+
+        for txn, offset in incomplete.items():
+            command = decode_command(self.journal.read_at(offset)["command"])
+            if recovery == "replay":
+                print(f"Recovery: replaying {command.description}")
+                try:
+                    command.execute()
+                    self.commit(txn, command)
+                    continue
+                except Exception as e:
+                    print(f"Error recovering {command.description}: {e}")
+            else:
+                # Only its state from before it executed was journaled, which
+                # has nothing to undo, so partial effects are left in place
+                print(f"Recovery: aborting {command.description}")
+            self.abort(txn)
 
     def print_history(self):
         """Print the command history."""
         print("\nCommand History:")
-        if not self.history:
+        if not self.size:
             print("  (empty)")
-        else:
-            for i, command in enumerate(self.history, 1):
-                print(f"  {i}. {command.description}")
+            return
+        if self._paged:
+            print(f"  ({len(self._paged)} older commands in the journal)")
+        for i, command in enumerate(self.history, len(self._paged) + 1):
+            print(f"  {i}. {command.description}")
 
 
 # Command Invoker - responsible for executing commands
@@ -627,27 +1615,175 @@ class CommandInvoker:
 
     By separating the invoker from both the commands and their receivers,
     the system achieves better decoupling and flexibility.
+
+    Equivalent commands (same coalesce_key, e.g. two downloads of the same
+    AppImage version) are executed once: a request arriving while an
+    equivalent command runs waits for it and shares its result or error,
+    and with memo_seconds > 0 successful results are reused for that long.
+    Only the command that actually ran is recorded in the history, and
+    undoing or redoing anything drops the memoized results.
     """
 
-    def __init__(self):
-        """Initialize with an empty command history."""
-        self.history = CommandHistory()
+    def __init__(
+        self, history: Optional[CommandHistory] = None, memo_seconds: float = 0.0
+    ):
+        """Initialize with a command history.
+
+        Args:
+            history: History to record commands in (defaults to an empty
+                in-memory one)
+            memo_seconds: How long results of coalescable commands are reused
+        """
+        self.history = history or CommandHistory()
         self.commands_executed = 0
+        self.memo_seconds = memo_seconds
+        self.commands_coalesced = 0
+        self.memo_hits = 0
+
+        # Guards the single-flight bookkeeping below
+        self._coalesce_lock = threading.Lock()
+        # coalesce_key -> future of the running execution
+        self._in_flight: Dict[Hashable, Future] = {}
+        # coalesce_key -> (expires_at, finished future), oldest first
+        self._memo: "OrderedDict[Hashable, Tuple[float, Future]]" = OrderedDict()
+
+    def _join(
+        self, command: Command
+    ) -> Tuple[Optional[Future], bool, Optional[Hashable]]:
+        """Find an execution of an equivalent command, or claim a new one.
+
+        Args:
+            command: The command about to be executed
+
+        Returns:
+            Tuple[Optional[Future], bool, Optional[Hashable]]: The future
+            carrying the result (None if the command can't be coalesced),
+            whether the caller has to execute the command and settle that
+            future, and the coalesce key the future is registered under
+        """
+        # Read the key once: it may change while the command runs (e.g. an
+        # update of the same AppImage changes its version)
+        key = command.coalesce_key
+        if key is None:
+            return None, True, None
+
+        with self._coalesce_lock:
+            now = time.monotonic()
+            while self._memo and next(iter(self._memo.values()))[0] <= now:
+                self._memo.popitem(last=False)
+
+            memo = self._memo.get(key)
+            if memo is not None:
+                self.memo_hits += 1
+                self.commands_coalesced += 1
+                return memo[1], False, key
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.commands_coalesced += 1
+                return future, False, key
+
+            future = self._in_flight[key] = Future()
+            return future, True, key
+
+    def _settle(
+        self,
+        key: Optional[Hashable],
+        future: Optional[Future],
+        result: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Publish the outcome of a claimed execution to everyone waiting on it.
+
+        Args:
+            key: The coalesce key returned by _join()
+            future: The future returned by _join(), if any
+            result: The command's result
+            error: The error the command raised, if it failed
+        """
+        if future is None:
+            return
+
+        try:
+            with self._coalesce_lock:
+                self._in_flight.pop(key, None)
+                if error is None and self.memo_seconds > 0:
+                    self._memo[key] = (time.monotonic() + self.memo_seconds, future)
+        finally:
+            # Waiters must never be left blocked on an unsettled future
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def clear_memo(self) -> None:
+        """Forget all memoized results."""
+        with self._coalesce_lock:
+            self._memo.clear()
 
     def execute_command(self, command: Command) -> Any:
         """Execute a command and add it to the history.
 
+        If an equivalent command is running or was memoized, its result is
+        returned instead of executing the command again.
+
         Args:
             command: The command to execute
 
         Returns:
             Any: The result of the command execution
         """
-        print(f"Executing: {command.description}")
-        result = command.execute()
-        self.history.add(command)
-        self.commands_executed += 1
-        return result
+        future, leader, key = self._join(command)
+        if not leader:
+            print(f"Coalesced: {command.description}")
+            return future.result()
+
+        result = None
+        error: Optional[BaseException] = None
+        try:
+            print(f"Executing: {command.description}")
+            # Write ahead, so a crash mid-command is recovered on the next start
+            txn = self.history.begin(command)
+            try:
+                result = command.execute()
+            except BaseException:
+                self.history.abort(txn)
+                raise
+            self.history.commit(txn, command)
+            self.commands_executed += 1
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._settle(key, future, result, error)
+
+    def execute_parallel(
+        self,
+        commands: List[Command],
+        dependencies: Optional[Dict[Command, Iterable[Command]]] = None,
+        max_workers: int = 4,
+        description: Optional[str] = None,
+    ) -> List[Any]:
+        """Execute independent commands concurrently as one undoable batch.
+
+        Args:
+            commands: The commands to execute
+            dependencies: Command -> commands that must finish before it starts
+                (defaults to no dependencies, so everything runs concurrently)
+            max_workers: Maximum number of commands running at once
+            description: Description of the batch in the history
+
+        Returns:
+            List[Any]: Results from all commands, in the order given
+        """
+        batch = CompositeCommand(
+            commands,
+            description or f"Run {len(commands)} commands in parallel",
+            dependencies=dependencies or {},
+            max_workers=max_workers,
+        )
+        return self.execute_command(batch)
 
     def undo_last(self) -> bool:
         """Undo the last executed command.
@@ -655,6 +1791,8 @@ class CommandInvoker:
         Returns:
             bool: True if undo was successful
         """
+        # The undone command's memoized result (e.g. a file path) is stale now
+        self.clear_memo()
         return self.history.undo_last()
 
     def redo_last(self) -> Any:
@@ -663,6 +1801,7 @@ class CommandInvoker:
         Returns:
             Any: Result of the redone command
         """
+        self.clear_memo()
         return self.history.redo_last()
 
     def print_history(self):
@@ -677,11 +1816,197 @@ class CommandInvoker:
         """
         return {
             "commands_executed": self.commands_executed,
-            "history_size": len(self.history.history),
+            "commands_coalesced": self.commands_coalesced,
+            "memo_hits": self.memo_hits,
+            "history_size": self.history.size,
             "undone_size": len(self.history.undone),
         }
 
 
+class AsyncCommandInvoker(CommandInvoker):
+    """An invoker that runs commands on an asyncio event loop.
+
+    Async commands (and composites) are awaited on the loop and blocking
+    commands run in worker threads, with at most max_concurrency commands
+    running at once. An update run over many AppImages therefore overlaps
+    its I/O without one thread per command.
+
+    The history is shared with the synchronous API, so commands executed
+    here can be undone with undo_last_async().
+    """
+
+    def __init__(
+        self,
+        history: Optional[CommandHistory] = None,
+        max_concurrency: int = 8,
+        memo_seconds: float = 0.0,
+    ):
+        """Initialize with a command history and a concurrency limit.
+
+        Args:
+            history: History to record commands in
+            max_concurrency: Maximum number of commands running at once
+            memo_seconds: How long results of coalescable commands are reused
+        """
+        super().__init__(history, memo_seconds)
+        self.max_concurrency = max_concurrency
+        self.commands_cancelled = 0
+
+        # asyncio primitives belong to one loop, so the semaphore is
+        # recreated whenever the invoker is used from a new one
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Dict[Command, "asyncio.Task[Any]"] = {}
+        # Runs that coalesced callers share, referenced until they finish
+        self._shared_tasks: Set["asyncio.Task[Any]"] = set()
+
+    async def execute_command_async(self, command: Command) -> Any:
+        """Execute a command once a concurrency slot is free and record it.
+
+        Args:
+            command: The command to execute
+
+        Returns:
+            Any: The result of the command execution
+        """
+        future, leader, key = self._join(command)
+        if not leader:
+            print(f"Coalesced: {command.description}")
+            # Shielded so cancelling this caller doesn't cancel the shared run
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        if future is None:
+            return await self._execute_async(command)
+
+        # Others may join this run, so it gets its own task: cancelling the
+        # caller that started it must not cancel it for everyone else
+        task = asyncio.ensure_future(self._execute_async(command, key, future))
+        self._shared_tasks.add(task)
+        task.add_done_callback(self._forget_shared_task)
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _forget_shared_task(self, task: "asyncio.Task[Any]") -> None:
+        """Drop a finished shared run, whose outcome went to its future."""
+        self._shared_tasks.discard(task)
+        if not task.cancelled():
+            # Already delivered through the future; avoids "never retrieved"
+            task.exception()
+
+    async def _execute_async(
+        self,
+        command: Command,
+        key: Optional[Hashable] = None,
+        future: Optional[Future] = None,
+    ) -> Any:
+        """Execute a command in a concurrency slot, record it and settle its future.
+
+        Args:
+            command: The command to execute
+            key: The coalesce key returned by _join(), if any
+            future: The future returned by _join(), if any
+
+        Returns:
+            Any: The result of the command execution
+        """
+        try:
+            async with self._semaphore:
+                print(f"Executing: {command.description}")
+                txn = self.history.begin(command)
+                task = asyncio.ensure_future(run_command_async(command))
+                self._tasks[command] = task
+                try:
+                    result = await task
+                except BaseException as e:
+                    self.history.abort(txn)
+                    if isinstance(e, asyncio.CancelledError):
+                        print(f"Cancelled: {command.description}")
+                        self.commands_cancelled += 1
+                    raise
+                finally:
+                    del self._tasks[command]
+
+                self.history.commit(txn, command)
+                self.commands_executed += 1
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self._settle(key, future, result)
+        return result
+
+    async def execute_many_async(
+        self, commands: Iterable[Command], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Execute several commands concurrently, each recorded on its own.
+
+        Args:
+            commands: The commands to execute
+            return_exceptions: Return errors in the results instead of raising
+                the first one
+
+        Returns:
+            List[Any]: Results from all commands, in the order given
+        """
+        return await asyncio.gather(
+            *(self.execute_command_async(command) for command in commands),
+            return_exceptions=return_exceptions,
+        )
+
+    def cancel(self, command: Command) -> bool:
+        """Cancel a command that is waiting for a slot or running.
+
+        Must be called from the thread running the invoker's event loop. A
+        blocking command already running in a thread finishes first and is
+        then undone, so a cancelled command never stays applied.
+
+        Args:
+            command: The command to cancel
+
+        Returns:
+            bool: True if the command was asked to stop
+        """
+        cancelled = False
+        if isinstance(command, AsyncCommand):
+            command.cancel()
+            cancelled = True
+        task = self._tasks.get(command)
+        if task is not None:
+            cancelled = task.cancel() or cancelled
+        return cancelled
+
+    async def undo_last_async(self) -> bool:
+        """Undo the last executed command without blocking the event loop.
+
+        Returns:
+            bool: True if undo was successful
+        """
+        # Async commands undo themselves with asyncio.run(), which needs a
+        # thread without a running loop
+        return await asyncio.to_thread(self.undo_last)
+
+    async def redo_last_async(self) -> Any:
+        """Redo the last undone command without blocking the event loop.
+
+        Returns:
+            Any: Result of the redone command
+        """
+        return await asyncio.to_thread(self.redo_last)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about command execution.
+
+        Returns:
+            Dict[str, Any]: Execution statistics
+        """
+        stats = super().get_stats()
+        stats["commands_cancelled"] = self.commands_cancelled
+        return stats
+
+
 def main():
     """Example of the Command Design Pattern in action.
 
@@ -793,6 +2118,129 @@ def main():
     remove_cmd = RemoveCommand(github_image, file_path)
     invoker.execute_command(remove_cmd)
 
+    # 9. Download and install several AppImages concurrently
+    print("\n9. Downloading and installing ten AppImages in parallel...")
+    commands = []
+    dependencies = {}
+    for i in range(10):
+        app_image = AppImage(
+            data=AppImageData(
+                name=f"parallel-app-{i}",
+                arch_keyword="x86_64",
+                download_url=f"https://example.com/parallel-app-{i}.AppImage",
+                sha_download_url=f"https://example.com/parallel-app-{i}.sha256",
+                version="1.0",
+                display_name=f"Parallel App {i}",
+                sha_file_name=f"parallel-app-{i}.sha256",
+            )
+        )
+        download = DownloadCommand(app_image, download_dir)
+        install = InstallCommand(
+            app_image, f"{download_dir}/{app_image.name}-1.0.AppImage"
+        )
+        commands += [download, install]
+        # Each install only waits for its own download
+        dependencies[install] = [download]
+
+    start = time.perf_counter()
+    invoker.execute_parallel(
+        commands, dependencies, max_workers=10, description="Install ten AppImages"
+    )
+    print(f"Installed ten AppImages in {time.perf_counter() - start:.2f}s")
+
+    # 10. Journal the history so it survives a crash
+    print("\n10. Recovering a journaled command history after a crash...")
+    journal_path = os.path.join(download_dir, "command-history.jsonl")
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+    history = CommandHistory(journal_path, max_in_memory=1)
+    journaled_invoker = CommandInvoker(history)
+    journaled_invoker.execute_command(DownloadCommand(gitlab_image, download_dir))
+    journaled_invoker.execute_command(
+        InstallCommand(gitlab_image, f"{download_dir}/{gitlab_image.name}.AppImage")
+    )
+    # Simulate a crash while an update is running: it began but never committed
+    crashed_cmd = UpdateCommand(
+        gitlab_image, download_dir, "2.0", "https://gitlab.com/owner/repo/v2.0"
+    )
+    history.begin(crashed_cmd)
+    history.close()
+
+    recovered = CommandHistory(journal_path, max_in_memory=1, recovery="replay")
+    recovered.print_history()
+    recovered.undo_last()  # Undo the replayed update
+    recovered.undo_last()  # Undo the install
+    recovered.undo_last()  # Loaded back from the journal: undo the download
+    recovered.close()
+
+    # 11. Update many AppImages concurrently on an event loop
+    print("\n11. Updating twenty AppImages with async commands...")
+    async_invoker = AsyncCommandInvoker(max_concurrency=10)
+    update_cmds = [
+        AsyncUpdateCommand(
+            AppImage(
+                data=AppImageData(
+                    name=f"async-app-{i}",
+                    arch_keyword="x86_64",
+                    download_url=f"https://example.com/async-app-{i}-1.0.AppImage",
+                    sha_download_url=f"https://example.com/async-app-{i}.sha256",
+                    version="1.0",
+                    display_name=f"Async App {i}",
+                    sha_file_name=f"async-app-{i}.sha256",
+                )
+            ),
+            download_dir,
+            "2.0",
+            f"https://example.com/async-app-{i}-2.0.AppImage",
+        )
+        for i in range(20)
+    ]
+    # One update is too slow for its timeout, another gets cancelled
+    update_cmds[0].timeout = 0.05
+    update_cmds[1].cancel()
+
+    # Sync and async commands mixed in one composite
+    mixed_cmd = CompositeCommand(
+        [
+            AsyncDownloadCommand(github_image, download_dir),
+            InstallCommand(github_image, file_path),
+        ],
+        f"Download and Install {github_image.name} (mixed)",
+    )
+
+    async def run_updates():
+        return await async_invoker.execute_many_async(
+            update_cmds + [mixed_cmd], return_exceptions=True
+        )
+
+    start = time.perf_counter()
+    results = asyncio.run(run_updates())
+    failed = [r for r in results if isinstance(r, BaseException)]
+    print(
+        f"Ran {len(results)} commands in {time.perf_counter() - start:.2f}s "
+        f"({len(failed)} timed out or cancelled)"
+    )
+    print(f"Timed out update left {update_cmds[0].app_image.name} at version "
+          f"{update_cmds[0].app_image.version}")
+    print(f"Async Invoker Statistics: {async_invoker.get_stats()}")
+
+    # 12. Coalesce a burst of identical download requests
+    print("\n12. Coalescing five identical download requests...")
+    coalescing_invoker = CommandInvoker(memo_seconds=30.0)
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        paths = list(
+            pool.map(
+                lambda _: coalescing_invoker.execute_command(
+                    DownloadCommand(gitlab_image, download_dir)
+                ),
+                range(5),
+            )
+        )
+    print(f"All requests got {set(paths)}")
+    # A request shortly afterwards is served from the memoized result
+    coalescing_invoker.execute_command(DownloadCommand(gitlab_image, download_dir))
+    print(f"Coalescing Statistics: {coalescing_invoker.get_stats()}")
+
     # Final history and statistics
     print("\nFinal Command History and Statistics:")
     invoker.print_history()
@@ -32,11 +32,57 @@ like logging, caching, validation, and progress tracking to AppImage objects wit
 modifying their core implementation.
 """
 
+import atexit
+import hashlib
+import json
+import mmap
 import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Default location of the persistent download cache
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "appimage-downloads",
+)
+# Read/copy buffer size for cached files
+_COPY_CHUNK_SIZE = 1024 * 1024
+# Linux ioctl that clones a file's extents (reflink) on btrfs, XFS, ...
+_FICLONE = 0x40049409
+# Files at least this large are hashed through mmap instead of reads
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+# Every AppImage is an ELF executable...
+_ELF_MAGIC = b"\x7fELF"
+# ...with "AI" and the AppImage type (1 or 2) at offset 8
+_APPIMAGE_MAGIC_OFFSET = 8
+_APPIMAGE_MAGICS = (b"AI\x01", b"AI\x02")
+# Hex digest length -> hashlib algorithm
+_DIGEST_ALGORITHMS = {64: "sha256", 128: "sha512"}
 
 
 # Reusing AppImageData from previous examples
@@ -229,6 +275,133 @@ class AppImageDecorator(AppImage):
         return self._app_image.verify(file_path)
 
 
+# Background log writer shared by LoggingAppImageDecorator instances
+class BackgroundLogWriter:
+    """Appends log lines to files from a single background thread.
+
+    write() only puts the line on a queue, so logging on the download path
+    costs an enqueue instead of an open(), write() and close(). The writer
+    thread keeps each log file open and flushes them within flush_interval
+    seconds of a write, on flush() and at interpreter exit.
+    """
+
+    def __init__(self, flush_interval: float = 1.0):
+        """Initialize and start the writer thread.
+
+        Args:
+            flush_interval: Maximum seconds a written line stays buffered
+        """
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        # Only touched by the writer thread
+        self._files: Dict[str, TextIO] = {}
+        # Guards _closed, so nothing is queued behind the close message
+        self._state_lock = threading.Lock()
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run, name="appimage-log-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, path: str, line: str) -> None:
+        """Queue a line to be appended to a file.
+
+        Args:
+            path: The log file
+            line: The text to append, including its newline
+        """
+        with self._state_lock:
+            if not self._closed:
+                self._queue.put((path, line))
+                return
+
+        # Too late for the thread (e.g., during shutdown), write directly
+        with open(path, "a") as f:
+            f.write(line)
+
+    def flush(self) -> None:
+        """Block until every line queued so far is written and flushed.
+
+        Returns early if the writer thread stops first; close() writes out
+        everything queued before it.
+        """
+        done = threading.Event()
+        with self._state_lock:
+            if self._closed:
+                return
+            self._queue.put((_FLUSH, done))
+
+        while not done.wait(self.flush_interval):
+            if not self._thread.is_alive():
+                return
+
+    def close(self) -> None:
+        """Write out everything still queued, close the files and stop."""
+        with self._state_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue into the open log files."""
+        dirty = False
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if dirty:
+                    self._flush_files()
+                    dirty = False
+                    last_flush = time.monotonic()
+                continue
+
+            if item is _CLOSE:
+                self._flush_files()
+                for f in self._files.values():
+                    f.close()
+                self._files.clear()
+                return
+
+            if item[0] is _FLUSH:
+                self._flush_files()
+                dirty = False
+                last_flush = time.monotonic()
+                item[1].set()
+                continue
+
+            path, line = item
+            try:
+                if path not in self._files:
+                    self._files[path] = open(path, "a")
+                self._files[path].write(line)
+                dirty = True
+            except OSError as e:
+                print(f"Error writing log {path}: {e}", file=sys.stderr)
+
+            if dirty and time.monotonic() - last_flush >= self.flush_interval:
+                self._flush_files()
+                dirty = False
+                last_flush = time.monotonic()
+
+    def _flush_files(self) -> None:
+        """Flush every open log file."""
+        for path, f in self._files.items():
+            try:
+                f.flush()
+            except OSError as e:
+                print(f"Error flushing log {path}: {e}", file=sys.stderr)
+
+
+# Control messages for the BackgroundLogWriter queue
+_FLUSH = object()
+_CLOSE = object()
+
+
 # Concrete Decorator implementations
 class LoggingAppImageDecorator(AppImageDecorator):
     """Decorator that adds logging to AppImage operations.
@@ -239,17 +412,45 @@ class LoggingAppImageDecorator(AppImageDecorator):
 
     By extending AppImageDecorator, it inherits the ability to
     wrap any AppImage component while maintaining the AppImage interface.
+
+    File logging goes through a BackgroundLogWriter, shared by all
+    instances unless one is passed in, so logging never blocks on disk I/O.
     """
 
-    def __init__(self, app_image: AppImage, log_file: str = None):
+    # Writer shared by instances that aren't given one, created on first use
+    _shared_writer: Optional[BackgroundLogWriter] = None
+    _shared_writer_lock = threading.Lock()
+
+    def __init__(
+        self,
+        app_image: AppImage,
+        log_file: str = None,
+        writer: Optional[BackgroundLogWriter] = None,
+    ):
         """Initialize with component and optional log file.
 
         Args:
             app_image: The AppImage component to wrap
             log_file: File path for logs (defaults to console logging)
+            writer: Writer for file logs (defaults to the shared one)
         """
         super().__init__(app_image)
         self.log_file = log_file
+        self.writer = writer
+        if self.log_file and self.writer is None:
+            self.writer = self.get_shared_writer()
+
+    @classmethod
+    def get_shared_writer(cls) -> BackgroundLogWriter:
+        """Get the writer shared by all instances, starting it if needed.
+
+        Returns:
+            BackgroundLogWriter: The shared writer
+        """
+        with cls._shared_writer_lock:
+            if LoggingAppImageDecorator._shared_writer is None:
+                LoggingAppImageDecorator._shared_writer = BackgroundLogWriter()
+            return LoggingAppImageDecorator._shared_writer
 
     def _log(self, message: str):
         """Log a message to the configured destination.
@@ -261,8 +462,7 @@ class LoggingAppImageDecorator(AppImageDecorator):
         log_entry = f"[{timestamp}] {message}"
 
         if self.log_file:
-            with open(self.log_file, "a") as f:
-                f.write(f"{log_entry}\n")
+            self.writer.write(self.log_file, f"{log_entry}\n")
         else:
             print(f"LOG: {log_entry}")
 
@@ -316,23 +516,298 @@ class LoggingAppImageDecorator(AppImageDecorator):
         return super().get_info()
 
 
+# Persistent download cache used by CachingAppImageDecorator
+class DownloadCache:
+    """Persistent, content-addressed cache of downloaded AppImage files.
+
+    Files are stored under the SHA-256 of their contents, and an index maps
+    each download URL to the digest it produced:
+
+        <cache_dir>/objects/<sha256>   cached file contents
+        <cache_dir>/index.json         {download_url: sha256}
+
+    Objects are published atomically (written to a temp file, then renamed),
+    so a crash never leaves a partial file under a valid digest, and several
+    processes can share the directory. Each object's mtime records when it
+    was last used; once the cache grows past max_bytes, the least recently
+    used objects are evicted.
+
+    Cached files are hardlinked (or reflinked, or at worst copied) into the
+    download directory. Linked files share their contents with the cache, so
+    they must not be modified in place. Eviction and linking hold the same
+    lock (a thread lock plus, where available, an flock on <cache_dir>/.lock),
+    so an object is never evicted while it is being linked.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024**3):
+        """Initialize with the cache directory and size cap.
+
+        Args:
+            cache_dir: Directory holding the cache (created if missing)
+            max_bytes: Total size of cached files before LRU eviction
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._objects_dir = os.path.join(cache_dir, "objects")
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._lock_path = os.path.join(cache_dir, ".lock")
+        self._lock = threading.Lock()
+
+        os.makedirs(self._objects_dir, exist_ok=True)
+        self._index = self._read_index()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the cache lock, shared with other processes where possible.
+
+        Yields:
+            None, while the lock is held
+        """
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self._lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_index(self) -> Dict[str, str]:
+        """Read the URL -> digest index from disk.
+
+        Returns:
+            The index, empty if it doesn't exist or can't be parsed
+        """
+        try:
+            with open(self._index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self) -> None:
+        """Atomically replace the on-disk index with the in-memory one.
+
+        Entries written by other processes since we last read the index are
+        merged in first, so concurrent writers don't drop each other's entries,
+        and entries whose object has been evicted are dropped.
+        """
+        merged = {**self._read_index(), **self._index}
+        # Drop entries whose object has been evicted
+        self._index = {
+            url: digest
+            for url, digest in merged.items()
+            if os.path.exists(self._object_path(digest))
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _object_path(self, digest: str) -> str:
+        """Get the path of the object with the given digest.
+
+        Args:
+            digest: SHA-256 hex digest of the contents
+
+        Returns:
+            Path to the object file
+        """
+        return os.path.join(self._objects_dir, digest)
+
+    def lookup(self, url: str, digest: Optional[str] = None) -> Optional[str]:
+        """Find the cached file for a download URL.
+
+        Args:
+            url: The download URL
+            digest: Expected SHA-256; a cached file with other contents is a miss
+
+        Returns:
+            Path to the cached file, or None on a miss
+        """
+        with self._lock:
+            if digest:
+                # The object store is keyed by digest, so the same contents
+                # downloaded from another URL are a hit too
+                object_path = self._object_path(digest)
+                try:
+                    os.utime(object_path)
+                except FileNotFoundError:
+                    pass
+                else:
+                    self._index[url] = digest
+                    return object_path
+
+            cached_digest = self._index.get(url)
+            if cached_digest is None or (digest and digest != cached_digest):
+                return None
+
+            object_path = self._object_path(cached_digest)
+            try:
+                # Mark as recently used for LRU eviction
+                os.utime(object_path)
+            except FileNotFoundError:
+                # Evicted, possibly by another process
+                del self._index[url]
+                return None
+            return object_path
+
+    def store(self, url: str, file_path: str) -> str:
+        """Publish a downloaded file to the cache.
+
+        Args:
+            url: The URL the file was downloaded from
+            file_path: Path to the downloaded file
+
+        Returns:
+            Path to the cached file
+        """
+        # Hash while copying into a temp file next to the objects, so the
+        # final rename is atomic and the file is only read once
+        sha256 = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self._objects_dir, suffix=".tmp")
+        try:
+            with open(file_path, "rb") as src, os.fdopen(fd, "wb") as dst:
+                while chunk := src.read(_COPY_CHUNK_SIZE):
+                    sha256.update(chunk)
+                    dst.write(chunk)
+                dst.flush()
+                os.fsync(dst.fileno())
+            shutil.copymode(file_path, tmp_path)
+
+            object_path = self._object_path(sha256.hexdigest())
+            os.replace(tmp_path, object_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._locked():
+            self._index[url] = sha256.hexdigest()
+            self._evict(keep=sha256.hexdigest())
+            self._write_index()
+
+        return object_path
+
+    def _evict(self, keep: str) -> None:
+        """Remove least recently used objects until the cache fits max_bytes.
+
+        Args:
+            keep: Digest of the object just stored, which is never evicted
+        """
+        objects = []
+        for entry in os.scandir(self._objects_dir):
+            if entry.name.endswith(".tmp") or entry.name == keep:
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            objects.append((stat.st_mtime, stat.st_size, entry.name))
+
+        total = sum(size for _, size, _ in objects)
+        total += os.path.getsize(self._object_path(keep))
+
+        for _, size, digest in sorted(objects):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._object_path(digest))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def link_into(self, object_path: str, dest_path: str) -> None:
+        """Place a cached file at dest_path without re-downloading it.
+
+        Tries a hardlink first, then a copy-on-write reflink, then falls
+        back to a plain copy (e.g., when the cache is on another filesystem).
+
+        Args:
+            object_path: Path to the cached file
+            dest_path: Where the file should appear
+
+        Raises:
+            FileNotFoundError: If the object was evicted since it was looked up
+        """
+        with self._locked():
+            self._link_into(object_path, dest_path)
+
+    def _link_into(self, object_path: str, dest_path: str) -> None:
+        """Place a cached file at dest_path; the cache lock must be held.
+
+        Args:
+            object_path: Path to the cached file
+            dest_path: Where the file should appear
+        """
+        # Fail before touching dest_path if the object is gone
+        os.stat(object_path)
+        if os.path.lexists(dest_path):
+            if os.path.samefile(object_path, dest_path):
+                return
+            os.remove(dest_path)
+
+        try:
+            os.link(object_path, dest_path)
+            return
+        except OSError:
+            pass
+
+        with open(object_path, "rb") as src, open(dest_path, "wb") as dst:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                    return
+                except OSError:
+                    pass
+            shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+
+
 class CachingAppImageDecorator(AppImageDecorator):
     """Decorator that adds caching to AppImage operations.
 
     This 'Concrete Decorator' adds caching behavior to prevent
     redundant downloads of the same AppImage version. This shows
     how decorators can maintain state to optimize operations.
+
+    Downloads are kept in a persistent DownloadCache keyed by download URL
+    (and optionally the expected digest), so they survive restarts and are
+    shared by every process using the same cache directory.
     """
 
-    # Class-level cache shared across instances
-    _download_cache: Dict[str, str] = {}
+    # Cache shared by instances that aren't given one, created on first use
+    _default_cache: Optional[DownloadCache] = None
+
+    def __init__(
+        self,
+        app_image: AppImage,
+        cache: Optional[DownloadCache] = None,
+        expected_digest: Optional[str] = None,
+    ):
+        """Initialize with component and cache options.
+
+        Args:
+            app_image: The AppImage component to wrap
+            cache: Download cache to use (defaults to one in DEFAULT_CACHE_DIR)
+            expected_digest: SHA-256 a cached file must have to be reused
+        """
+        super().__init__(app_image)
+        if cache is None:
+            if CachingAppImageDecorator._default_cache is None:
+                CachingAppImageDecorator._default_cache = DownloadCache(
+                    DEFAULT_CACHE_DIR
+                )
+            cache = CachingAppImageDecorator._default_cache
+        self.cache = cache
+        self.expected_digest = expected_digest
 
     def download(self, download_dir: str) -> str:
         """Add caching to download process.
 
-        This method checks if the AppImage is already in the cache
-        and returns the cached path if available, otherwise performs
-        the download and caches the result.
+        This method checks if the AppImage is already in the cache and links
+        the cached file into download_dir if available, otherwise performs
+        the download and publishes the result to the cache.
 
         Args:
             download_dir: Directory to download the file to
@@ -340,22 +815,29 @@ class CachingAppImageDecorator(AppImageDecorator):
         Returns:
             str: Path to the downloaded file
         """
-        # Use a cache key that distinguishes different versions
-        cache_key = f"{self.name}-{self.version}"
-
         # Check if this AppImage is already downloaded
-        if cache_key in self._download_cache:
-            cached_path = self._download_cache[cache_key]
-            if os.path.exists(cached_path):
-                print(f"Using cached version of {self.name} at {cached_path}")
-                return cached_path
-
-        # Not in cache or file doesn't exist, perform download
+        cached_path = self.cache.lookup(self.download_url, self.expected_digest)
+        if cached_path:
+            os.makedirs(download_dir, exist_ok=True)
+            file_path = os.path.join(
+                download_dir, f"{self.name}-{self.version}.AppImage"
+            )
+            try:
+                self.cache.link_into(cached_path, file_path)
+            except FileNotFoundError:
+                # Evicted between lookup and link; download it again
+                pass
+            else:
+                print(f"Using cached version of {self.name} at {file_path}")
+                return file_path
+
+        # Not in cache, perform download
         file_path = super().download(download_dir)
 
-        # Cache the result
-        self._download_cache[cache_key] = file_path
-        print(f"Cached {self.name} at {file_path}")
+        # Cache the result, if the download produced a file
+        if os.path.exists(file_path):
+            cached_path = self.cache.store(self.download_url, file_path)
+            print(f"Cached {self.name} at {cached_path}")
 
         return file_path
 
@@ -370,36 +852,136 @@ class CachingAppImageDecorator(AppImageDecorator):
         info = super().get_info()
 
         # Add cache information
-        cache_key = f"{self.name}-{self.version}"
-        info["cached"] = cache_key in self._download_cache
+        cached_path = self.cache.lookup(self.download_url, self.expected_digest)
+        info["cached"] = cached_path is not None
         if info["cached"]:
-            info["cache_path"] = self._download_cache[cache_key]
+            info["cache_path"] = cached_path
 
         return info
 
 
+# Streaming file hashing used by ValidationAppImageDecorator
+def hash_file(file_path: str, algorithm: str = "sha256") -> str:
+    """Hash a file without loading it into memory.
+
+    Large files are mapped with mmap and hashed in one update() call, which
+    lets hashlib release the GIL for the whole file. Smaller files are read
+    into one reused buffer.
+
+    Args:
+        file_path: Path to the file
+        algorithm: hashlib algorithm name (e.g., "sha256" or "sha512")
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    hasher = hashlib.new(algorithm)
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            buffer = bytearray(_COPY_CHUNK_SIZE)
+            view = memoryview(buffer)
+            while n_read := f.readinto(buffer):
+                hasher.update(view[:n_read])
+    return hasher.hexdigest()
+
+
+class _DigestCache:
+    """LRU cache of file digests keyed by the file's identity.
+
+    A key of (path, size, mtime, inode) changes whenever the file is
+    replaced or rewritten, so an unchanged file is never hashed twice.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Number of digests kept before LRU eviction
+        """
+        self.max_entries = max_entries
+        self._digests: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def digest(self, file_path: str, stat: os.stat_result, algorithm: str) -> str:
+        """Get a file's digest, hashing it only if it changed.
+
+        Args:
+            file_path: Path to the file
+            stat: Result of os.stat() on the file
+            algorithm: hashlib algorithm name
+
+        Returns:
+            str: Hex digest of the file contents
+        """
+        key = (
+            os.path.realpath(file_path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
+            algorithm,
+        )
+        with self._lock:
+            digest = self._digests.get(key)
+            if digest is not None:
+                self._digests.move_to_end(key)
+                return digest
+
+        # Hash outside the lock so files are hashed in parallel
+        digest = hash_file(file_path, algorithm)
+
+        # Only remember the digest if the file didn't change while hashing
+        after = os.stat(file_path)
+        if (after.st_size, after.st_mtime_ns, after.st_ino) == key[1:4]:
+            with self._lock:
+                self._digests[key] = digest
+                while len(self._digests) > self.max_entries:
+                    self._digests.popitem(last=False)
+        return digest
+
+
 class ValidationAppImageDecorator(AppImageDecorator):
     """Decorator that adds extended validation to AppImage operations.
 
     This 'Concrete Decorator' enhances the verification process with
     additional validation steps beyond the basic verification.
+
+    Files are checked for the ELF header (and in strict mode the AppImage
+    header and executable bit), and their SHA-256/SHA-512 digest is compared
+    with expected_digest when one is given. Digests are cached by file
+    identity, so verifying an unchanged file again doesn't rehash it.
     """
 
-    def __init__(self, app_image: AppImage, strict_mode: bool = False):
+    # Digest cache shared by all instances
+    _digest_cache = _DigestCache()
+
+    def __init__(
+        self,
+        app_image: AppImage,
+        strict_mode: bool = False,
+        expected_digest: Optional[str] = None,
+    ):
         """Initialize with component and validation options.
 
         Args:
             app_image: The AppImage component to wrap
             strict_mode: Whether to use strict validation rules
+            expected_digest: Hex SHA-256 or SHA-512 the file must match
         """
         super().__init__(app_image)
         self.strict_mode = strict_mode
+        self.expected_digest = expected_digest.lower() if expected_digest else None
+        if expected_digest and len(expected_digest) not in _DIGEST_ALGORITHMS:
+            raise ValueError(f"Not a SHA-256 or SHA-512 digest: {expected_digest}")
 
     def verify(self, file_path: str) -> bool:
         """Add extra validation steps to verification.
 
         This method extends the basic verification with additional
-        checks like file size, permissions, and signature validation.
+        checks like file size, headers, permissions and checksums.
 
         Args:
             file_path: Path to the downloaded file
@@ -414,27 +996,66 @@ class ValidationAppImageDecorator(AppImageDecorator):
         print(f"Performing extended validation for {self.name}...")
 
         # Check if file exists
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             print(f"Error: File {file_path} does not exist")
             return False
 
         # Check file size
-        file_size = os.path.getsize(file_path)
-        if file_size < 1024:  # Just for demonstration
-            print(f"Error: File size too small: {file_size} bytes")
+        if stat.st_size < 1024:  # Just for demonstration
+            print(f"Error: File size too small: {stat.st_size} bytes")
+            return False
+
+        # Check the headers
+        with open(file_path, "rb") as f:
+            header = f.read(16)
+        if not header.startswith(_ELF_MAGIC):
+            print(f"Error: {file_path} is not an ELF executable")
             return False
 
         # Additional checks in strict mode
         if self.strict_mode:
             print(f"Performing strict validation for {self.name}...")
 
-            # Simulate additional checks like executable permission and signature
-            # In a real implementation, these would be actual checks
-            print("Checking executable permissions and signature...")
+            magic = header[_APPIMAGE_MAGIC_OFFSET : _APPIMAGE_MAGIC_OFFSET + 3]
+            if magic not in _APPIMAGE_MAGICS:
+                print(f"Error: {file_path} has no AppImage header")
+                return False
+            if not os.access(file_path, os.X_OK):
+                print(f"Error: {file_path} is not executable")
+                return False
+
+        # Compare the checksum
+        if self.expected_digest:
+            algorithm = _DIGEST_ALGORITHMS[len(self.expected_digest)]
+            digest = self._digest_cache.digest(file_path, stat, algorithm)
+            if digest != self.expected_digest:
+                print(f"Error: {algorithm} mismatch for {file_path}")
+                return False
 
         print(f"Extended validation passed for {self.name}")
         return True
 
+    @staticmethod
+    def verify_many(
+        jobs: Iterable[Tuple[AppImage, str]], max_workers: Optional[int] = None
+    ) -> List[bool]:
+        """Verify many files in parallel.
+
+        hashlib releases the GIL while hashing, so a thread pool verifies
+        several files at once.
+
+        Args:
+            jobs: (AppImage, file path) pairs to verify
+            max_workers: Size of the thread pool (defaults to the executor's)
+
+        Returns:
+            List[bool]: The verification result of each job, in order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda job: job[0].verify(job[1]), jobs))
+
     def get_info(self) -> Dict[str, Any]:
         """Add validation information to info dictionary.
 
@@ -443,6 +1064,8 @@ class ValidationAppImageDecorator(AppImageDecorator):
         """
         info = super().get_info()
         info["validation_level"] = "strict" if self.strict_mode else "standard"
+        if self.expected_digest:
+            info["checksum"] = _DIGEST_ALGORITHMS[len(self.expected_digest)]
         return info
 
 
@@ -481,6 +1104,120 @@ class ProgressAppImageDecorator(AppImageDecorator):
         return file_path
 
 
+# Compiled decorator stacks
+class CompiledAppImage:
+    """A decorator stack resolved once into a single flat object.
+
+    In a stack of decorators, reading an attribute the outermost layer
+    doesn't hold walks __getattr__ through every layer below it, and every
+    call runs through each layer's method, even layers that only forward it.
+    compile_decorators() resolves all of that up front:
+
+    * The common AppImage attributes are stored in slots, and attributes
+      added by individual decorators (e.g. log_file, strict_mode) in one
+      flat dictionary, so reads never walk the chain.
+    * download, verify and get_info each get their own call path that only
+      contains the layers overriding that method. The slots hold the bound
+      method at the head of each path, so calling one costs no extra hop.
+
+    This object exposes the same interface as AppImage, so clients can use
+    it in place of the stack it was compiled from.
+    """
+
+    __slots__ = (
+        "data",
+        "name",
+        "download_url",
+        "version",
+        "display_name",
+        "download",
+        "verify",
+        "get_info",
+        "_attributes",
+    )
+
+    def __getattr__(self, name):
+        """Look up attributes added by individual decorators.
+
+        Only called for names that aren't slots, so the common attributes
+        never get here.
+
+        Args:
+            name: The name of the attribute to access
+
+        Returns:
+            The attribute, as seen from the outermost decorator
+        """
+        try:
+            return self._attributes[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _compose(layers: List[AppImageDecorator], component: AppImage, method: str):
+    """Build a call path for one method that skips pure forwarding layers.
+
+    The overriding layers are cloned so the original stack is left intact,
+    and each clone wraps the next overriding layer directly.
+
+    Args:
+        layers: The decorators, outermost first
+        component: The undecorated AppImage at the bottom of the stack
+        method: Name of the method to compose
+
+    Returns:
+        The bound method at the head of the composed path
+    """
+    forwarding = getattr(AppImageDecorator, method)
+    inner = component
+    for layer in reversed(layers):
+        if getattr(type(layer), method) is forwarding:
+            continue
+        # copy.copy() would probe the half-built clone through __getattr__,
+        # which recurses without _app_image set, so clone by hand
+        clone = object.__new__(type(layer))
+        clone.__dict__.update(vars(layer))
+        clone._app_image = inner
+        inner = clone
+    return getattr(inner, method)
+
+
+def compile_decorators(app_image: AppImage) -> CompiledAppImage:
+    """Resolve a stack of decorators into a single CompiledAppImage.
+
+    Decorators are treated as configured once: changing a layer's attributes
+    after compiling doesn't affect the compiled object. Layers are also cut
+    out of the paths of methods they don't override, so a decorator must not
+    rely on __getattr__ reaching attributes of the layers around it.
+
+    Args:
+        app_image: An AppImage, possibly wrapped with decorators
+
+    Returns:
+        The compiled AppImage
+    """
+    layers = []
+    component = app_image
+    while isinstance(component, AppImageDecorator):
+        layers.append(component)
+        component = component._app_image
+
+    # Flatten attributes innermost first, so outer layers win as they would
+    # through __getattr__
+    attributes = dict(vars(component))
+    for layer in reversed(layers):
+        attributes.update(vars(layer))
+    attributes.pop("_app_image", None)
+
+    compiled = object.__new__(CompiledAppImage)
+    for name in ("data", "name", "download_url", "version", "display_name"):
+        setattr(compiled, name, attributes.pop(name))
+    compiled._attributes = attributes
+    for method in ("download", "verify", "get_info"):
+        setattr(compiled, method, _compose(layers, component, method))
+    return compiled
+
+
 # Example function that creates decorated AppImages
 def create_decorated_appimage(
     name: str,
@@ -493,7 +1230,7 @@ def create_decorated_appimage(
     decoration_flags: Dict[str, bool],
     owner: str = "",
     repo: str = "",
-) -> AppImage:
+) -> Union[AppImage, CompiledAppImage]:
     """Create an AppImage with optional decorators based on flags.
 
     This demonstrates how decorators can be applied conditionally
@@ -508,11 +1245,12 @@ def create_decorated_appimage(
         display_name: Display name
         sha_file_name: Checksum filename
         decoration_flags: Dictionary of flags for each decorator type
+            ("compiled" flattens the result with compile_decorators)
         owner: Repository owner (optional)
         repo: Repository name (optional)
 
     Returns:
-        An AppImage, possibly wrapped with decorators
+        An AppImage, possibly wrapped with decorators or compiled
     """
     # Create the base AppImage
     data = AppImageData(
@@ -543,6 +1281,10 @@ def create_decorated_appimage(
     if decoration_flags.get("progress", False):
         app_image = ProgressAppImageDecorator(app_image)
 
+    # Resolve the stack once if the caller wants the flattened form
+    if decoration_flags.get("compiled", False):
+        return compile_decorators(app_image)
+
     return app_image
 
 
@@ -588,12 +1330,29 @@ def main():
     logging_app.verify("/tmp/appimages/basic-app-1.0.AppImage")
     print(f"Info: {logging_app.get_info()}")
 
+    # File logs are written by a shared background thread
+    print("\nUsing AppImage with logging to a file:")
+    os.makedirs("/tmp/appimages", exist_ok=True)
+    file_logging_app = LoggingAppImageDecorator(
+        basic_app, log_file="/tmp/appimages/decorator.log"
+    )
+    file_logging_app.download("/tmp/appimages")
+    file_logging_app.writer.flush()  # Wait for the lines to reach the file
+    print("Logged to /tmp/appimages/decorator.log")
+
     # Combine multiple decorators
     print("\n3. Combining multiple decorators...")
 
-    # First add logging, then caching
+    # First add logging, then caching. The simulated download doesn't write
+    # a file, so put a placeholder where it would land for the cache to keep
     print("\nUsing AppImage with logging and caching decorators:")
-    logging_caching_app = CachingAppImageDecorator(logging_app)
+    os.makedirs("/tmp/appimages", exist_ok=True)
+    with open("/tmp/appimages/basic-app-1.0.AppImage", "wb") as f:
+        # ELF header with the type 2 AppImage marker at offset 8
+        f.write(b"\x7fELF" + bytes(4) + b"AI\x02" + bytes(4096))
+    os.chmod("/tmp/appimages/basic-app-1.0.AppImage", 0o755)
+    download_cache = DownloadCache("/tmp/appimages/cache", max_bytes=64 * 1024**2)
+    logging_caching_app = CachingAppImageDecorator(logging_app, cache=download_cache)
     logging_caching_app.download("/tmp/appimages")  # Will log and cache
     logging_caching_app.download("/tmp/appimages")  # Will use cache and log
 
@@ -638,6 +1397,12 @@ def main():
     info = decorated_app.get_info()
     print(f"Decorated info: {info}")
 
+    # Flatten a stack when it is used on a hot path
+    print("\n6. Compiling a decorator stack into a single object...")
+    compiled_app = compile_decorators(logging_caching_app)
+    print(f"Compiled {compiled_app.name} (cache: {compiled_app.cache.cache_dir})")
+    compiled_app.download("/tmp/appimages")  # Same behavior, flat call path
+
     print("\n=== DECORATOR PATTERN BENEFITS ===")
     print("* Add responsibilities dynamically at runtime")
     print("* Add multiple responsibilities in different combinations")
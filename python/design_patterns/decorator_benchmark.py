@@ -0,0 +1,121 @@
+"""
+Benchmarks for the decorator.py AppImage decorators.
+
+Run from this directory:
+
+    python decorator_benchmark.py
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from decorator import (
+    AppImage,
+    AppImageData,
+    AppImageDecorator,
+    CachingAppImageDecorator,
+    DownloadCache,
+    LoggingAppImageDecorator,
+    ProgressAppImageDecorator,
+    ValidationAppImageDecorator,
+    compile_decorators,
+)
+
+
+def make_app_image():
+    return AppImage(
+        data=AppImageData(
+            name="bench-app",
+            arch_keyword="x86_64",
+            download_url="https://example.com/bench-app.AppImage",
+            sha_download_url="https://example.com/bench-app.AppImage.sha256",
+            version="1.0",
+            display_name="Bench App",
+            sha_file_name="bench-app.AppImage.sha256",
+        )
+    )
+
+
+def benchmark(label, operation, n_iterations, quiet=False):
+    # Some decorators print; only the dispatch cost is of interest here
+    silence = (
+        contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+    )
+    with silence:
+        start = time.perf_counter()
+        for _ in range(n_iterations):
+            operation()
+        duration = time.perf_counter() - start
+    per_call_ns = duration / n_iterations * 1_000_000_000
+    print(f"    {label}: {per_call_ns:,.0f} ns/op")
+    return duration
+
+
+def compare(label, stack, compiled, operation, n_iterations, quiet=False):
+    print(f"  {label}")
+    chained = benchmark("chain   ", lambda: operation(stack), n_iterations, quiet)
+    flat = benchmark("compiled", lambda: operation(compiled), n_iterations, quiet)
+    print(f"    speedup: {chained / flat:.1f}x")
+
+
+def benchmark_forwarding_stack(n_iterations):
+    print(f"\n4 forwarding-only decorators, {n_iterations} iterations")
+    stack = make_app_image()
+    for _ in range(4):
+        stack = AppImageDecorator(stack)
+    compiled = compile_decorators(stack)
+
+    compare("read name", stack, compiled, lambda app: app.name, n_iterations)
+    compare("get_info()", stack, compiled, lambda app: app.get_info(), n_iterations)
+
+
+def benchmark_real_stack(n_iterations):
+    print(f"\nlogging/caching/validation/progress stack, {n_iterations} iterations")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stack = ProgressAppImageDecorator(
+            ValidationAppImageDecorator(
+                CachingAppImageDecorator(
+                    LoggingAppImageDecorator(make_app_image()),
+                    cache=DownloadCache(os.path.join(tmp_dir, "cache")),
+                )
+            )
+        )
+        compiled = compile_decorators(stack)
+        file_path = os.path.join(tmp_dir, "bench-app-1.0.AppImage")
+
+        compare(
+            "read log_file (3 layers deep)",
+            stack,
+            compiled,
+            lambda app: app.log_file,
+            n_iterations,
+        )
+        compare(
+            "verify()",
+            stack,
+            compiled,
+            lambda app: app.verify(file_path),
+            n_iterations,
+            quiet=True,
+        )
+
+
+def main():
+    benchmark_forwarding_stack(n_iterations=200_000)
+    benchmark_real_stack(n_iterations=20_000)
+
+    # ## Results:
+    #     4 forwarding-only decorators, 200000 iterations
+    #       read name: chain 164 ns/op, compiled 153 ns/op (1.1x)
+    #       get_info(): chain 1,619 ns/op, compiled 643 ns/op (2.5x)
+    #     logging/caching/validation/progress stack, 20000 iterations
+    #       read log_file (3 layers deep):
+    #         chain 3,052 ns/op, compiled 1,139 ns/op (2.7x)
+    #       verify(): chain 15,446 ns/op, compiled 11,286 ns/op (1.4x)
+
+
+if __name__ == "__main__":
+    main()
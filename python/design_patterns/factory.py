@@ -31,10 +31,16 @@ This example shows how to handle app images from different sources (GitHub, GitL
 while maintaining a consistent interface and providing persistence capabilities.
 """
 
+import copy
 import json
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
 
 
 # Common data model shared between AppImage and AppConfig
@@ -75,6 +81,150 @@ class AppImageData:
     repo: str = ""
 
 
+# Mode of newly created config files (owner read/write, world readable).
+# Not derived from the umask: os.umask() can only be queried by setting it,
+# which briefly changes it for every thread in the process
+_NEW_FILE_MODE = 0o644
+
+
+# Config file cache - avoids re-reading unchanged JSON files
+class ConfigCache:
+    """In-process cache of parsed JSON config files.
+
+    Entries are keyed by path and validated against the file's mtime, size
+    and inode on every read, so a file changed by another process (or
+    replaced by an atomic write) is re-read, while an unchanged one costs a
+    single stat() instead of an open and a parse.
+
+    Writes are atomic: data goes to a temporary file in the same directory,
+    is fsynced and then renamed over the target, so readers never see a
+    half-written config. write_many() does this for a whole batch in one
+    pass, with a single directory fsync per directory.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        # path -> ((mtime_ns, size, inode), parsed data)
+        self._entries: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> Tuple[int, int, int]:
+        """Build the validation key of a file from its stat result."""
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def read_json(self, path: str) -> Optional[Any]:
+        """Read a JSON file, from the cache if it hasn't changed.
+
+        Args:
+            path: Path of the JSON file
+
+        Returns:
+            A copy of the parsed data, or None if the file doesn't exist
+
+        Raises:
+            json.JSONDecodeError: If the file isn't valid JSON
+        """
+        try:
+            signature = self._signature(os.stat(path))
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+
+        with open(path, "r") as f:
+            data = json.load(f)
+        with self._lock:
+            self._entries[path] = (signature, data)
+        return copy.deepcopy(data)
+
+    def write_json(self, path: str, data: Any) -> None:
+        """Atomically write a JSON file and cache what was written.
+
+        Args:
+            path: Path of the JSON file
+            data: JSON-serializable data
+        """
+        self.write_many([(path, data)])
+
+    def write_many(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """Atomically write several JSON files in one pass.
+
+        Every file is written and fsynced under a temporary name first, then
+        all of them are renamed into place and each directory is fsynced once.
+        Existing files keep their permissions; new ones are created 0o644.
+
+        Args:
+            items: (path, data) pairs to write
+        """
+        written = []
+        try:
+            for path, data in items:
+                directory = os.path.dirname(path) or "."
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                written.append((path, tmp_path, data))
+                # mkstemp() creates owner-only files; keep the permissions the
+                # config had, or use the usual ones for a new config
+                try:
+                    mode = os.stat(path).st_mode & 0o7777
+                except FileNotFoundError:
+                    mode = _NEW_FILE_MODE
+                os.fchmod(fd, mode)
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+        except BaseException:
+            for _, tmp_path, _ in written:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            raise
+
+        directories = set()
+        for path, tmp_path, data in written:
+            os.replace(tmp_path, path)
+            directories.add(os.path.dirname(path) or ".")
+            with self._lock:
+                self._entries[path] = (
+                    self._signature(os.stat(path)),
+                    copy.deepcopy(data),
+                )
+
+        # Make the renames themselves durable
+        for directory in directories:
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop one cached file, or all of them.
+
+        Args:
+            path: Path to drop (default: everything)
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+
+# Shared by all configs unless one is passed explicitly
+_config_cache = ConfigCache()
+
+
 # Refactored Config classes
 @dataclass
 class GlobalConfig:
@@ -109,14 +259,13 @@ class GlobalConfig:
         if not os.path.exists(config.config_dir):
             os.makedirs(config.config_dir, exist_ok=True)
 
-        # Load existing config if available
-        if os.path.exists(config.config_file):
-            try:
-                with open(config.config_file, "r") as f:
-                    loaded_settings = json.load(f)
-                    config.settings.update(loaded_settings)
-            except json.JSONDecodeError:
-                print(f"Warning: Could not parse {config.config_file}, using defaults")
+        # Load existing config if available (unchanged files come from the cache)
+        try:
+            loaded_settings = _config_cache.read_json(config.config_file)
+            if loaded_settings:
+                config.settings.update(loaded_settings)
+        except json.JSONDecodeError:
+            print(f"Warning: Could not parse {config.config_file}, using defaults")
 
         return config
 
@@ -126,8 +275,7 @@ class GlobalConfig:
         if not os.path.exists(self.config_dir):
             os.makedirs(self.config_dir, exist_ok=True)
 
-        with open(self.config_file, "w") as f:
-            json.dump(self.settings, f, indent=2)
+        _config_cache.write_json(self.config_file, self.settings)
         print(f"Global config saved to {self.config_file}")
 
     def get_setting(self, key, default=None):
@@ -160,32 +308,41 @@ class AppConfig(BaseConfig):
         # Ensure name is consistent
         self.name = self.data.name
 
-    def save(self, config_dir):
-        """Save the app config to a .json file."""
-        app_config_dir = os.path.join(config_dir, "apps")
-        os.makedirs(app_config_dir, exist_ok=True)
+    @staticmethod
+    def file_path(name, config_dir):
+        """Get the path of an app's config file."""
+        return os.path.join(config_dir, "apps", f"{name}.json")
 
-        # Convert to dict for serialization
-        serialized_data = {
+    def to_dict(self):
+        """Convert the app config to a dict for serialization."""
+        return {
             "name": self.name,
             "data": asdict(self.data),
             "app_settings": self.app_settings,
         }
 
-        file_path = os.path.join(app_config_dir, f"{self.name}.json")
-        with open(file_path, "w") as f:
-            json.dump(serialized_data, f, indent=2)
+    def save(self, config_dir):
+        """Save the app config to a .json file."""
+        file_path = self.file_path(self.name, config_dir)
+        _config_cache.write_json(file_path, self.to_dict())
         print(f"App config saved to {file_path}")
 
+    @classmethod
+    def save_many(cls, configs, config_dir):
+        """Save several app configs to .json files in one atomic pass."""
+        configs = list(configs)
+        _config_cache.write_many(
+            (cls.file_path(config.name, config_dir), config.to_dict())
+            for config in configs
+        )
+        print(f"{len(configs)} app configs saved to {os.path.join(config_dir, 'apps')}")
+
     @classmethod
     def load(cls, name, config_dir):
         """Load app config from a .json file."""
-        file_path = os.path.join(config_dir, "apps", f"{name}.json")
-
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                data_dict = json.load(f)
+        data_dict = _config_cache.read_json(cls.file_path(name, config_dir))
 
+        if data_dict is not None:
             # Convert back to AppImageData
             image_data = AppImageData(**data_dict["data"])
             return cls(
@@ -394,6 +551,67 @@ class AppImageFactory:
         return self.create_appimage(data=config.data)
 
 
+# Per-host download limits shared by every AppImage type
+class HostLimiter:
+    """Caps how many downloads run against each host at the same time.
+
+    One limiter is shared by all concrete AppImages, so GitHub and GitLab
+    downloads each get their own budget no matter which product class
+    performs them, and a burst against one forge can't starve the other.
+    """
+
+    def __init__(self, per_host=4, limits=None):
+        """Initialize with the default and per-host limits.
+
+        Args:
+            per_host (int, optional): Concurrent downloads allowed per host. Defaults to 4.
+            limits (dict, optional): Host name -> limit overriding per_host.
+        """
+        self.per_host = per_host
+        self.limits = dict(limits or {})
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url) -> Iterator[None]:
+        """Hold one of the download slots of the URL's host.
+
+        Args:
+            url (str): The URL about to be downloaded
+        """
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(
+                    self.limits.get(host, self.per_host)
+                )
+                self._semaphores[host] = semaphore
+
+        with semaphore:
+            yield
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of downloading one app in AppImageManager.download_many().
+
+    Attributes:
+        name (str): Name of the AppImage
+        appimage (AppImage, optional): The downloaded AppImage, if it succeeded
+        error (Exception, optional): Why the download failed, if it did
+    """
+
+    name: str
+    appimage: Optional["AppImage"] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self):
+        """Whether the download succeeded."""
+        return self.error is None
+
+
 # AppImageManager - using the simplified classes
 @dataclass
 class AppImageManager:
@@ -414,11 +632,29 @@ class AppImageManager:
         factory (AppImageFactory): Factory for creating AppImage objects
         config_factory (ConfigFactory): Factory for creating configuration objects
         global_config (GlobalConfig): Application global configuration
+        host_limiter (HostLimiter): Per-host download limits shared by all downloads
     """
 
     factory: AppImageFactory
     config_factory: ConfigFactory
     global_config: GlobalConfig
+    host_limiter: HostLimiter = field(default_factory=HostLimiter)
+
+    def _download(self, data):
+        """Create an AppImage through the factory and download it.
+
+        Args:
+            data (AppImageData): The data needed to create the AppImage
+
+        Returns:
+            AppImage: The downloaded AppImage
+        """
+        # Create and download appimage - notice how we don't care about the concrete type!
+        appimage = self.factory.create_appimage(data)
+        download_dir = self.global_config.get_setting("download_dir")
+        with self.host_limiter.slot(appimage.download_url):
+            appimage.download(download_dir)
+        return appimage
 
     def download_appimage(
         self,
@@ -466,11 +702,33 @@ class AppImageManager:
             repo=repo,
         )
 
-        # Create and download appimage - notice how we don't care about the concrete type!
-        appimage = self.factory.create_appimage(data)
-        download_dir = self.global_config.get_setting("download_dir")
-        appimage.download(download_dir)
-        return appimage
+        return self._download(data)
+
+    def download_many(self, datas, max_workers=16):
+        """Download several AppImages concurrently.
+
+        Downloads run on up to max_workers threads, while the host limiter
+        keeps each host (GitHub, GitLab, ...) within its own concurrency limit.
+        One failing download doesn't stop the others.
+
+        Args:
+            datas (Iterable[AppImageData]): The AppImages to download
+            max_workers (int, optional): Maximum downloads running at once.
+                Defaults to 16.
+
+        Returns:
+            List[DownloadResult]: One result per app, in the order given
+        """
+
+        def download(data):
+            try:
+                return DownloadResult(name=data.name, appimage=self._download(data))
+            except Exception as e:
+                print(f"Failed to download {data.name}: {e}")
+                return DownloadResult(name=data.name, error=e)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(download, datas))
 
     def save_appimage_config(self, appimage, app_settings=None):
         """Save AppImage configuration with optional settings.
@@ -509,6 +767,57 @@ class AppImageManager:
             return self.factory.create_from_config(config)
         return None
 
+    def save_appimage_configs(self, appimages, app_settings=None):
+        """Save the configurations of several AppImages in one batch.
+
+        All config files are written atomically in a single pass, instead of
+        one open/write/close round trip per app.
+
+        Args:
+            appimages (Iterable[AppImage]): The AppImages to save configuration for
+            app_settings (dict, optional): App name -> application-specific
+                settings. Defaults to None.
+
+        Returns:
+            List[AppConfig]: The saved configuration objects
+        """
+        app_settings = app_settings or {}
+        configs = []
+        for appimage in appimages:
+            config = appimage.to_config()
+            if app_settings.get(appimage.name):
+                config.app_settings = app_settings[appimage.name]
+            configs.append(config)
+
+        AppConfig.save_many(configs, self.global_config.config_dir)
+        return configs
+
+    def load_all_configs(self, max_workers=8):
+        """Load every saved AppImage configuration in parallel.
+
+        Args:
+            max_workers (int, optional): Number of configs read at once. Defaults to 8.
+
+        Returns:
+            Dict[str, AppImage]: App name -> AppImage created by the factory
+        """
+        apps_dir = os.path.join(self.global_config.config_dir, "apps")
+        if not os.path.isdir(apps_dir):
+            return {}
+
+        names = sorted(
+            entry.name[: -len(".json")]
+            for entry in os.scandir(apps_dir)
+            if entry.is_file() and entry.name.endswith(".json")
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            appimages = pool.map(self.load_appimage_from_config, names)
+            return {
+                name: appimage
+                for name, appimage in zip(names, appimages, strict=True)
+                if appimage is not None
+            }
+
 
 # Update the main function
 def main():
@@ -591,6 +900,53 @@ def main():
             f"Loaded: {loaded_gitlab.__class__.__name__} version {loaded_gitlab.version}"
         )
 
+    # Concurrent downloads from both forges
+    print("\n5. Downloading apps from GitHub and GitLab concurrently...")
+    forge_urls = [
+        "https://github.com/owner/forge-app-{}/releases/download/v1.0/app.AppImage",
+        "https://gitlab.com/owner/forge-app-{}/-/releases/v1.0/app.AppImage",
+    ]
+    results = manager.download_many(
+        AppImageData(
+            name=f"forge-app-{i}",
+            arch_keyword="x86_64",
+            download_url=forge_urls[i % 2].format(i),
+            sha_download_url=forge_urls[i % 2].format(i) + ".sha256",
+            version="1.0",
+            display_name=f"Forge App {i}",
+            sha_file_name="app.AppImage.sha256",
+        )
+        for i in range(8)
+    )
+    succeeded = [result.name for result in results if result.ok]
+    print(f"Downloaded {len(succeeded)} of {len(results)} apps")
+
+    # Batched saves and parallel loading for many apps
+    print("\n6. Saving and loading app configs in bulk...")
+    bulk_images = [
+        app_factory.create_appimage(
+            AppImageData(
+                name=f"bulk-app-{i}",
+                arch_keyword="x86_64",
+                download_url=f"https://github.com/owner/bulk-app-{i}/app.AppImage",
+                sha_download_url=f"https://github.com/owner/bulk-app-{i}/app.sha256",
+                version="1.0",
+                display_name=f"Bulk App {i}",
+                sha_file_name="app.sha256",
+            )
+        )
+        for i in range(100)
+    ]
+    with tempfile.TemporaryDirectory() as bulk_config_dir:
+        bulk_manager = AppImageManager(
+            factory=app_factory,
+            config_factory=config_factory,
+            global_config=GlobalConfig.create_default(bulk_config_dir),
+        )
+        bulk_manager.save_appimage_configs(bulk_images)
+        loaded_apps = bulk_manager.load_all_configs()
+        print(f"Loaded {len(loaded_apps)} apps in parallel")
+
     print("\n=== END OF FACTORY PATTERN DEMONSTRATION ===\n")
 
 
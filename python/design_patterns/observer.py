@@ -31,9 +31,26 @@ This example shows how to implement the Observer pattern for an AppImage managem
 system, where various components need to be notified of changes to AppImages.
 """
 
+import atexit
 import enum
+import sys
+import threading
+import time
+import weakref
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Protocol, Set
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+)
 
 
 # We'll reuse the AppImageData class concept from factory.py
@@ -118,27 +135,267 @@ class Observer(Protocol):
         ...
 
 
+# Asynchronous event dispatch
+class AsyncEventDispatcher:
+    """Delivers events to observers from a background worker thread.
+
+    A subject created with a dispatcher only puts events on a bounded queue
+    in notify_observers(), so producers such as
+    AppImageManager.download_appimage never wait for a slow observer. The
+    worker drains the queue in batches of up to batch_size events and hands
+    each subject its share of the batch (see Subject.deliver_events).
+
+    When the queue is full, producers still don't block; the backpressure
+    policy decides what gives:
+
+    - "drop_oldest": the oldest pending event is discarded
+    - "coalesce_latest": DOWNLOAD_PROGRESS events replace the pending
+      progress event of the same AppImage, which is stale anyway, so each
+      download holds at most one queue slot for progress. If the queue is
+      full nonetheless, the oldest pending event is discarded.
+
+    One dispatcher (and one worker thread) can serve several subjects.
+    """
+
+    POLICIES = ("drop_oldest", "coalesce_latest")
+
+    def __init__(
+        self,
+        max_pending: int = 1024,
+        policy: str = "coalesce_latest",
+        batch_size: int = 64,
+    ):
+        """Initialize and start the worker thread.
+
+        Args:
+            max_pending: Maximum number of queued events
+            policy: Backpressure policy, "drop_oldest" or "coalesce_latest"
+            batch_size: Maximum number of events delivered per batch
+
+        Raises:
+            ValueError: If the policy is unknown
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+
+        self.max_pending = max_pending
+        self.policy = policy
+        self.batch_size = batch_size
+
+        # [subject, event] slots, oldest first; lists so coalescing can swap
+        # the event of a queued slot in place
+        self._pending: Deque[List[Any]] = deque()
+        # (subject id, AppImage name) -> queued progress slot
+        self._progress_slots: Dict[Tuple[int, str], List[Any]] = {}
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+
+        self.submitted = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="appimage-event-dispatcher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def _progress_key(subject: "Subject", event: Event) -> Optional[Tuple[int, str]]:
+        """Get the coalescing key of a progress event.
+
+        Args:
+            subject: The subject that emitted the event
+            event: The event
+
+        Returns:
+            The key, or None for events that are never coalesced
+        """
+        if event.event_type is EventType.DOWNLOAD_PROGRESS and event.appimage:
+            return (id(subject), event.appimage.name)
+        return None
+
+    def _forget(self, slot: List[Any]) -> None:
+        """Stop tracking a slot that left the queue for coalescing.
+
+        Args:
+            slot: The [subject, event] slot
+        """
+        key = self._progress_key(*slot)
+        if key is not None and self._progress_slots.get(key) is slot:
+            del self._progress_slots[key]
+
+    def submit(self, subject: "Subject", event: Event) -> None:
+        """Queue an event for the subject's observers without blocking.
+
+        Args:
+            subject: The subject that emitted the event
+            event: The event to deliver
+        """
+        with self._cond:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                self.submitted += 1
+                self._enqueue(subject, event)
+                self._cond.notify()
+
+        if closed:
+            # Too late for the worker (e.g., during shutdown), deliver directly
+            subject.deliver_events([event])
+
+    def _enqueue(self, subject: "Subject", event: Event) -> None:
+        """Put an event on the queue, applying the backpressure policy.
+
+        Must be called with the lock held.
+
+        Args:
+            subject: The subject that emitted the event
+            event: The event to queue
+        """
+        key = self._progress_key(subject, event)
+        if self.policy == "coalesce_latest":
+            if key is not None:
+                slot = self._progress_slots.get(key)
+                if slot is not None:
+                    slot[1] = event
+                    self.coalesced += 1
+                    return
+            elif event.appimage:
+                # Later progress must not jump ahead of this event
+                self._progress_slots.pop((id(subject), event.appimage.name), None)
+
+        if len(self._pending) >= self.max_pending:
+            self._forget(self._pending.popleft())
+            self.dropped += 1
+
+        slot = [subject, event]
+        self._pending.append(slot)
+        if key is not None and self.policy == "coalesce_latest":
+            self._progress_slots[key] = slot
+
+    def _run(self) -> None:
+        """Worker thread: deliver queued events in batches."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                batch = []
+                while self._pending and len(batch) < self.batch_size:
+                    slot = self._pending.popleft()
+                    self._forget(slot)
+                    batch.append(slot)
+                self._busy = True
+
+            try:
+                # Each subject gets its events in order, in one call
+                by_subject: Dict[Subject, List[Event]] = {}
+                for subject, event in batch:
+                    by_subject.setdefault(subject, []).append(event)
+                for subject, events in by_subject.items():
+                    subject.deliver_events(events)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self.delivered += len(batch)
+                    self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every event queued so far has been delivered."""
+        with self._cond:
+            while (self._pending or self._busy) and self._thread.is_alive():
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Deliver everything still queued and stop the worker."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get statistics about dispatched events.
+
+        Returns:
+            Dict[str, int]: Event counts
+        """
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+                "pending": len(self._pending),
+            }
+
+
 class Subject:
     """Subject base class for the Observer pattern.
 
     In the Observer pattern, the Subject maintains a list of observers
     and provides methods to register, unregister, and notify observers.
 
-    This implementation uses a set for observers to prevent duplicates
-    and provides type hints for better code quality.
+    Observers subscribe to topics: an event type and/or an AppImage name,
+    either of which can be left open. Subscriptions are indexed by topic
+    (a dict of sets), so an event only touches the observers interested in
+    it instead of every registered observer. The sets hold weak references:
+    an observer nobody else references any more is dropped automatically,
+    so callers must keep their observers alive while they want updates.
+
+    By default observers are notified synchronously on the producer's
+    thread. With an AsyncEventDispatcher, notify_observers() only queues the
+    event and observers are updated from the dispatcher's worker thread.
     """
 
-    def __init__(self):
-        """Initialize with an empty set of observers."""
-        self._observers: Set[Observer] = set()
+    def __init__(self, dispatcher: Optional[AsyncEventDispatcher] = None):
+        """Initialize with no observers.
 
-    def register_observer(self, observer: Observer) -> None:
+        Args:
+            dispatcher: Dispatcher that delivers events asynchronously
+                (defaults to notifying observers synchronously)
+        """
+        # (event type, AppImage name) -> observers; None matches anything
+        self._subscriptions: Dict[
+            Tuple[Optional[EventType], Optional[str]], "weakref.WeakSet[Observer]"
+        ] = {}
+        # observer -> topics it is subscribed to, for unregister_observer()
+        self._topics: "weakref.WeakKeyDictionary[Observer, Set[Tuple]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Guards both indexes; events may be delivered from a worker thread
+        self._lock = threading.Lock()
+        self.dispatcher = dispatcher
+
+    def register_observer(
+        self,
+        observer: Observer,
+        event_types: Optional[Iterable[EventType]] = None,
+        appimage: Optional[str] = None,
+    ) -> None:
         """Add an observer to be notified of events.
 
+        Registering the same observer again adds to its subscriptions.
+
         Args:
-            observer: The observer to register
+            observer: The observer to register (held by weak reference)
+            event_types: Event types to receive (defaults to all)
+            appimage: Name of the AppImage to receive events for (defaults to all)
         """
-        self._observers.add(observer)
+        topics = [
+            (event_type, appimage) for event_type in (event_types or [None])
+        ]
+        with self._lock:
+            for topic in topics:
+                self._subscriptions.setdefault(topic, weakref.WeakSet()).add(observer)
+            self._topics.setdefault(observer, set()).update(topics)
 
     def unregister_observer(self, observer: Observer) -> None:
         """Remove an observer so it no longer receives notifications.
@@ -146,7 +403,39 @@ class Subject:
         Args:
             observer: The observer to unregister
         """
-        self._observers.discard(observer)
+        with self._lock:
+            for topic in self._topics.pop(observer, ()):
+                observers = self._subscriptions.get(topic)
+                if observers is not None:
+                    observers.discard(observer)
+                    if not observers:
+                        del self._subscriptions[topic]
+
+    def observers_for(self, event: Event) -> List[Observer]:
+        """Find the observers subscribed to an event.
+
+        Args:
+            event: The event
+
+        Returns:
+            List[Observer]: Each interested observer once
+        """
+        event_type = event.event_type
+        name = event.appimage.name if event.appimage else None
+        topics = [(event_type, None), (None, None)]
+        if name is not None:
+            topics += [(event_type, name), (None, name)]
+
+        with self._lock:
+            buckets = [
+                list(self._subscriptions[topic])
+                for topic in topics
+                if topic in self._subscriptions
+            ]
+        if len(buckets) == 1:
+            return buckets[0]
+        # An observer can match through several topics
+        return list(dict.fromkeys(o for bucket in buckets for o in bucket))
 
     def notify_observers(self, event: Event) -> None:
         """Notify all registered observers of an event.
@@ -157,9 +446,62 @@ class Subject:
         Args:
             event: The event object with information about the change
         """
-        for observer in self._observers:
+        if self.dispatcher is not None:
+            self.dispatcher.submit(self, event)
+            return
+
+        for observer in self.observers_for(event):
             observer.update(event)
 
+    def deliver_events(self, events: List[Event]) -> None:
+        """Deliver a batch of queued events to the subscribed observers.
+
+        Called by the AsyncEventDispatcher. Progress events superseded by a
+        later progress event for the same AppImage in the batch are skipped,
+        unless another event for that AppImage comes between them.
+        Observers that implement update_many(events) receive their share of
+        the batch in a single call; others get update() once per event. An
+        observer that raises doesn't stop delivery to the others.
+
+        Args:
+            events: The events, in the order they were emitted
+        """
+        # AppImage name -> index in kept of its latest progress event
+        latest_progress: Dict[str, int] = {}
+        kept: List[Optional[Event]] = []
+        for event in events:
+            if event.appimage:
+                name = event.appimage.name
+                if event.event_type is EventType.DOWNLOAD_PROGRESS:
+                    superseded = latest_progress.get(name)
+                    if superseded is not None:
+                        kept[superseded] = None
+                    latest_progress[name] = len(kept)
+                else:
+                    # Later progress must not jump ahead of this event
+                    latest_progress.pop(name, None)
+            kept.append(event)
+        events = [event for event in kept if event is not None]
+
+        # Each observer's events, in order
+        batches: Dict[Observer, List[Event]] = {}
+        for event in events:
+            for observer in self.observers_for(event):
+                batches.setdefault(observer, []).append(event)
+
+        for observer, observer_events in batches.items():
+            try:
+                update_many = getattr(observer, "update_many", None)
+                if update_many is not None:
+                    update_many(observer_events)
+                else:
+                    for event in observer_events:
+                        observer.update(event)
+            except Exception as e:
+                print(
+                    f"Error notifying {type(observer).__name__}: {e}", file=sys.stderr
+                )
+
 
 # Concrete Observer implementations
 class LoggingObserver:
@@ -248,6 +590,80 @@ class SystemTrayObserver:
             print("SYSTEM TRAY: No active tasks")
 
 
+# Progress reporting
+class ProgressEmitter:
+    """Emits throttled DOWNLOAD_PROGRESS events for one download.
+
+    A byte-level download reports progress far more often than any observer
+    can use. report() only notifies observers if at least 1 / max_rate
+    seconds passed since the previous event, but the 0% and 100% edges are
+    always emitted. A single Event and data dict is allocated per download
+    and updated in place, so throttled or not, reporting doesn't allocate.
+
+    Because the event is reused, observers that keep a progress event
+    around must copy it. With an AsyncEventDispatcher an observer may also
+    see a later progress value than the one that was reported.
+    """
+
+    def __init__(
+        self,
+        subject: "Subject",
+        appimage: AppImage,
+        max_rate: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize with the subject to notify and the rate limit.
+
+        Args:
+            subject: The subject whose observers get the events
+            appimage: The AppImage being downloaded
+            max_rate: Maximum progress events per second (0 for no limit)
+            clock: Monotonic time source, replaceable for testing
+        """
+        self.subject = subject
+        self.min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self._clock = clock
+        self.event = Event(
+            event_type=EventType.DOWNLOAD_PROGRESS,
+            appimage=appimage,
+            data={"progress": 0},
+        )
+        self._last_emit: Optional[float] = None
+        self._last_progress: Optional[float] = None
+
+        self.reported = 0
+        self.emitted = 0
+
+    def report(self, progress: float) -> bool:
+        """Report download progress, notifying observers if it's due.
+
+        Args:
+            progress: Percentage downloaded, from 0 to 100
+
+        Returns:
+            bool: True if an event was emitted
+        """
+        self.reported += 1
+        if progress == self._last_progress:
+            return False
+
+        now = self._clock()
+        edge = progress <= 0 or progress >= 100
+        if (
+            not edge
+            and self._last_emit is not None
+            and now - self._last_emit < self.min_interval
+        ):
+            return False
+
+        self.event.data["progress"] = progress
+        self._last_emit = now
+        self._last_progress = progress
+        self.emitted += 1
+        self.subject.notify_observers(self.event)
+        return True
+
+
 # AppImageManager with Observer pattern
 class AppImageManager(Subject):
     """AppImage manager that implements the Subject interface.
@@ -260,10 +676,20 @@ class AppImageManager(Subject):
     when AppImages are added, updated, removed, or their download status changes.
     """
 
-    def __init__(self):
-        """Initialize with parent constructor and empty AppImage collection."""
-        super().__init__()
+    def __init__(
+        self,
+        dispatcher: Optional[AsyncEventDispatcher] = None,
+        progress_rate: float = 10.0,
+    ):
+        """Initialize with parent constructor and empty AppImage collection.
+
+        Args:
+            dispatcher: Dispatcher that delivers events asynchronously
+            progress_rate: Maximum progress events per second per download
+        """
+        super().__init__(dispatcher)
         self.appimages: Dict[str, AppImage] = {}
+        self.progress_rate = progress_rate
 
     def add_appimage(self, appimage: AppImage) -> None:
         """Add an AppImage to the manager and notify observers.
@@ -299,14 +725,17 @@ class AppImageManager(Subject):
                 Event(event_type=EventType.APPIMAGE_REMOVED, appimage=appimage)
             )
 
-    def download_appimage(self, name: str) -> None:
+    def download_appimage(self, name: str, chunks: int = 4) -> None:
         """Download an AppImage and notify observers of progress.
 
         This method simulates the download process for an AppImage,
-        notifying observers at different stages of the process.
+        notifying observers at different stages of the process. Progress
+        goes through a ProgressEmitter, so observers get at most
+        progress_rate progress events per second plus the 0% and 100% edges.
 
         Args:
             name: The name of the AppImage to download
+            chunks: Number of chunks the simulated download reports
         """
         if name not in self.appimages:
             print(f"Error: AppImage '{name}' not found")
@@ -320,15 +749,11 @@ class AppImageManager(Subject):
         )
 
         # Simulate download progress
-        for progress in [25, 50, 75, 100]:
+        progress = ProgressEmitter(self, appimage, self.progress_rate)
+        progress.report(0)
+        for chunk in range(1, chunks + 1):
             # In a real implementation, this would be async/threaded
-            self.notify_observers(
-                Event(
-                    event_type=EventType.DOWNLOAD_PROGRESS,
-                    appimage=appimage,
-                    data={"progress": progress},
-                )
-            )
+            progress.report(chunk * 100 // chunks)
 
         # Notify download completed
         self.notify_observers(
@@ -362,9 +787,20 @@ def main():
     notifier = NotificationObserver()
     tray_icon = SystemTrayObserver()
 
+    # Observers only subscribe to the events they care about
     manager.register_observer(logger)
-    manager.register_observer(notifier)
-    manager.register_observer(tray_icon)
+    manager.register_observer(
+        notifier,
+        event_types=[EventType.APPIMAGE_UPDATED, EventType.DOWNLOAD_COMPLETED],
+    )
+    manager.register_observer(
+        tray_icon,
+        event_types=[
+            EventType.DOWNLOAD_STARTED,
+            EventType.DOWNLOAD_COMPLETED,
+            EventType.APPIMAGE_UPDATED,
+        ],
+    )
 
     print(
         "   * Registered LoggingObserver, NotificationObserver, and SystemTrayObserver"
@@ -439,6 +875,36 @@ def main():
     print("\n9. Downloading again with fewer observers...")
     manager.download_appimage("github-app")
 
+    # Deliver events from a worker thread so slow observers can't stall downloads
+    print("\n10. Downloading with asynchronous event dispatch...")
+
+    class SlowTrayObserver(SystemTrayObserver):
+        """A tray observer whose icon refresh blocks, like a busy UI toolkit."""
+
+        def _refresh_icon(self):
+            time.sleep(0.1)
+            super()._refresh_icon()
+
+    dispatcher = AsyncEventDispatcher(max_pending=16, policy="coalesce_latest")
+    async_manager = AppImageManager(dispatcher=dispatcher)
+    slow_tray = SlowTrayObserver()
+    async_manager.register_observer(slow_tray)
+    async_manager.add_appimage(github_image)
+
+    start = time.perf_counter()
+    for _ in range(5):
+        async_manager.download_appimage("github-app")
+    print(f"Producer finished in {time.perf_counter() - start:.3f}s")
+
+    dispatcher.flush()
+    print(f"Dispatcher statistics: {dispatcher.get_stats()}")
+    dispatcher.close()
+
+    # Observers are held weakly, so dropping the last reference unsubscribes
+    print("\n11. Dropping an observer without unregistering it...")
+    del logger
+    manager.download_appimage("github-app")
+
     print("\n=== END OF OBSERVER PATTERN DEMONSTRATION ===\n")
 
 
@@ -0,0 +1,122 @@
+"""
+Benchmarks for the observer.py progress events.
+
+Run from this directory:
+
+    python observer_benchmark.py
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from observer import (
+    AppImage,
+    AppImageData,
+    AppImageManager,
+    Event,
+    EventType,
+    ProgressEmitter,
+)
+
+
+class ProgressBarObserver:
+    """Renders a progress line per event, like a terminal progress bar."""
+
+    def __init__(self):
+        self.events = 0
+        self._lock = threading.Lock()
+
+    def update(self, event):
+        line = f"{event.appimage.name}: {event.data['progress']:>3}%"
+        with self._lock:
+            self.events += 1
+            self.last_line = line
+
+
+def make_app_images(n_downloads):
+    return [
+        AppImage(
+            data=AppImageData(
+                name=f"app-{i}",
+                arch_keyword="x86_64",
+                download_url=f"https://github.com/owner/app-{i}/app.AppImage",
+                sha_download_url=f"https://github.com/owner/app-{i}/app.sha256",
+                version="1.0",
+                display_name=f"App {i}",
+                sha_file_name="app.sha256",
+            )
+        )
+        for i in range(n_downloads)
+    ]
+
+
+def unthrottled_download(manager, appimage, chunks, chunks_per_read, read_time):
+    """Report every chunk with a new Event, as download_appimage used to."""
+    for chunk in range(1, chunks + 1):
+        manager.notify_observers(
+            Event(
+                event_type=EventType.DOWNLOAD_PROGRESS,
+                appimage=appimage,
+                data={"progress": chunk * 100 // chunks},
+            )
+        )
+        if chunk % chunks_per_read == 0:
+            time.sleep(read_time)
+
+
+def throttled_download(manager, appimage, chunks, chunks_per_read, read_time):
+    """Report every chunk through a ProgressEmitter."""
+    progress = ProgressEmitter(manager, appimage, manager.progress_rate)
+    progress.report(0)
+    for chunk in range(1, chunks + 1):
+        progress.report(chunk * 100 // chunks)
+        if chunk % chunks_per_read == 0:
+            time.sleep(read_time)
+
+
+def benchmark_progress_events(n_downloads, chunks, chunks_per_read, read_time):
+    print(
+        f"\n{n_downloads} concurrent downloads, {chunks} progress reports each "
+        f"(~{chunks // chunks_per_read * read_time:.1f}s per download)"
+    )
+    app_images = make_app_images(n_downloads)
+
+    for label, download in [
+        ("new Event per report", unthrottled_download),
+        ("ProgressEmitter at 10 Hz", throttled_download),
+    ]:
+        manager = AppImageManager(progress_rate=10.0)
+        observer = ProgressBarObserver()
+        manager.register_observer(observer)
+
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=n_downloads) as pool:
+            for app_image in app_images:
+                pool.submit(
+                    download, manager, app_image, chunks, chunks_per_read, read_time
+                )
+        duration = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+
+        print(
+            f"  {label}: {observer.events:,} events "
+            f"({observer.events / duration:,.0f}/s), "
+            f"CPU {cpu:.2f}s, wall {duration:.2f}s"
+        )
+
+
+def main():
+    benchmark_progress_events(
+        n_downloads=100, chunks=10_000, chunks_per_read=100, read_time=0.01
+    )
+
+    # ## Results:
+    #     100 concurrent downloads, 10000 progress reports each (~1.0s per download)
+    #       new Event per report: 1,000,000 events (134,553/s), CPU 7.19s, wall 7.43s
+    #       ProgressEmitter at 10 Hz: 1,114 events (1,063/s), CPU 0.55s, wall 1.05s
+
+
+if __name__ == "__main__":
+    main()
@@ -33,18 +33,45 @@ providing different storage mechanisms (file-based, in-memory, SQLite) while kee
 the domain logic clean and unaware of storage details.
 """
 
+import bisect
+import itertools
 import json
 import os
+import re
 import sqlite3
-from dataclasses import asdict, dataclass
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+)
 
 
 # Reusing AppImageData from previous examples
-@dataclass
+@dataclass(slots=True)
 class AppImageData:
-    """Common data model for AppImage entities."""
+    """Common data model for AppImage entities.
+
+    Slotted, so a record carries no per-instance __dict__. The fields that
+    repeat across a catalog are interned, so records loaded from storage
+    share one copy of e.g. "x86_64" instead of each holding their own.
+    """
 
     name: str
     arch_keyword: str
@@ -56,8 +83,19 @@ class AppImageData:
     owner: str = ""
     repo: str = ""
 
+    def __post_init__(self):
+        """Intern the low-cardinality fields."""
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
 
-@dataclass
+# AppImageData fields that take few distinct values across a catalog
+_INTERNED_FIELDS = ("arch_keyword", "version", "sha_file_name", "owner")
+
+
+@dataclass(slots=True)
 class AppImage:
     """AppImage domain entity - The main business object the repository manages.
 
@@ -71,6 +109,12 @@ class AppImage:
     data: AppImageData
     last_updated: Optional[datetime] = None
 
+    # Convenience copies of common data fields, set by __post_init__
+    name: str = field(init=False)
+    download_url: str = field(init=False)
+    version: str = field(init=False)
+    display_name: str = field(init=False)
+
     def __post_init__(self):
         """Initialize after dataclass creation."""
         # For convenience, expose common fields directly
@@ -84,6 +128,165 @@ class AppImage:
             self.last_updated = datetime.now()
 
 
+# Version ordering
+# Matches "1.2.3", "v2.0-rc1", "3.1b2", "1.0.post1", ... (PEP 440-like)
+_VERSION_PATTERN = re.compile(
+    r"^\s*v?(?P<release>\d+(?:\.\d+)*)"
+    r"(?:[-_.]?(?P<phase>dev|alpha|beta|preview|pre|post|rev|a|b|c|rc|r)"
+    r"[-_.]?(?P<phase_number>\d+)?)?",
+    re.IGNORECASE,
+)
+
+# Pre-releases sort before the final release, post-releases after it
+_PHASE_RANKS = {
+    "dev": 0,
+    "a": 1,
+    "alpha": 1,
+    "b": 2,
+    "beta": 2,
+    "c": 3,
+    "rc": 3,
+    "pre": 3,
+    "preview": 3,
+    None: 4,
+    "post": 5,
+    "rev": 5,
+    "r": 5,
+}
+
+_VERSION_PART_WIDTH = 10
+
+
+def version_sort_key(version: str) -> str:
+    """Parse a version string into a key that sorts in version order.
+
+    The key is a plain string, so it can be compared in Python, bisected in
+    a sorted list and stored in an indexed SQL column alike. Each release
+    number is zero-padded and terminated by ".", and "!" (which sorts below
+    both "." and digits) marks the end of the release part:
+
+        "1.10"   -> "0000000001.0000000010.!4..."
+        "1.9rc1" -> "0000000001.0000000009.!3..."
+
+    Trailing zeros are dropped so "1.0" and "1" compare equal. Strings that
+    don't start with a number (e.g. "nightly") sort before every release.
+
+    Args:
+        version: The version string to parse
+
+    Returns:
+        The sortable version key
+    """
+    match = _VERSION_PATTERN.match(version)
+    if not match:
+        return f"!0{0:0{_VERSION_PART_WIDTH}d}"
+
+    release = [int(part) for part in match["release"].split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+
+    limit = 10**_VERSION_PART_WIDTH - 1
+    phase = match["phase"].lower() if match["phase"] else None
+    phase_number = min(int(match["phase_number"] or 0), limit)
+
+    return (
+        "".join(f"{min(part, limit):0{_VERSION_PART_WIDTH}d}." for part in release)
+        + f"!{_PHASE_RANKS[phase]}{phase_number:0{_VERSION_PART_WIDTH}d}"
+    )
+
+
+class _VersionIndex:
+    """Names kept sorted by version key, for bisect-based range queries."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        # Sorted (version key, name) pairs
+        self._entries: List[Tuple[str, str]] = []
+        self._keys: Dict[str, str] = {}
+
+    def add(self, name: str, version: str) -> None:
+        """Index a name under a version, replacing any previous entry.
+
+        Args:
+            name: The AppImage name
+            version: The AppImage version
+        """
+        self.remove(name)
+        key = version_sort_key(version)
+        bisect.insort(self._entries, (key, name))
+        self._keys[name] = key
+
+    def remove(self, name: str) -> None:
+        """Remove a name from the index, if present.
+
+        Args:
+            name: The AppImage name
+        """
+        key = self._keys.pop(name, None)
+        if key is not None:
+            del self._entries[bisect.bisect_left(self._entries, (key, name))]
+
+    def rebuild(self, items: Iterable[Tuple[str, str]]) -> None:
+        """Replace the whole index with one sort instead of many insertions.
+
+        Args:
+            items: (name, version) pairs to index
+        """
+        self._keys = {name: version_sort_key(version) for name, version in items}
+        self._entries = sorted((key, name) for name, key in self._keys.items())
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._keys.clear()
+
+    def older_than(self, version: str) -> List[str]:
+        """List the names whose version sorts before the given version.
+
+        Args:
+            version: The version to compare against
+
+        Returns:
+            Matching names, oldest version first
+        """
+        end = bisect.bisect_left(self._entries, (version_sort_key(version), ""))
+        return [name for _, name in self._entries[:end]]
+
+
+# Default number of AppImages per batch yielded by scan()
+DEFAULT_SCAN_BATCH_SIZE = 500
+
+
+def _batched(
+    app_images: Iterable[AppImage], batch_size: int
+) -> Iterator[List[AppImage]]:
+    """Group a stream of AppImages into lists of at most batch_size items.
+
+    Args:
+        app_images: The AppImages to group
+        batch_size: Maximum number of AppImages per batch
+
+    Yields:
+        Lists of at most batch_size AppImages
+    """
+    iterator = iter(app_images)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+
+def _check_unique(app_images: List[AppImage]) -> None:
+    """Make sure a batch doesn't contain the same AppImage name twice.
+
+    Args:
+        app_images: The batch of AppImages to check
+    """
+    seen = set()
+    for app_image in app_images:
+        if app_image.name in seen:
+            raise KeyError(f"AppImage with name '{app_image.name}' appears twice")
+        seen.add(app_image.name)
+
+
 # Repository interface - defines common operations across all repository implementations
 class AppImageRepository(Protocol):
     """Repository interface for AppImage entities - This defines the Repository Pattern contract.
@@ -122,6 +325,44 @@ class AppImageRepository(Protocol):
         """
         ...
 
+    def add_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add several AppImages in one batch.
+
+        Nothing is stored if any of the AppImages already exists.
+
+        Args:
+            app_images: The AppImages to store
+        """
+        ...
+
+    def update_many(self, app_images: Iterable[AppImage]) -> None:
+        """Update several existing AppImages in one batch.
+
+        Nothing is updated if any of the AppImages is missing.
+
+        Args:
+            app_images: The AppImages with updated data
+        """
+        ...
+
+    def upsert_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add new AppImages and update existing ones in one batch.
+
+        Args:
+            app_images: The AppImages to store or update
+        """
+        ...
+
+    def remove_many(self, names: Iterable[str]) -> None:
+        """Remove several AppImages in one batch.
+
+        Nothing is removed if any of the names is missing.
+
+        Args:
+            names: The names of the AppImages to remove
+        """
+        ...
+
     def get_by_name(self, name: str) -> Optional[AppImage]:
         """Get an AppImage by its name.
 
@@ -141,6 +382,29 @@ class AppImageRepository(Protocol):
         """
         ...
 
+    def iter_all(self) -> Iterator[AppImage]:
+        """Lazily iterate over all AppImages in the repository.
+
+        Unlike get_all(), this never materializes the whole catalog.
+
+        Yields:
+            Each stored AppImage
+        """
+        ...
+
+    def scan(
+        self, batch_size: int = DEFAULT_SCAN_BATCH_SIZE
+    ) -> Iterator[List[AppImage]]:
+        """Lazily iterate over all AppImages in fixed-size batches.
+
+        Args:
+            batch_size: Maximum number of AppImages per batch
+
+        Yields:
+            Lists of at most batch_size AppImages
+        """
+        ...
+
     def find_by_display_name(self, display_name: str) -> List[AppImage]:
         """Find AppImages by display name (possibly multiple matches).
 
@@ -163,6 +427,20 @@ class AppImageRepository(Protocol):
         """
         ...
 
+    def find_older_than(self, version: str) -> List[AppImage]:
+        """Find AppImages whose version sorts before the given version.
+
+        Versions are compared with version_sort_key(), so "1.10" is newer
+        than "1.9" and "2.0rc1" is older than "2.0".
+
+        Args:
+            version: The version to compare against
+
+        Returns:
+            A list of matching AppImages, oldest version first
+        """
+        ...
+
     def count(self) -> int:
         """Count the number of AppImages in the repository.
 
@@ -176,6 +454,174 @@ class AppImageRepository(Protocol):
         ...
 
 
+# Column-wise AppImage storage
+class _StringColumn:
+    """Dictionary-encoded string column: each distinct value is stored once."""
+
+    def __init__(self):
+        """Initialize an empty column."""
+        self.codes = array("I")
+        self.values: List[str] = []
+        self._lookup: Dict[str, int] = {}
+
+    def __getitem__(self, row: int) -> str:
+        """Get the value stored in a row.
+
+        Args:
+            row: The row number
+
+        Returns:
+            The decoded value
+        """
+        return self.values[self.codes[row]]
+
+    def __setitem__(self, row: int, value: str) -> None:
+        """Store a value in a row, appending the row if it's new.
+
+        Args:
+            row: The row number, at most one past the last row
+            value: The value to store
+        """
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+
+        if row == len(self.codes):
+            self.codes.append(code)
+        else:
+            self.codes[row] = code
+
+
+class _ObjectColumn(list):
+    """Plain column for high-cardinality values, one slot per row."""
+
+    def __setitem__(self, row, value) -> None:
+        """Store a value in a row, appending the row if it's new.
+
+        Args:
+            row: The row number, at most one past the last row
+            value: The value to store
+        """
+        if row == len(self):
+            self.append(value)
+        else:
+            super().__setitem__(row, value)
+
+
+# last_updated is stored as microseconds since this (naive) epoch
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_TIMESTAMP = -(2**63)
+
+
+class ColumnarAppImageStore(MutableMapping):
+    """Name -> AppImage mapping that stores AppImages column-wise.
+
+    Instead of one AppImage and one AppImageData object per entry, every
+    field lives in its own column and an entry is just a row number. The
+    low-cardinality fields are dictionary-encoded into compact arrays of
+    codes and last_updated is kept as integer microseconds, so most of the
+    memory left per entry is the unique strings themselves.
+
+    Reading an entry builds a fresh AppImage from its row. Removed rows are
+    reused by later insertions. Encoded values are never dropped, which is
+    fine for the low-cardinality fields they are used for.
+    """
+
+    _FIELDS = tuple(data_field.name for data_field in fields(AppImageData))
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._columns: Dict[str, Any] = {
+            name: _StringColumn() if name in _INTERNED_FIELDS else _ObjectColumn()
+            for name in self._FIELDS
+        }
+        self._timestamps = array("q")
+
+    def __getitem__(self, name: str) -> AppImage:
+        """Build the AppImage stored under a name.
+
+        Args:
+            name: The AppImage name
+
+        Returns:
+            A new AppImage with the stored values
+        """
+        row = self._rows[name]
+        data = AppImageData(
+            **{field_name: column[row] for field_name, column in self._columns.items()}
+        )
+        timestamp = self._timestamps[row]
+        last_updated = (
+            _EPOCH + timestamp * _MICROSECOND if timestamp != _NO_TIMESTAMP else None
+        )
+        return AppImage(data=data, last_updated=last_updated)
+
+    def __setitem__(self, name: str, app_image: AppImage) -> None:
+        """Store an AppImage's current values under a name.
+
+        Args:
+            name: The AppImage name
+            app_image: The AppImage to store
+        """
+        row = self._rows.get(name)
+        if row is None:
+            row = self._free_rows.pop() if self._free_rows else len(self._timestamps)
+            self._rows[name] = row
+
+        for field_name, column in self._columns.items():
+            column[row] = getattr(app_image.data, field_name)
+
+        timestamp = (
+            (app_image.last_updated - _EPOCH) // _MICROSECOND
+            if app_image.last_updated
+            else _NO_TIMESTAMP
+        )
+        if row == len(self._timestamps):
+            self._timestamps.append(timestamp)
+        else:
+            self._timestamps[row] = timestamp
+
+    def __delitem__(self, name: str) -> None:
+        """Remove the entry stored under a name.
+
+        Args:
+            name: The AppImage name
+        """
+        row = self._rows.pop(name)
+        # Release the unique strings; the row itself is reused later
+        for column in self._columns.values():
+            if isinstance(column, _ObjectColumn):
+                column[row] = ""
+        self._free_rows.append(row)
+
+    def __contains__(self, name: object) -> bool:
+        """Check for a name without building its AppImage.
+
+        Args:
+            name: The AppImage name
+
+        Returns:
+            True if an entry is stored under the name
+        """
+        return name in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the stored names in insertion order."""
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        """Count the stored entries."""
+        return len(self._rows)
+
+
 # In-memory repository implementation
 class InMemoryAppImageRepository:
     """In-memory implementation of AppImageRepository.
@@ -187,11 +633,104 @@ class InMemoryAppImageRepository:
     In the Repository Pattern, concrete repositories implement storage-specific
     code while keeping the same interface, allowing the domain code to
     remain storage-agnostic.
+
+    Besides the primary name -> AppImage dictionary, the repository keeps
+    secondary hash indexes on display_name, version, owner/repo and
+    arch_keyword, so the find_* queries are O(1) dictionary lookups instead
+    of full scans. Every write goes through _index/_unindex to keep them
+    in sync with the primary store.
+
+    With columnar=True the primary store is a ColumnarAppImageStore instead
+    of a dictionary of objects, which takes far less memory for large
+    catalogs. AppImages are then rebuilt from the columns on every read, so
+    like the persistent backends, changes to a returned AppImage only take
+    effect once it is passed to update().
     """
 
-    def __init__(self):
-        """Initialize an empty repository."""
-        self._app_images: Dict[str, AppImage] = {}
+    # Index name -> function that extracts the index key from an AppImage
+    _INDEXED_FIELDS = {
+        "display_name": lambda app: app.display_name,
+        "version": lambda app: app.version,
+        "owner_repo": lambda app: f"{app.data.owner}/{app.data.repo}",
+        "arch_keyword": lambda app: app.data.arch_keyword,
+    }
+
+    def __init__(self, columnar: bool = False):
+        """Initialize an empty repository.
+
+        Args:
+            columnar: Store AppImages column-wise instead of as objects
+        """
+        self._columnar = columnar
+        self._app_images: "MutableMapping[str, AppImage]" = (
+            ColumnarAppImageStore() if columnar else {}
+        )
+
+        # Secondary indexes: index name -> key -> {app name: AppImage}
+        # An inner dict is used instead of a set to keep insertion order.
+        # In columnar mode the values are None, so the indexes don't keep an
+        # object alive per AppImage, and lookups go through the store.
+        self._indexes: Dict[str, Dict[str, Dict[str, Optional[AppImage]]]] = {
+            field_name: {} for field_name in self._INDEXED_FIELDS
+        }
+
+        # Sorted version keys for bisect-based find_older_than range queries
+        self._versions = _VersionIndex()
+
+        # Keys each AppImage was indexed under, in _INDEXED_FIELDS order.
+        # Callers may mutate a stored AppImage in place before calling
+        # update(), so the old keys can't be recomputed from the object itself.
+        self._indexed_keys: Dict[str, Tuple[str, ...]] = {}
+
+    def _index(self, app_image: AppImage, versions: bool = True) -> None:
+        """Add an AppImage to all secondary indexes.
+
+        Args:
+            app_image: The AppImage to index
+            versions: Whether to also add it to the sorted version index
+        """
+        if versions:
+            self._versions.add(app_image.name, app_image.version)
+
+        value = None if self._columnar else app_image
+        keys = tuple([get_key(app_image) for get_key in self._INDEXED_FIELDS.values()])
+        for field_name, key in zip(self._INDEXED_FIELDS, keys, strict=True):
+            self._indexes[field_name].setdefault(key, {})[app_image.name] = value
+        self._indexed_keys[app_image.name] = keys
+
+    def _unindex(self, name: str) -> None:
+        """Remove an AppImage from all secondary indexes.
+
+        Args:
+            name: The name of the AppImage to remove from the indexes
+        """
+        self._versions.remove(name)
+        keys = self._indexed_keys.pop(name, None)
+        if keys is None:
+            return
+        for field_name, key in zip(self._INDEXED_FIELDS, keys, strict=True):
+            bucket = self._indexes[field_name].get(key)
+            if bucket is None:
+                continue
+            bucket.pop(name, None)
+            # Drop empty buckets so the index doesn't grow without bound
+            if not bucket:
+                del self._indexes[field_name][key]
+
+    def _lookup(self, field_name: str, key: str) -> List[AppImage]:
+        """Look up AppImages through a secondary index.
+
+        Args:
+            field_name: The index to use
+            key: The key to look up
+
+        Returns:
+            A list of matching AppImages
+        """
+        bucket = self._indexes[field_name].get(key, {})
+        if self._columnar:
+            return [self._app_images[name] for name in bucket]
+        return list(bucket.values())
 
     def add(self, app_image: AppImage) -> None:
         """Add an AppImage to the repository.
@@ -204,6 +743,7 @@ class InMemoryAppImageRepository:
 
         # Make a copy to ensure immutability
         self._app_images[app_image.name] = app_image
+        self._index(app_image)
 
     def update(self, app_image: AppImage) -> None:
         """Update an existing AppImage in the repository.
@@ -217,8 +757,10 @@ class InMemoryAppImageRepository:
         # Update the last_updated timestamp
         app_image.last_updated = datetime.now()
 
-        # Update the stored AppImage
+        # Update the stored AppImage and re-index it under its new keys
+        self._unindex(app_image.name)
         self._app_images[app_image.name] = app_image
+        self._index(app_image)
 
     def remove(self, name: str) -> None:
         """Remove an AppImage from the repository.
@@ -230,6 +772,102 @@ class InMemoryAppImageRepository:
             raise KeyError(f"AppImage with name '{name}' not found")
 
         del self._app_images[name]
+        self._unindex(name)
+
+    def _reindex(self, app_images: List[AppImage]) -> None:
+        """Bring the secondary indexes up to date after a bulk write.
+
+        A batch that covers most of the repository is indexed with a single
+        rebuild; smaller batches are cheaper to re-index item by item.
+
+        Args:
+            app_images: The AppImages written by the batch
+        """
+        if len(app_images) * 2 >= len(self._app_images):
+            self._indexed_keys.clear()
+            for index in self._indexes.values():
+                index.clear()
+            versions = []
+            for app_image in self._app_images.values():
+                self._index(app_image, versions=False)
+                versions.append((app_image.name, app_image.version))
+            self._versions.rebuild(versions)
+            return
+
+        for app_image in app_images:
+            self._unindex(app_image.name)
+            self._index(app_image)
+
+    def add_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add several AppImages in one batch.
+
+        Nothing is stored if any of the AppImages already exists.
+
+        Args:
+            app_images: The AppImages to store
+        """
+        app_images = list(app_images)
+        _check_unique(app_images)
+        for app_image in app_images:
+            if app_image.name in self._app_images:
+                raise KeyError(f"AppImage with name '{app_image.name}' already exists")
+
+        self._app_images.update((app.name, app) for app in app_images)
+        self._reindex(app_images)
+
+    def update_many(self, app_images: Iterable[AppImage]) -> None:
+        """Update several existing AppImages in one batch.
+
+        Nothing is updated if any of the AppImages is missing.
+
+        Args:
+            app_images: The AppImages with updated data
+        """
+        app_images = list(app_images)
+        for app_image in app_images:
+            if app_image.name not in self._app_images:
+                raise KeyError(f"AppImage with name '{app_image.name}' not found")
+
+        last_updated = datetime.now()
+        for app_image in app_images:
+            app_image.last_updated = last_updated
+            self._app_images[app_image.name] = app_image
+        self._reindex(app_images)
+
+    def upsert_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add new AppImages and update existing ones in one batch.
+
+        Args:
+            app_images: The AppImages to store or update
+        """
+        app_images = list(app_images)
+        last_updated = datetime.now()
+        for app_image in app_images:
+            if app_image.name in self._app_images:
+                app_image.last_updated = last_updated
+            self._app_images[app_image.name] = app_image
+        self._reindex(app_images)
+
+    def remove_many(self, names: Iterable[str]) -> None:
+        """Remove several AppImages in one batch.
+
+        Nothing is removed if any of the names is missing.
+
+        Args:
+            names: The names of the AppImages to remove
+        """
+        names = list(dict.fromkeys(names))
+        for name in names:
+            if name not in self._app_images:
+                raise KeyError(f"AppImage with name '{name}' not found")
+
+        for name in names:
+            del self._app_images[name]
+        if not self._app_images:
+            self.clear()
+            return
+        for name in names:
+            self._unindex(name)
 
     def get_by_name(self, name: str) -> Optional[AppImage]:
         """Get an AppImage by its name.
@@ -250,6 +888,34 @@ class InMemoryAppImageRepository:
         """
         return list(self._app_images.values())
 
+    def iter_all(self) -> Iterator[AppImage]:
+        """Lazily iterate over all AppImages in the repository.
+
+        Iterates over a snapshot of the stored names, so the repository can
+        be modified while a caller is still consuming the iterator. AppImages
+        removed in the meantime are skipped.
+
+        Yields:
+            Each stored AppImage
+        """
+        for name in list(self._app_images):
+            app_image = self._app_images.get(name)
+            if app_image is not None:
+                yield app_image
+
+    def scan(
+        self, batch_size: int = DEFAULT_SCAN_BATCH_SIZE
+    ) -> Iterator[List[AppImage]]:
+        """Lazily iterate over all AppImages in fixed-size batches.
+
+        Args:
+            batch_size: Maximum number of AppImages per batch
+
+        Yields:
+            Lists of at most batch_size AppImages
+        """
+        yield from _batched(self.iter_all(), batch_size)
+
     def find_by_display_name(self, display_name: str) -> List[AppImage]:
         """Find AppImages by display name.
 
@@ -259,9 +925,7 @@ class InMemoryAppImageRepository:
         Returns:
             A list of matching AppImages
         """
-        return [
-            app for app in self._app_images.values() if app.display_name == display_name
-        ]
+        return self._lookup("display_name", display_name)
 
     def find_by_version(self, version: str) -> List[AppImage]:
         """Find AppImages by version.
@@ -272,7 +936,43 @@ class InMemoryAppImageRepository:
         Returns:
             A list of matching AppImages
         """
-        return [app for app in self._app_images.values() if app.version == version]
+        return self._lookup("version", version)
+
+    def find_by_owner_repo(self, owner: str, repo: str) -> List[AppImage]:
+        """Find AppImages published from a given owner/repo.
+
+        Args:
+            owner: The repository owner to search for
+            repo: The repository name to search for
+
+        Returns:
+            A list of matching AppImages
+        """
+        return self._lookup("owner_repo", f"{owner}/{repo}")
+
+    def find_by_arch_keyword(self, arch_keyword: str) -> List[AppImage]:
+        """Find AppImages built for a given architecture.
+
+        Args:
+            arch_keyword: The architecture keyword to search for (e.g., x86_64)
+
+        Returns:
+            A list of matching AppImages
+        """
+        return self._lookup("arch_keyword", arch_keyword)
+
+    def find_older_than(self, version: str) -> List[AppImage]:
+        """Find AppImages whose version sorts before the given version.
+
+        Bisects the sorted version index instead of scanning every AppImage.
+
+        Args:
+            version: The version to compare against
+
+        Returns:
+            A list of matching AppImages, oldest version first
+        """
+        return [self._app_images[name] for name in self._versions.older_than(version)]
 
     def count(self) -> int:
         """Count the number of AppImages in the repository.
@@ -285,6 +985,10 @@ class InMemoryAppImageRepository:
     def clear(self) -> None:
         """Remove all AppImages from the repository."""
         self._app_images.clear()
+        self._indexed_keys.clear()
+        self._versions.clear()
+        for index in self._indexes.values():
+            index.clear()
 
 
 # File-based repository implementation
@@ -403,35 +1107,697 @@ class FileAppImageRepository:
 
         os.remove(file_path)
 
-    def get_by_name(self, name: str) -> Optional[AppImage]:
-        """Get an AppImage by its name.
-
-        Args:
-            name: The name of the AppImage to retrieve
+    def _stored_names(self) -> Set[str]:
+        """List the names of all stored AppImages with a single directory scan.
 
         Returns:
-            The AppImage if found, None otherwise
+            The set of stored AppImage names
         """
-        file_path = self._get_file_path(name)
-        if not os.path.exists(file_path):
-            return None
+        return {
+            filename[: -len(".json")]
+            for filename in os.listdir(self.storage_dir)
+            if filename.endswith(".json")
+        }
 
-        return self._load_from_file(file_path)
+    def add_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add several AppImages in one batch.
 
-    def get_all(self) -> List[AppImage]:
-        """Get all AppImages in the repository.
+        Existence is checked against one directory listing instead of one
+        os.path.exists() call per AppImage. Nothing is written if any of the
+        AppImages already exists.
 
-        Returns:
+        Args:
+            app_images: The AppImages to store
+        """
+        app_images = list(app_images)
+        _check_unique(app_images)
+        stored = self._stored_names()
+        for app_image in app_images:
+            if app_image.name in stored:
+                raise KeyError(f"AppImage with name '{app_image.name}' already exists")
+
+        for app_image in app_images:
+            self._save_to_file(app_image)
+
+    def update_many(self, app_images: Iterable[AppImage]) -> None:
+        """Update several existing AppImages in one batch.
+
+        Nothing is written if any of the AppImages is missing.
+
+        Args:
+            app_images: The AppImages with updated data
+        """
+        app_images = list(app_images)
+        stored = self._stored_names()
+        for app_image in app_images:
+            if app_image.name not in stored:
+                raise KeyError(f"AppImage with name '{app_image.name}' not found")
+
+        last_updated = datetime.now()
+        for app_image in app_images:
+            app_image.last_updated = last_updated
+            self._save_to_file(app_image)
+
+    def upsert_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add new AppImages and update existing ones in one batch.
+
+        Args:
+            app_images: The AppImages to store or update
+        """
+        app_images = list(app_images)
+        stored = self._stored_names()
+        last_updated = datetime.now()
+        for app_image in app_images:
+            if app_image.name in stored:
+                app_image.last_updated = last_updated
+            self._save_to_file(app_image)
+
+    def remove_many(self, names: Iterable[str]) -> None:
+        """Remove several AppImages in one batch.
+
+        Nothing is removed if any of the names is missing.
+
+        Args:
+            names: The names of the AppImages to remove
+        """
+        names = list(dict.fromkeys(names))
+        stored = self._stored_names()
+        for name in names:
+            if name not in stored:
+                raise KeyError(f"AppImage with name '{name}' not found")
+
+        for name in names:
+            os.remove(self._get_file_path(name))
+
+    def get_by_name(self, name: str) -> Optional[AppImage]:
+        """Get an AppImage by its name.
+
+        Args:
+            name: The name of the AppImage to retrieve
+
+        Returns:
+            The AppImage if found, None otherwise
+        """
+        file_path = self._get_file_path(name)
+        if not os.path.exists(file_path):
+            return None
+
+        return self._load_from_file(file_path)
+
+    def get_all(self) -> List[AppImage]:
+        """Get all AppImages in the repository.
+
+        Returns:
             A list of all AppImages
         """
-        app_images = []
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[AppImage]:
+        """Lazily iterate over all AppImages in the repository.
+
+        Walks the storage directory with os.scandir() and only loads a file
+        when the caller asks for the next AppImage.
+
+        Yields:
+            Each stored AppImage
+        """
+        with os.scandir(self.storage_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    yield self._load_from_file(entry.path)
+                except FileNotFoundError:
+                    # Removed after the directory listing was read
+                    continue
+
+    def scan(
+        self, batch_size: int = DEFAULT_SCAN_BATCH_SIZE
+    ) -> Iterator[List[AppImage]]:
+        """Lazily iterate over all AppImages in fixed-size batches.
+
+        Args:
+            batch_size: Maximum number of AppImages per batch
+
+        Yields:
+            Lists of at most batch_size AppImages
+        """
+        yield from _batched(self.iter_all(), batch_size)
+
+    def find_by_display_name(self, display_name: str) -> List[AppImage]:
+        """Find AppImages by display name.
+
+        Args:
+            display_name: The display name to search for
+
+        Returns:
+            A list of matching AppImages
+        """
+        return [app for app in self.get_all() if app.display_name == display_name]
+
+    def find_by_version(self, version: str) -> List[AppImage]:
+        """Find AppImages by version.
+
+        Args:
+            version: The version to search for
+
+        Returns:
+            A list of matching AppImages
+        """
+        return [app for app in self.get_all() if app.version == version]
+
+    def find_older_than(self, version: str) -> List[AppImage]:
+        """Find AppImages whose version sorts before the given version.
+
+        The file backend has no index to range-scan, so this streams the
+        directory and compares parsed version keys.
+
+        Args:
+            version: The version to compare against
+
+        Returns:
+            A list of matching AppImages, oldest version first
+        """
+        threshold = version_sort_key(version)
+        keyed = []
+        for app in self.iter_all():
+            key = version_sort_key(app.version)
+            if key < threshold:
+                keyed.append((key, app))
+        keyed.sort(key=lambda item: item[0])
+        return [app for _, app in keyed]
+
+    def count(self) -> int:
+        """Count the number of AppImages in the repository.
+
+        Returns:
+            The number of AppImages
+        """
+        return len([f for f in os.listdir(self.storage_dir) if f.endswith(".json")])
 
+    def clear(self) -> None:
+        """Remove all AppImages from the repository."""
         for filename in os.listdir(self.storage_dir):
             if filename.endswith(".json"):
-                file_path = os.path.join(self.storage_dir, filename)
-                app_images.append(self._load_from_file(file_path))
+                os.remove(os.path.join(self.storage_dir, filename))
+
+
+# Append-only log repository implementation
+class LogAppImageRepository:
+    """Single-file, append-only log implementation of AppImageRepository.
+
+    This 'Concrete Repository' keeps every AppImage in one line-delimited
+    JSON log instead of one file per AppImage. Each write appends a record:
+
+        {"op": "put", "name": ..., "data": {...}, "last_updated": ...}
+        {"op": "del", "name": ...}
+
+    On open, the log is replayed once to build an in-memory offset index
+    (name -> byte offset and length of its latest "put" record). Reads seek
+    straight to that record, count() is a dictionary length, and get_all()
+    reads the whole catalog through a single open file handle.
+
+    Updates and removals leave superseded records behind. Once those make
+    up more than compaction_ratio of the log, a background thread rewrites
+    the live records into a fresh log and atomically swaps it in.
+    """
+
+    def __init__(
+        self,
+        log_path: str,
+        compaction_ratio: float = 0.5,
+        compaction_min_bytes: int = 64 * 1024,
+        background_compaction: bool = True,
+    ):
+        """Initialize with the log file path and open (or create) the log.
+
+        Args:
+            log_path: Path to the log file
+            compaction_ratio: Fraction of superseded bytes that triggers compaction
+            compaction_min_bytes: Logs smaller than this are never compacted
+            background_compaction: Compact on a background thread automatically
+        """
+        self.log_path = log_path
+        self.compaction_ratio = compaction_ratio
+        self.compaction_min_bytes = compaction_min_bytes
+        self.background_compaction = background_compaction
+
+        log_dir = os.path.dirname(self.log_path)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+
+        # name -> (offset, length) of the latest "put" record
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        # Sorted version keys for bisect-based find_older_than range queries
+        self._versions = _VersionIndex()
+        self._dead_bytes = 0
+        self._size = 0
+
+        # Guards the offset index and both file handles
+        self._lock = threading.RLock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        # Held for the whole of a compaction, so only one runs at a time
+        self._compaction_lock = threading.Lock()
+        # Bumped by clear() and compaction so a stale compaction can bail out
+        self._generation = 0
+
+        self._load_index()
+        self._open_handles()
+
+    def _open_handles(self) -> None:
+        """Open the shared append and read handles on the current log file."""
+        self._writer = open(self.log_path, "ab")
+        self._reader = open(self.log_path, "rb")
+
+    def _close_handles(self) -> None:
+        """Close the shared append and read handles."""
+        self._writer.close()
+        self._reader.close()
+
+    def _load_index(self) -> None:
+        """Replay the log once to build the offset index.
+
+        A torn final record (e.g., from a crash mid-write) is truncated away.
+        """
+        if not os.path.exists(self.log_path):
+            open(self.log_path, "wb").close()
+            return
+
+        offset = 0
+        with open(self.log_path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete record")
+                    record = json.loads(line)
+                except ValueError:
+                    print(f"Warning: truncating torn record at offset {offset}")
+                    break
+
+                self._apply(record, offset, len(line))
+                offset += len(line)
+
+        if offset != os.path.getsize(self.log_path):
+            os.truncate(self.log_path, offset)
+        self._size = offset
+
+    def _apply(self, record: Dict[str, Any], offset: int, length: int) -> None:
+        """Apply one log record to the offset index.
+
+        Args:
+            record: The decoded log record
+            offset: Byte offset of the record in the log
+            length: Length of the record in bytes
+        """
+        previous = self._offsets.pop(record["name"], None)
+        if previous:
+            self._dead_bytes += previous[1]
+
+        if record["op"] == "put":
+            self._offsets[record["name"]] = (offset, length)
+            self._versions.add(record["name"], record["data"]["version"])
+        else:
+            # Tombstones are dead as soon as they are written
+            self._dead_bytes += length
+            self._versions.remove(record["name"])
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append a record to the log and apply it to the index.
+
+        Args:
+            record: The record to append
+        """
+        self._append_many([record])
+
+    def _append_many(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the log with one write and apply them to the index.
+
+        Args:
+            records: The records to append
+        """
+        lines = [
+            json.dumps(record, separators=(",", ":")).encode() + b"\n"
+            for record in records
+        ]
+
+        with self._lock:
+            offset = self._size
+            self._writer.write(b"".join(lines))
+            self._writer.flush()
+            for record, line in zip(records, lines, strict=True):
+                self._apply(record, offset, len(line))
+                offset += len(line)
+            self._size = offset
+
+        if self.background_compaction and self._needs_compaction():
+            self._start_background_compaction()
+
+    def _read_record(self, offset: int, length: int) -> Dict[str, Any]:
+        """Read a single record by seeking straight to it.
+
+        Args:
+            offset: Byte offset of the record in the log
+            length: Length of the record in bytes
+
+        Returns:
+            The decoded record
+        """
+        self._reader.seek(offset)
+        return json.loads(self._reader.read(length))
+
+    def _record_from_app_image(self, app_image: AppImage) -> Dict[str, Any]:
+        """Build a "put" record for an AppImage.
+
+        Args:
+            app_image: The AppImage to serialize
+
+        Returns:
+            The log record
+        """
+        return {
+            "op": "put",
+            "name": app_image.name,
+            "data": asdict(app_image.data),
+            "last_updated": app_image.last_updated.isoformat()
+            if app_image.last_updated
+            else None,
+        }
+
+    def _app_image_from_record(self, record: Dict[str, Any]) -> AppImage:
+        """Create an AppImage from a "put" record.
+
+        Args:
+            record: The decoded log record
+
+        Returns:
+            An AppImage object
+        """
+        last_updated = (
+            datetime.fromisoformat(record["last_updated"])
+            if record["last_updated"]
+            else None
+        )
+        return AppImage(data=AppImageData(**record["data"]), last_updated=last_updated)
+
+    def _needs_compaction(self) -> bool:
+        """Check whether superseded records make up too much of the log.
+
+        Returns:
+            True if the log should be compacted
+        """
+        return (
+            self._size >= self.compaction_min_bytes
+            and self._dead_bytes > self._size * self.compaction_ratio
+        )
+
+    def _start_background_compaction(self) -> None:
+        """Start a compaction thread unless one is already running."""
+        with self._lock:
+            if self._compaction_thread and self._compaction_thread.is_alive():
+                return
+            self._compaction_thread = threading.Thread(
+                target=self.compact, name="appimage-log-compaction", daemon=True
+            )
+            self._compaction_thread.start()
+
+    def compact(self) -> None:
+        """Rewrite the log so it only contains the live records.
+
+        The bulk of the copy runs without holding the lock: records below the
+        snapshot point never change in an append-only log. Only the tail
+        written during the copy is transferred under the lock, right before
+        the new log atomically replaces the old one.
+
+        Compactions are serialized: a call made while another one runs (e.g.
+        the background compactor) waits for it, then compacts what is left.
+        """
+        with self._compaction_lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the log; must be called with the compaction lock held."""
+        with self._lock:
+            generation = self._generation
+            snapshot_end = self._size
+            snapshot = dict(self._offsets)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.log_path) or ".",
+            prefix=f"{os.path.basename(self.log_path)}.",
+            suffix=".compact",
+        )
+        try:
+            # mkstemp() creates owner-only files; keep the log's permissions
+            os.fchmod(fd, os.stat(self.log_path).st_mode & 0o7777)
+            self._copy_live_records(generation, snapshot_end, snapshot, fd, tmp_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _copy_live_records(
+        self,
+        generation: int,
+        snapshot_end: int,
+        snapshot: Dict[str, Tuple[int, int]],
+        fd: int,
+        tmp_path: str,
+    ) -> None:
+        """Copy the live records into a new log and swap it in.
+
+        Args:
+            generation: The generation the snapshot was taken at
+            snapshot_end: Size of the log when the snapshot was taken
+            snapshot: The offset index at that point
+            fd: Open descriptor of the new log
+            tmp_path: Path of the new log
+        """
+        new_offsets: Dict[str, Tuple[int, int]] = {}
+        position = 0
+
+        with os.fdopen(fd, "wb") as dst, open(self.log_path, "rb") as src:
+            for name, (offset, length) in sorted(
+                snapshot.items(), key=lambda item: item[1][0]
+            ):
+                src.seek(offset)
+                dst.write(src.read(length))
+                new_offsets[name] = (position, length)
+                position += length
+
+            with self._lock:
+                if generation != self._generation:
+                    # clear() ran meanwhile; the caller removes the new log
+                    return
+
+                # Copy whatever was appended while we were copying
+                src.seek(snapshot_end)
+                tail = src.read(self._size - snapshot_end)
+                dst.write(tail)
+                dst.flush()
+                os.fsync(dst.fileno())
+
+                offsets = {}
+                for name, (offset, length) in self._offsets.items():
+                    if offset >= snapshot_end:
+                        offsets[name] = (position + offset - snapshot_end, length)
+                    else:
+                        offsets[name] = new_offsets[name]
+
+                self._close_handles()
+                os.replace(tmp_path, self.log_path)
+                self._offsets = offsets
+                self._size = position + len(tail)
+                self._dead_bytes = self._size - sum(
+                    length for _, length in offsets.values()
+                )
+                self._generation += 1
+                self._open_handles()
+
+    def close(self) -> None:
+        """Wait for a running compaction and close the log file."""
+        thread = self._compaction_thread
+        if thread:
+            thread.join()
+        with self._lock:
+            self._close_handles()
+
+    def add(self, app_image: AppImage) -> None:
+        """Add an AppImage to the repository.
+
+        Args:
+            app_image: The AppImage to store
+        """
+        with self._lock:
+            if app_image.name in self._offsets:
+                raise KeyError(f"AppImage with name '{app_image.name}' already exists")
+
+            self._append(self._record_from_app_image(app_image))
+
+    def update(self, app_image: AppImage) -> None:
+        """Update an existing AppImage by appending its new state.
+
+        Args:
+            app_image: The AppImage with updated data
+        """
+        with self._lock:
+            if app_image.name not in self._offsets:
+                raise KeyError(f"AppImage with name '{app_image.name}' not found")
+
+            # Update last_updated timestamp
+            app_image.last_updated = datetime.now()
+
+            self._append(self._record_from_app_image(app_image))
+
+    def remove(self, name: str) -> None:
+        """Remove an AppImage by appending a tombstone record.
+
+        Args:
+            name: The name of the AppImage to remove
+        """
+        with self._lock:
+            if name not in self._offsets:
+                raise KeyError(f"AppImage with name '{name}' not found")
+
+            self._append({"op": "del", "name": name})
+
+    def add_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add several AppImages with a single write to the log.
+
+        Nothing is appended if any of the AppImages already exists.
+
+        Args:
+            app_images: The AppImages to store
+        """
+        app_images = list(app_images)
+        _check_unique(app_images)
+        with self._lock:
+            for app_image in app_images:
+                if app_image.name in self._offsets:
+                    raise KeyError(
+                        f"AppImage with name '{app_image.name}' already exists"
+                    )
+
+            self._append_many(
+                [self._record_from_app_image(app) for app in app_images]
+            )
+
+    def update_many(self, app_images: Iterable[AppImage]) -> None:
+        """Update several existing AppImages with a single write to the log.
+
+        Nothing is appended if any of the AppImages is missing.
+
+        Args:
+            app_images: The AppImages with updated data
+        """
+        app_images = list(app_images)
+        with self._lock:
+            for app_image in app_images:
+                if app_image.name not in self._offsets:
+                    raise KeyError(f"AppImage with name '{app_image.name}' not found")
+
+            last_updated = datetime.now()
+            for app_image in app_images:
+                app_image.last_updated = last_updated
+
+            self._append_many(
+                [self._record_from_app_image(app) for app in app_images]
+            )
+
+    def upsert_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add new AppImages and update existing ones with a single write.
+
+        Args:
+            app_images: The AppImages to store or update
+        """
+        app_images = list(app_images)
+        with self._lock:
+            last_updated = datetime.now()
+            for app_image in app_images:
+                if app_image.name in self._offsets:
+                    app_image.last_updated = last_updated
+
+            self._append_many(
+                [self._record_from_app_image(app) for app in app_images]
+            )
+
+    def remove_many(self, names: Iterable[str]) -> None:
+        """Remove several AppImages with a single write of tombstones.
+
+        Nothing is appended if any of the names is missing.
+
+        Args:
+            names: The names of the AppImages to remove
+        """
+        names = list(dict.fromkeys(names))
+        with self._lock:
+            for name in names:
+                if name not in self._offsets:
+                    raise KeyError(f"AppImage with name '{name}' not found")
+
+            self._append_many([{"op": "del", "name": name} for name in names])
+
+    def get_by_name(self, name: str) -> Optional[AppImage]:
+        """Get an AppImage by its name.
+
+        Args:
+            name: The name of the AppImage to retrieve
+
+        Returns:
+            The AppImage if found, None otherwise
+        """
+        with self._lock:
+            location = self._offsets.get(name)
+            if not location:
+                return None
+
+            return self._app_image_from_record(self._read_record(*location))
+
+    def get_all(self) -> List[AppImage]:
+        """Get all AppImages in the repository.
+
+        Records are read in log order through the shared read handle, so this
+        costs one seek per AppImage instead of one open() per AppImage.
+
+        Returns:
+            A list of all AppImages
+        """
+        with self._lock:
+            locations = sorted(self._offsets.values())
+            return [
+                self._app_image_from_record(self._read_record(offset, length))
+                for offset, length in locations
+            ]
+
+    def iter_all(self) -> Iterator[AppImage]:
+        """Lazily iterate over a snapshot of all AppImages in the repository.
+
+        The iterator gets its own handle on the current log file. Compaction
+        and clear() swap in a new file instead of modifying this one, so the
+        snapshot offsets stay valid without holding the lock between records.
+
+        Yields:
+            Each AppImage stored when iteration started
+        """
+        with self._lock:
+            locations = sorted(self._offsets.values())
+            reader = open(self.log_path, "rb")
+
+        with reader:
+            for offset, length in locations:
+                reader.seek(offset)
+                yield self._app_image_from_record(json.loads(reader.read(length)))
+
+    def scan(
+        self, batch_size: int = DEFAULT_SCAN_BATCH_SIZE
+    ) -> Iterator[List[AppImage]]:
+        """Lazily iterate over all AppImages in fixed-size batches.
 
-        return app_images
+        Args:
+            batch_size: Maximum number of AppImages per batch
+
+        Yields:
+            Lists of at most batch_size AppImages
+        """
+        yield from _batched(self.iter_all(), batch_size)
 
     def find_by_display_name(self, display_name: str) -> List[AppImage]:
         """Find AppImages by display name.
@@ -442,340 +1808,1283 @@ class FileAppImageRepository:
         Returns:
             A list of matching AppImages
         """
-        return [app for app in self.get_all() if app.display_name == display_name]
+        return [app for app in self.get_all() if app.display_name == display_name]
+
+    def find_by_version(self, version: str) -> List[AppImage]:
+        """Find AppImages by version.
+
+        Args:
+            version: The version to search for
+
+        Returns:
+            A list of matching AppImages
+        """
+        return [app for app in self.get_all() if app.version == version]
+
+    def find_older_than(self, version: str) -> List[AppImage]:
+        """Find AppImages whose version sorts before the given version.
+
+        Bisects the in-memory version index built alongside the offset index,
+        then reads only the matching records.
+
+        Args:
+            version: The version to compare against
+
+        Returns:
+            A list of matching AppImages, oldest version first
+        """
+        with self._lock:
+            return [
+                self._app_image_from_record(self._read_record(*self._offsets[name]))
+                for name in self._versions.older_than(version)
+            ]
+
+    def count(self) -> int:
+        """Count the number of AppImages in the repository.
+
+        Returns:
+            The number of AppImages
+        """
+        return len(self._offsets)
+
+    def clear(self) -> None:
+        """Remove all AppImages from the repository by swapping in an empty log.
+
+        The empty log replaces the old file instead of truncating it, so
+        iterators that still hold a handle on the old file are unaffected.
+        """
+        with self._lock:
+            self._close_handles()
+            tmp_path = f"{self.log_path}.clear"
+            open(tmp_path, "wb").close()
+            os.replace(tmp_path, self.log_path)
+            self._offsets.clear()
+            self._versions.clear()
+            self._dead_bytes = 0
+            self._size = 0
+            self._generation += 1
+            self._open_handles()
+
+
+# SQLite repository implementation
+class SQLiteAppImageRepository:
+    """SQLite implementation of AppImageRepository.
+
+    This 'Concrete Repository' implements the AppImageRepository interface
+    using a SQLite database for storage. This demonstrates how the Repository
+    Pattern can use relational databases while keeping the domain code
+    database-agnostic.
+
+    By default every method opens and closes its own connection. With
+    persistent=True the repository keeps one long-lived connection in WAL
+    mode instead, so repeated calls skip connection setup and reuse the
+    statements sqlite3 caches per connection. transaction() groups several
+    operations into a single connection and a single commit.
+    """
+
+    # Explicit column list so row unpacking doesn't depend on table layout
+    _SELECT = """
+        SELECT name, arch_keyword, download_url, sha_download_url, version,
+               display_name, sha_file_name, owner, repo, last_updated
+        FROM app_images
+    """
+
+    _INSERT = """
+        INSERT INTO app_images
+        (name, arch_keyword, download_url, sha_download_url, version,
+         version_key, display_name, sha_file_name, owner, repo, last_updated)
+        VALUES (:name, :arch_keyword, :download_url, :sha_download_url, :version,
+                :version_key, :display_name, :sha_file_name, :owner, :repo,
+                :last_updated)
+    """
+
+    _UPDATE = """
+        UPDATE app_images
+        SET arch_keyword = :arch_keyword, download_url = :download_url,
+            sha_download_url = :sha_download_url, version = :version,
+            version_key = :version_key, display_name = :display_name,
+            sha_file_name = :sha_file_name, owner = :owner, repo = :repo,
+            last_updated = :last_updated
+        WHERE name = :name
+    """
+
+    def __init__(self, db_path: str, persistent: bool = False):
+        """Initialize with the database file path.
+
+        Args:
+            db_path: Path to the SQLite database file
+            persistent: Keep one long-lived WAL connection instead of
+                connecting on every call
+        """
+        self.db_path = db_path
+        self.persistent = persistent
+
+        # Serializes access to the shared connection across threads
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Connection owned by the currently open transaction(), if any
+        self._transaction_conn: Optional[sqlite3.Connection] = None
+
+        if self.persistent:
+            self._conn = self._open_connection()
+
+        # Initialize database and tables
+        self._init_db()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new database connection.
+
+        Returns:
+            The new connection
+        """
+        if not self.persistent:
+            return sqlite3.connect(self.db_path)
+
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL lets readers run alongside a writer, and synchronous=NORMAL only
+        # fsyncs at checkpoints instead of on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _cursor(self, commit: bool = False) -> Iterator[sqlite3.Cursor]:
+        """Provide a cursor on the right connection for the current call.
+
+        Inside transaction() the transaction's connection is reused and the
+        commit is left to the transaction. Otherwise the persistent connection
+        (or a fresh one) is used and committed when commit is True.
+
+        Args:
+            commit: Whether to commit once the block finishes
+
+        Yields:
+            A database cursor
+        """
+        with self._lock:
+            if self._transaction_conn is not None:
+                yield self._transaction_conn.cursor()
+                return
+
+            conn = self._conn or self._open_connection()
+            try:
+                yield conn.cursor()
+                if commit:
+                    conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                if conn is not self._conn:
+                    conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator["SQLiteAppImageRepository"]:
+        """Run a batch of operations on one connection with one commit.
+
+        All repository calls made inside the block share a connection and are
+        committed together when the block exits, or rolled back if it raises.
+        Nested transaction() blocks join the outermost one.
+
+        Example:
+            with repo.transaction():
+                for app_image in app_images:
+                    repo.update(app_image)
+
+        Yields:
+            This repository
+        """
+        with self._lock:
+            if self._transaction_conn is not None:
+                yield self
+                return
+
+            conn = self._conn or self._open_connection()
+            self._transaction_conn = conn
+            try:
+                yield self
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._transaction_conn = None
+                if conn is not self._conn:
+                    conn.close()
+
+    def close(self) -> None:
+        """Close the persistent connection, if one is open."""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def _init_db(self):
+        """Initialize the database schema."""
+        with self._cursor(commit=True) as cursor:
+            # Create AppImages table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS app_images (
+                    name TEXT PRIMARY KEY,
+                    arch_keyword TEXT NOT NULL,
+                    download_url TEXT NOT NULL,
+                    sha_download_url TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    version_key TEXT,
+                    display_name TEXT NOT NULL,
+                    sha_file_name TEXT NOT NULL,
+                    owner TEXT,
+                    repo TEXT,
+                    last_updated TEXT
+                )
+            """)
+
+            # Back the find_by_* queries with real indexes instead of table scans
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_app_images_display_name
+                ON app_images (display_name)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_app_images_version
+                ON app_images (version)
+            """)
+
+            # Databases created before version_key existed need the column
+            # added and filled in before it can be indexed and queried
+            cursor.execute("PRAGMA table_info(app_images)")
+            if "version_key" not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE app_images ADD COLUMN version_key TEXT")
+            cursor.execute(
+                "SELECT name, version FROM app_images WHERE version_key IS NULL"
+            )
+            cursor.executemany(
+                "UPDATE app_images SET version_key = ? WHERE name = ?",
+                [
+                    (version_sort_key(version), name)
+                    for name, version in cursor.fetchall()
+                ],
+            )
+
+            # Range index for find_older_than
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_app_images_version_key
+                ON app_images (version_key)
+            """)
+
+    def _app_image_from_row(self, row) -> AppImage:
+        """Create an AppImage from a database row.
+
+        Args:
+            row: Database row tuple
+
+        Returns:
+            An AppImage object
+        """
+        (
+            name,
+            arch_keyword,
+            download_url,
+            sha_download_url,
+            version,
+            display_name,
+            sha_file_name,
+            owner,
+            repo,
+            last_updated_str,
+        ) = row
+
+        app_data = AppImageData(
+            name=name,
+            arch_keyword=arch_keyword,
+            download_url=download_url,
+            sha_download_url=sha_download_url,
+            version=version,
+            display_name=display_name,
+            sha_file_name=sha_file_name,
+            owner=owner or "",
+            repo=repo or "",
+        )
+
+        last_updated = (
+            datetime.fromisoformat(last_updated_str) if last_updated_str else None
+        )
+
+        return AppImage(data=app_data, last_updated=last_updated)
+
+    def add(self, app_image: AppImage) -> None:
+        """Add an AppImage to the repository.
+
+        Args:
+            app_image: The AppImage to store
+        """
+        with self._cursor(commit=True) as cursor:
+            # Check if already exists
+            cursor.execute(
+                "SELECT name FROM app_images WHERE name = ?", (app_image.name,)
+            )
+            if cursor.fetchone():
+                raise KeyError(f"AppImage with name '{app_image.name}' already exists")
+
+            # Add new AppImage
+            cursor.execute(
+                self._INSERT, self._params(app_image, app_image.last_updated)
+            )
+
+    def update(self, app_image: AppImage) -> None:
+        """Update an existing AppImage in the repository.
+
+        Args:
+            app_image: The AppImage with updated data
+        """
+        with self._cursor(commit=True) as cursor:
+            # Check if exists
+            cursor.execute(
+                "SELECT name FROM app_images WHERE name = ?", (app_image.name,)
+            )
+            if not cursor.fetchone():
+                raise KeyError(f"AppImage with name '{app_image.name}' not found")
+
+            # Update last_updated timestamp
+            last_updated = datetime.now()
+            app_image.last_updated = last_updated
+
+            # Update AppImage
+            cursor.execute(self._UPDATE, self._params(app_image, last_updated))
+
+    def remove(self, name: str) -> None:
+        """Remove an AppImage from the repository.
+
+        Args:
+            name: The name of the AppImage to remove
+        """
+        with self._cursor(commit=True) as cursor:
+            # Check if exists
+            cursor.execute("SELECT name FROM app_images WHERE name = ?", (name,))
+            if not cursor.fetchone():
+                raise KeyError(f"AppImage with name '{name}' not found")
+
+            # Remove AppImage
+            cursor.execute("DELETE FROM app_images WHERE name = ?", (name,))
+
+    # Stay well below SQLite's limit on bound parameters per statement
+    _IN_CHUNK_SIZE = 500
+
+    def _params(self, app_image: AppImage, last_updated: Optional[datetime]):
+        """Build the named parameters for writing an AppImage row.
+
+        Args:
+            app_image: The AppImage to write
+            last_updated: The timestamp to store
+
+        Returns:
+            Dictionary of named statement parameters
+        """
+        return {
+            **asdict(app_image.data),
+            "name": app_image.name,
+            "version_key": version_sort_key(app_image.data.version),
+            "last_updated": last_updated.isoformat() if last_updated else None,
+        }
+
+    def _existing_names(self, cursor: sqlite3.Cursor, names: List[str]) -> Set[str]:
+        """Find which of the given names are already stored.
+
+        Args:
+            cursor: The cursor to query with
+            names: The names to look for
+
+        Returns:
+            The subset of names that exist in the table
+        """
+        existing = set()
+        for start in range(0, len(names), self._IN_CHUNK_SIZE):
+            chunk = names[start : start + self._IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT name FROM app_images WHERE name IN ({placeholders})", chunk
+            )
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
+    def add_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add several AppImages with one executemany in one transaction.
+
+        Nothing is stored if any of the AppImages already exists.
+
+        Args:
+            app_images: The AppImages to store
+        """
+        app_images = list(app_images)
+        _check_unique(app_images)
+        with self._cursor(commit=True) as cursor:
+            existing = self._existing_names(cursor, [app.name for app in app_images])
+            if existing:
+                raise KeyError(
+                    f"AppImage with name '{sorted(existing)[0]}' already exists"
+                )
+
+            cursor.executemany(
+                self._INSERT,
+                [self._params(app, app.last_updated) for app in app_images],
+            )
+
+    def update_many(self, app_images: Iterable[AppImage]) -> None:
+        """Update several AppImages with one executemany in one transaction.
+
+        Nothing is updated if any of the AppImages is missing.
+
+        Args:
+            app_images: The AppImages with updated data
+        """
+        app_images = list(app_images)
+        names = list(dict.fromkeys(app.name for app in app_images))
+        with self._cursor(commit=True) as cursor:
+            existing = self._existing_names(cursor, names)
+            missing = [name for name in names if name not in existing]
+            if missing:
+                raise KeyError(f"AppImage with name '{missing[0]}' not found")
+
+            last_updated = datetime.now()
+            for app_image in app_images:
+                app_image.last_updated = last_updated
+            cursor.executemany(
+                self._UPDATE,
+                [self._params(app, last_updated) for app in app_images],
+            )
+
+    def upsert_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add or update several AppImages with one executemany.
+
+        New rows keep the AppImage's own timestamp, existing rows get the
+        current time, just like add() and update().
+
+        Args:
+            app_images: The AppImages to store or update
+        """
+        app_images = list(app_images)
+        last_updated = datetime.now()
+        with self._cursor(commit=True) as cursor:
+            # Stamp the existing rows' objects too, like the other backends do
+            existing = self._existing_names(
+                cursor, list(dict.fromkeys(app.name for app in app_images))
+            )
+            for app_image in app_images:
+                if app_image.name in existing:
+                    app_image.last_updated = last_updated
+            cursor.executemany(
+                f"""
+                {self._INSERT}
+                ON CONFLICT (name) DO UPDATE
+                SET arch_keyword = excluded.arch_keyword,
+                    download_url = excluded.download_url,
+                    sha_download_url = excluded.sha_download_url,
+                    version = excluded.version,
+                    version_key = excluded.version_key,
+                    display_name = excluded.display_name,
+                    sha_file_name = excluded.sha_file_name,
+                    owner = excluded.owner,
+                    repo = excluded.repo,
+                    last_updated = :now
+            """,
+                [
+                    {
+                        **self._params(app, app.last_updated),
+                        "now": last_updated.isoformat(),
+                    }
+                    for app in app_images
+                ],
+            )
+
+    def remove_many(self, names: Iterable[str]) -> None:
+        """Remove several AppImages with one executemany in one transaction.
+
+        Nothing is removed if any of the names is missing.
+
+        Args:
+            names: The names of the AppImages to remove
+        """
+        names = list(dict.fromkeys(names))
+        with self._cursor(commit=True) as cursor:
+            existing = self._existing_names(cursor, names)
+            missing = [name for name in names if name not in existing]
+            if missing:
+                raise KeyError(f"AppImage with name '{missing[0]}' not found")
+
+            cursor.executemany(
+                "DELETE FROM app_images WHERE name = ?", [(name,) for name in names]
+            )
+
+    def get_by_name(self, name: str) -> Optional[AppImage]:
+        """Get an AppImage by its name.
+
+        Args:
+            name: The name of the AppImage to retrieve
+
+        Returns:
+            The AppImage if found, None otherwise
+        """
+        with self._cursor() as cursor:
+            cursor.execute(f"{self._SELECT} WHERE name = ?", (name,))
+            row = cursor.fetchone()
+
+            if not row:
+                return None
+
+            return self._app_image_from_row(row)
+
+    def get_all(self) -> List[AppImage]:
+        """Get all AppImages in the repository.
+
+        Returns:
+            A list of all AppImages
+        """
+        with self._cursor() as cursor:
+            cursor.execute(self._SELECT)
+            rows = cursor.fetchall()
+
+            return [self._app_image_from_row(row) for row in rows]
+
+    def iter_all(self) -> Iterator[AppImage]:
+        """Lazily iterate over all AppImages in the repository.
+
+        Yields:
+            Each stored AppImage
+        """
+        for batch in self.scan():
+            yield from batch
+
+    def scan(
+        self, batch_size: int = DEFAULT_SCAN_BATCH_SIZE
+    ) -> Iterator[List[AppImage]]:
+        """Lazily iterate over all AppImages in fixed-size batches.
+
+        Uses keyset pagination on the primary key: each batch is a separate
+        short query, so no cursor or lock is held while the caller processes
+        a batch, and memory stays bounded by batch_size.
+
+        Args:
+            batch_size: Maximum number of AppImages per batch
+
+        Yields:
+            Lists of at most batch_size AppImages, ordered by name
+        """
+        last_name = None
+        while True:
+            with self._cursor() as cursor:
+                if last_name is None:
+                    cursor.execute(
+                        f"{self._SELECT} ORDER BY name LIMIT ?", (batch_size,)
+                    )
+                else:
+                    cursor.execute(
+                        f"{self._SELECT} WHERE name > ? ORDER BY name LIMIT ?",
+                        (last_name, batch_size),
+                    )
+                rows = cursor.fetchall()
+
+            if not rows:
+                return
+
+            yield [self._app_image_from_row(row) for row in rows]
+            last_name = rows[-1][0]
+
+    def find_by_display_name(self, display_name: str) -> List[AppImage]:
+        """Find AppImages by display name.
+
+        Args:
+            display_name: The display name to search for
+
+        Returns:
+            A list of matching AppImages
+        """
+        with self._cursor() as cursor:
+            cursor.execute(f"{self._SELECT} WHERE display_name = ?", (display_name,))
+            rows = cursor.fetchall()
+
+            return [self._app_image_from_row(row) for row in rows]
+
+    def find_by_version(self, version: str) -> List[AppImage]:
+        """Find AppImages by version.
+
+        Args:
+            version: The version to search for
+
+        Returns:
+            A list of matching AppImages
+        """
+        with self._cursor() as cursor:
+            cursor.execute(f"{self._SELECT} WHERE version = ?", (version,))
+            rows = cursor.fetchall()
+
+            return [self._app_image_from_row(row) for row in rows]
+
+    def find_older_than(self, version: str) -> List[AppImage]:
+        """Find AppImages whose version sorts before the given version.
+
+        Runs as a range scan on the version_key index.
+
+        Args:
+            version: The version to compare against
+
+        Returns:
+            A list of matching AppImages, oldest version first
+        """
+        with self._cursor() as cursor:
+            cursor.execute(
+                f"{self._SELECT} WHERE version_key < ? ORDER BY version_key",
+                (version_sort_key(version),),
+            )
+            rows = cursor.fetchall()
+
+            return [self._app_image_from_row(row) for row in rows]
+
+    def count(self) -> int:
+        """Count the number of AppImages in the repository.
+
+        Returns:
+            The number of AppImages
+        """
+        with self._cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM app_images")
+            return cursor.fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all AppImages from the repository."""
+        with self._cursor(commit=True) as cursor:
+            cursor.execute("DELETE FROM app_images")
+
+
+# Caching repository wrapper
+class CachingAppImageRepository:
+    """Read-through caching wrapper around any AppImageRepository.
+
+    This wrapper implements the same AppImageRepository interface and
+    delegates to another repository, so it can be put in front of the
+    SQLite, file or log backends without the domain code noticing. It
+    combines the Repository Pattern with the Decorator Pattern.
+
+    get_by_name, find_by_version and count are served from a bounded LRU
+    cache whose entries also expire after ttl_seconds. Every write through
+    the wrapper invalidates the entries it could have made stale. Writes
+    that bypass the wrapper (e.g. another process) are only picked up once
+    the TTL expires.
+
+    Note:
+        Cached AppImages are shared objects. Callers that mutate one must
+        write it back with update(), as they would with the in-memory backend.
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        max_size: int = 1024,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize with the repository to wrap and the cache limits.
+
+        Args:
+            repository: Any class implementing AppImageRepository protocol
+            max_size: Maximum number of cached entries before LRU eviction
+            ttl_seconds: Time after which a cached entry expires
+            clock: Monotonic time source, replaceable for testing
+        """
+        self._repository = repository
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+        # (query, argument) -> (expires_at, value), least recently used first
+        self._cache: "OrderedDict[Tuple[str, Any], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so a load that raced with a write
+        # doesn't put a stale value back into the cache
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __getattr__(self, name):
+        """Forward anything not handled here (e.g. close) to the wrapped repository.
+
+        Args:
+            name: The name of the attribute to access
+
+        Returns:
+            The attribute from the wrapped repository
+        """
+        return getattr(self._repository, name)
+
+    def _cached(self, key: Tuple[str, Any], load: Callable[[], Any]) -> Any:
+        """Return a cached value, loading and caching it on a miss.
+
+        Args:
+            key: The cache key
+            load: Function that reads the value from the wrapped repository
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        now = self._clock()
+        with self._lock:
+            generation = self._generation
+            entry = self._cache.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._cache[key]
+                self.expirations += 1
+            self.misses += 1
+
+        # Load outside the lock so slow backends don't serialize all readers
+        value = load()
+
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._cache[key] = (now + self.ttl_seconds, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def _invalidate(self, names: Iterable[str], count_changed: bool) -> None:
+        """Drop the cache entries a write to the given AppImages may have staled.
+
+        An AppImage's old version isn't known here, so every cached
+        find_by_version result is dropped, not just the new version's.
+
+        Args:
+            names: Names of the AppImages that were written
+            count_changed: Whether the write changed the number of AppImages
+        """
+        with self._lock:
+            self._generation += 1
+            for name in names:
+                self._cache.pop(("get_by_name", name), None)
+            for key in [key for key in self._cache if key[0] == "find_by_version"]:
+                del self._cache[key]
+            if count_changed:
+                self._cache.pop(("count", None), None)
+
+    def invalidate_all(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics about cache usage.
+
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._cache),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    @contextmanager
+    def transaction(self) -> Iterator["CachingAppImageRepository"]:
+        """Run the wrapped repository's transaction() through the cache.
+
+        Writes inside the block still go through this wrapper, so they keep
+        invalidating the cache. Reads inside the block may cache uncommitted
+        data, so the whole cache is dropped if the transaction rolls back.
+
+        Yields:
+            This repository
+        """
+        try:
+            with self._repository.transaction():
+                yield self
+        except BaseException:
+            self.invalidate_all()
+            raise
+
+    def add(self, app_image: AppImage) -> None:
+        """Add an AppImage and invalidate the affected cache entries.
+
+        Args:
+            app_image: The AppImage to store
+        """
+        self._repository.add(app_image)
+        self._invalidate([app_image.name], count_changed=True)
+
+    def update(self, app_image: AppImage) -> None:
+        """Update an AppImage and invalidate the affected cache entries.
+
+        Args:
+            app_image: The AppImage with updated data
+        """
+        self._repository.update(app_image)
+        self._invalidate([app_image.name], count_changed=False)
+
+    def remove(self, name: str) -> None:
+        """Remove an AppImage and invalidate the affected cache entries.
+
+        Args:
+            name: The name of the AppImage to remove
+        """
+        self._repository.remove(name)
+        self._invalidate([name], count_changed=True)
+
+    def add_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add several AppImages and invalidate the affected cache entries.
+
+        Args:
+            app_images: The AppImages to store
+        """
+        app_images = list(app_images)
+        self._repository.add_many(app_images)
+        self._invalidate([app.name for app in app_images], count_changed=True)
+
+    def update_many(self, app_images: Iterable[AppImage]) -> None:
+        """Update several AppImages and invalidate the affected cache entries.
+
+        Args:
+            app_images: The AppImages with updated data
+        """
+        app_images = list(app_images)
+        self._repository.update_many(app_images)
+        self._invalidate([app.name for app in app_images], count_changed=False)
+
+    def upsert_many(self, app_images: Iterable[AppImage]) -> None:
+        """Upsert several AppImages and invalidate the affected cache entries.
+
+        Args:
+            app_images: The AppImages to store or update
+        """
+        app_images = list(app_images)
+        self._repository.upsert_many(app_images)
+        self._invalidate([app.name for app in app_images], count_changed=True)
+
+    def remove_many(self, names: Iterable[str]) -> None:
+        """Remove several AppImages and invalidate the affected cache entries.
+
+        Args:
+            names: The names of the AppImages to remove
+        """
+        names = list(names)
+        self._repository.remove_many(names)
+        self._invalidate(names, count_changed=True)
+
+    def get_by_name(self, name: str) -> Optional[AppImage]:
+        """Get an AppImage by its name, from the cache when possible.
+
+        Args:
+            name: The name of the AppImage to retrieve
+
+        Returns:
+            The AppImage if found, None otherwise
+        """
+        return self._cached(
+            ("get_by_name", name), lambda: self._repository.get_by_name(name)
+        )
+
+    def get_all(self) -> List[AppImage]:
+        """Get all AppImages from the wrapped repository (not cached).
+
+        Returns:
+            A list of all AppImages
+        """
+        return self._repository.get_all()
+
+    def iter_all(self) -> Iterator[AppImage]:
+        """Lazily iterate over the wrapped repository (not cached).
+
+        Yields:
+            Each stored AppImage
+        """
+        return self._repository.iter_all()
+
+    def scan(
+        self, batch_size: int = DEFAULT_SCAN_BATCH_SIZE
+    ) -> Iterator[List[AppImage]]:
+        """Lazily iterate over the wrapped repository in batches (not cached).
+
+        Args:
+            batch_size: Maximum number of AppImages per batch
+
+        Yields:
+            Lists of at most batch_size AppImages
+        """
+        return self._repository.scan(batch_size)
+
+    def find_by_display_name(self, display_name: str) -> List[AppImage]:
+        """Find AppImages by display name (not cached).
+
+        Args:
+            display_name: The display name to search for
+
+        Returns:
+            A list of matching AppImages
+        """
+        return self._repository.find_by_display_name(display_name)
+
+    def find_by_version(self, version: str) -> List[AppImage]:
+        """Find AppImages by version, from the cache when possible.
+
+        Args:
+            version: The version to search for
+
+        Returns:
+            A list of matching AppImages
+        """
+        # Copy the cached list so callers can't modify the cache entry
+        return list(
+            self._cached(
+                ("find_by_version", version),
+                lambda: self._repository.find_by_version(version),
+            )
+        )
 
-    def find_by_version(self, version: str) -> List[AppImage]:
-        """Find AppImages by version.
+    def find_older_than(self, version: str) -> List[AppImage]:
+        """Find AppImages older than the given version (not cached).
 
         Args:
-            version: The version to search for
+            version: The version to compare against
 
         Returns:
-            A list of matching AppImages
+            A list of matching AppImages, oldest version first
         """
-        return [app for app in self.get_all() if app.version == version]
+        return self._repository.find_older_than(version)
 
     def count(self) -> int:
-        """Count the number of AppImages in the repository.
+        """Count the number of AppImages, from the cache when possible.
 
         Returns:
             The number of AppImages
         """
-        return len([f for f in os.listdir(self.storage_dir) if f.endswith(".json")])
+        return self._cached(("count", None), self._repository.count)
 
     def clear(self) -> None:
-        """Remove all AppImages from the repository."""
-        for filename in os.listdir(self.storage_dir):
-            if filename.endswith(".json"):
-                os.remove(os.path.join(self.storage_dir, filename))
+        """Remove all AppImages and drop the whole cache."""
+        self._repository.clear()
+        self.invalidate_all()
 
 
-# SQLite repository implementation
-class SQLiteAppImageRepository:
-    """SQLite implementation of AppImageRepository.
+# Dual-writing repository used while migrating between backends
+class MigratingAppImageRepository:
+    """Repository that serves a live migration from one backend to another.
 
-    This 'Concrete Repository' implements the AppImageRepository interface
-    using a SQLite database for storage. This demonstrates how the Repository
-    Pattern can use relational databases while keeping the domain code
-    database-agnostic.
+    While AppImageService.change_repository(..., migrate=True) copies records
+    in the background of normal traffic, the service talks to this wrapper:
+
+    * Reads are served by the source repository, which stays complete for
+      the whole migration.
+    * Writes go to the source first and are then mirrored to the target.
+      Upserts are used on the target because the record may not have been
+      copied yet.
+
+    Every name written during the migration is remembered, so a batch that
+    was read from the source before the write can't overwrite the newer
+    mirrored copy on the target.
     """
 
-    def __init__(self, db_path: str):
-        """Initialize with the database file path.
+    def __init__(self, source: Any, target: Any):
+        """Initialize with the repository being migrated from and to.
 
         Args:
-            db_path: Path to the SQLite database file
+            source: The repository holding the data today
+            target: The repository the data is moving to
         """
-        self.db_path = db_path
-
-        # Initialize database and tables
-        self._init_db()
-
-    def _init_db(self):
-        """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Create AppImages table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS app_images (
-                name TEXT PRIMARY KEY,
-                arch_keyword TEXT NOT NULL,
-                download_url TEXT NOT NULL,
-                sha_download_url TEXT NOT NULL,
-                version TEXT NOT NULL,
-                display_name TEXT NOT NULL,
-                sha_file_name TEXT NOT NULL,
-                owner TEXT,
-                repo TEXT,
-                last_updated TEXT
-            )
-        """)
+        self.source = source
+        self.target = target
 
-        conn.commit()
-        conn.close()
+        # Serializes mirrored writes against copied batches
+        self._lock = threading.RLock()
+        # Names written through this wrapper since the migration started
+        self._written: Set[str] = set()
+        # After clear() nothing read from the source earlier may be copied
+        self._cleared = False
 
-    def _app_image_from_row(self, row) -> AppImage:
-        """Create an AppImage from a database row.
+    def __getattr__(self, name):
+        """Serve reads (and anything else not handled here) from the source.
 
         Args:
-            row: Database row tuple
+            name: The name of the attribute to access
 
         Returns:
-            An AppImage object
+            The attribute from the source repository
         """
-        (
-            name,
-            arch_keyword,
-            download_url,
-            sha_download_url,
-            version,
-            display_name,
-            sha_file_name,
-            owner,
-            repo,
-            last_updated_str,
-        ) = row
+        return getattr(self.source, name)
 
-        app_data = AppImageData(
-            name=name,
-            arch_keyword=arch_keyword,
-            download_url=download_url,
-            sha_download_url=sha_download_url,
-            version=version,
-            display_name=display_name,
-            sha_file_name=sha_file_name,
-            owner=owner or "",
-            repo=repo or "",
-        )
+    @contextmanager
+    def writes_paused(self) -> Iterator["MigratingAppImageRepository"]:
+        """Hold back writes through this wrapper for the duration of the block.
 
-        last_updated = (
-            datetime.fromisoformat(last_updated_str) if last_updated_str else None
-        )
+        Used to switch clients over to the target without a write landing
+        halfway between the two repositories.
 
-        return AppImage(data=app_data, last_updated=last_updated)
+        Yields:
+            This repository
+        """
+        with self._lock:
+            yield self
 
-    def add(self, app_image: AppImage) -> None:
-        """Add an AppImage to the repository.
+    def copy_batch(self, app_images: List[AppImage]) -> int:
+        """Copy a batch read from the source into the target.
 
         Args:
-            app_image: The AppImage to store
-        """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+            app_images: AppImages read from the source
 
-        try:
-            # Check if already exists
-            cursor.execute(
-                "SELECT name FROM app_images WHERE name = ?", (app_image.name,)
-            )
-            if cursor.fetchone():
-                raise KeyError(f"AppImage with name '{app_image.name}' already exists")
+        Returns:
+            Number of AppImages copied; the rest were superseded by writes
+        """
+        with self._lock:
+            if self._cleared:
+                return 0
+            fresh = [app for app in app_images if app.name not in self._written]
+            if fresh:
+                self.target.upsert_many(fresh)
+            return len(fresh)
 
-            # Add new AppImage
-            cursor.execute(
-                """
-                INSERT INTO app_images
-                (name, arch_keyword, download_url, sha_download_url, version,
-                 display_name, sha_file_name, owner, repo, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    app_image.name,
-                    app_image.data.arch_keyword,
-                    app_image.data.download_url,
-                    app_image.data.sha_download_url,
-                    app_image.data.version,
-                    app_image.data.display_name,
-                    app_image.data.sha_file_name,
-                    app_image.data.owner,
-                    app_image.data.repo,
-                    app_image.last_updated.isoformat()
-                    if app_image.last_updated
-                    else None,
-                ),
-            )
+    def add(self, app_image: AppImage) -> None:
+        """Add an AppImage to both repositories.
 
-            conn.commit()
-        finally:
-            conn.close()
+        Args:
+            app_image: The AppImage to store
+        """
+        with self._lock:
+            self.source.add(app_image)
+            self._written.add(app_image.name)
+            self.target.upsert_many([app_image])
 
     def update(self, app_image: AppImage) -> None:
-        """Update an existing AppImage in the repository.
+        """Update an AppImage in both repositories.
 
         Args:
             app_image: The AppImage with updated data
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        try:
-            # Check if exists
-            cursor.execute(
-                "SELECT name FROM app_images WHERE name = ?", (app_image.name,)
-            )
-            if not cursor.fetchone():
-                raise KeyError(f"AppImage with name '{app_image.name}' not found")
-
-            # Update last_updated timestamp
-            last_updated = datetime.now()
-
-            # Update AppImage
-            cursor.execute(
-                """
-                UPDATE app_images
-                SET arch_keyword = ?, download_url = ?, sha_download_url = ?,
-                    version = ?, display_name = ?, sha_file_name = ?,
-                    owner = ?, repo = ?, last_updated = ?
-                WHERE name = ?
-            """,
-                (
-                    app_image.data.arch_keyword,
-                    app_image.data.download_url,
-                    app_image.data.sha_download_url,
-                    app_image.data.version,
-                    app_image.data.display_name,
-                    app_image.data.sha_file_name,
-                    app_image.data.owner,
-                    app_image.data.repo,
-                    last_updated.isoformat(),
-                    app_image.name,
-                ),
-            )
-
-            conn.commit()
-        finally:
-            conn.close()
+        with self._lock:
+            self.source.update(app_image)
+            self._written.add(app_image.name)
+            self.target.upsert_many([app_image])
 
     def remove(self, name: str) -> None:
-        """Remove an AppImage from the repository.
+        """Remove an AppImage from both repositories.
 
         Args:
             name: The name of the AppImage to remove
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        try:
-            # Check if exists
-            cursor.execute("SELECT name FROM app_images WHERE name = ?", (name,))
-            if not cursor.fetchone():
-                raise KeyError(f"AppImage with name '{name}' not found")
+        with self._lock:
+            self.source.remove(name)
+            self._written.add(name)
+            try:
+                self.target.remove(name)
+            except KeyError:
+                pass  # Not copied yet, and now it never will be
 
-            # Remove AppImage
-            cursor.execute("DELETE FROM app_images WHERE name = ?", (name,))
+    def add_many(self, app_images: Iterable[AppImage]) -> None:
+        """Add several AppImages to both repositories.
 
-            conn.commit()
-        finally:
-            conn.close()
+        Args:
+            app_images: The AppImages to store
+        """
+        app_images = list(app_images)
+        with self._lock:
+            self.source.add_many(app_images)
+            self._written.update(app.name for app in app_images)
+            self.target.upsert_many(app_images)
 
-    def get_by_name(self, name: str) -> Optional[AppImage]:
-        """Get an AppImage by its name.
+    def update_many(self, app_images: Iterable[AppImage]) -> None:
+        """Update several AppImages in both repositories.
 
         Args:
-            name: The name of the AppImage to retrieve
+            app_images: The AppImages with updated data
+        """
+        app_images = list(app_images)
+        with self._lock:
+            self.source.update_many(app_images)
+            self._written.update(app.name for app in app_images)
+            self.target.upsert_many(app_images)
 
-        Returns:
-            The AppImage if found, None otherwise
+    def upsert_many(self, app_images: Iterable[AppImage]) -> None:
+        """Upsert several AppImages in both repositories.
+
+        Args:
+            app_images: The AppImages to store or update
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        app_images = list(app_images)
+        with self._lock:
+            self.source.upsert_many(app_images)
+            self._written.update(app.name for app in app_images)
+            self.target.upsert_many(app_images)
 
-        try:
-            cursor.execute("SELECT * FROM app_images WHERE name = ?", (name,))
-            row = cursor.fetchone()
+    def remove_many(self, names: Iterable[str]) -> None:
+        """Remove several AppImages from both repositories.
 
-            if not row:
-                return None
+        Args:
+            names: The names of the AppImages to remove
+        """
+        names = list(names)
+        with self._lock:
+            self.source.remove_many(names)
+            self._written.update(names)
+            for name in names:
+                try:
+                    self.target.remove(name)
+                except KeyError:
+                    pass
 
-            return self._app_image_from_row(row)
-        finally:
-            conn.close()
+    def clear(self) -> None:
+        """Remove all AppImages from both repositories."""
+        with self._lock:
+            self.source.clear()
+            self.target.clear()
+            self._cleared = True
 
-    def get_all(self) -> List[AppImage]:
-        """Get all AppImages in the repository.
 
-        Returns:
-            A list of all AppImages
-        """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+# Running aggregate statistics
+class AppImageStatistics:
+    """Running aggregates over a set of AppImages.
 
-        try:
-            cursor.execute("SELECT * FROM app_images")
-            rows = cursor.fetchall()
+    Instead of walking the repository on every read, the counts are adjusted
+    as AppImages are added, updated and removed, so reading them is O(1)
+    (plus copying the small distribution dicts).
 
-            return [self._app_image_from_row(row) for row in rows]
-        finally:
-            conn.close()
+    Updates and removals need the values an AppImage was counted under, which
+    snapshot() captures before the AppImage is modified.
+    """
 
-    def find_by_display_name(self, display_name: str) -> List[AppImage]:
-        """Find AppImages by display name.
+    def __init__(self):
+        """Initialize empty aggregates."""
+        self.total_count = 0
+        self.total_name_length = 0
+        self.versions: Dict[str, int] = {}
+        self.owners: Dict[str, int] = {}
+        self.archs: Dict[str, int] = {}
+        # name -> last_updated, kept in update order so the most recently
+        # updated AppImage is always the last entry
+        self._last_updated: "OrderedDict[str, Optional[datetime]]" = OrderedDict()
+
+    @classmethod
+    def from_app_images(cls, app_images: Iterable[AppImage]) -> "AppImageStatistics":
+        """Compute the aggregates from scratch.
 
         Args:
-            display_name: The display name to search for
+            app_images: All AppImages to aggregate
 
         Returns:
-            A list of matching AppImages
+            The computed statistics
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute(
-                "SELECT * FROM app_images WHERE display_name = ?", (display_name,)
+        statistics = cls()
+        for app_image in app_images:
+            statistics._count(statistics.snapshot(app_image), 1)
+            statistics._last_updated[app_image.name] = app_image.last_updated
+
+        # Seed the update order from the stored timestamps
+        statistics._last_updated = OrderedDict(
+            sorted(
+                statistics._last_updated.items(),
+                key=lambda item: item[1] or datetime.min,
             )
-            rows = cursor.fetchall()
-
-            return [self._app_image_from_row(row) for row in rows]
-        finally:
-            conn.close()
+        )
+        return statistics
 
-    def find_by_version(self, version: str) -> List[AppImage]:
-        """Find AppImages by version.
+    @staticmethod
+    def snapshot(app_image: AppImage) -> Tuple[str, str, str, str]:
+        """Capture the values an AppImage is counted under.
 
         Args:
-            version: The version to search for
+            app_image: The AppImage to capture
 
         Returns:
-            A list of matching AppImages
+            Tuple of (name, version, owner, arch_keyword)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return (
+            app_image.name,
+            app_image.version,
+            app_image.data.owner,
+            app_image.data.arch_keyword,
+        )
 
-        try:
-            cursor.execute("SELECT * FROM app_images WHERE version = ?", (version,))
-            rows = cursor.fetchall()
+    def _count(self, snapshot: Tuple[str, str, str, str], delta: int) -> None:
+        """Adjust all counters for one AppImage.
 
-            return [self._app_image_from_row(row) for row in rows]
-        finally:
-            conn.close()
+        Args:
+            snapshot: The values the AppImage is counted under
+            delta: +1 to count the AppImage, -1 to uncount it
+        """
+        name, version, owner, arch_keyword = snapshot
+        self.total_count += delta
+        self.total_name_length += len(name) * delta
+        for counts, key in [
+            (self.versions, version),
+            (self.owners, owner),
+            (self.archs, arch_keyword),
+        ]:
+            counts[key] = counts.get(key, 0) + delta
+            if not counts[key]:
+                del counts[key]
 
-    def count(self) -> int:
-        """Count the number of AppImages in the repository.
+    def add(self, app_image: AppImage) -> None:
+        """Count a newly added AppImage.
 
-        Returns:
-            The number of AppImages
+        Args:
+            app_image: The AppImage that was added
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self._count(self.snapshot(app_image), 1)
+        self._last_updated[app_image.name] = app_image.last_updated
+        self._last_updated.move_to_end(app_image.name)
 
-        try:
-            cursor.execute("SELECT COUNT(*) FROM app_images")
-            return cursor.fetchone()[0]
-        finally:
-            conn.close()
+    def update(
+        self, old_snapshot: Tuple[str, str, str, str], app_image: AppImage
+    ) -> None:
+        """Recount an AppImage after an update.
 
-    def clear(self) -> None:
-        """Remove all AppImages from the repository."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        Args:
+            old_snapshot: snapshot() of the AppImage before the update
+            app_image: The updated AppImage
+        """
+        self._count(old_snapshot, -1)
+        self.add(app_image)
 
-        try:
-            cursor.execute("DELETE FROM app_images")
-            conn.commit()
-        finally:
-            conn.close()
+    def remove(self, old_snapshot: Tuple[str, str, str, str]) -> None:
+        """Uncount a removed AppImage.
+
+        Args:
+            old_snapshot: snapshot() of the AppImage before it was removed
+        """
+        self._count(old_snapshot, -1)
+        self._last_updated.pop(old_snapshot[0], None)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the current aggregates.
+
+        Returns:
+            Dictionary of statistics
+        """
+        most_recently_updated = None
+        if self._last_updated:
+            name, last_updated = next(reversed(self._last_updated.items()))
+            most_recently_updated = {
+                "name": name,
+                "last_updated": last_updated.isoformat() if last_updated else None,
+            }
+
+        return {
+            "total_count": self.total_count,
+            "version_distribution": dict(self.versions),
+            "owner_distribution": dict(self.owners),
+            "arch_distribution": dict(self.archs),
+            "average_name_length": self.total_name_length / max(1, self.total_count),
+            "most_recently_updated": most_recently_updated,
+        }
 
 
 # Application service that uses repositories
@@ -788,6 +3097,9 @@ class AppImageService:
 
     In an actual application, this service would contain business logic that
     operates on AppImages, using the repository for persistence.
+
+    Statistics are computed from the repository once, on first use, and then
+    kept up to date by every add/update/remove made through the service.
     """
 
     def __init__(self, repository: Any):  # Using Any for typing simplicity
@@ -797,6 +3109,8 @@ class AppImageService:
             repository: Any class implementing AppImageRepository protocol
         """
         self.repository = repository
+        # Built lazily by get_app_image_statistics()
+        self._statistics: Optional[AppImageStatistics] = None
 
     def add_app_image(self, data: AppImageData) -> AppImage:
         """Add a new AppImage.
@@ -813,6 +3127,9 @@ class AppImageService:
         # Store it using the repository
         self.repository.add(app_image)
 
+        if self._statistics:
+            self._statistics.add(app_image)
+
         return app_image
 
     def update_app_image(
@@ -833,72 +3150,210 @@ class AppImageService:
         if not app_image:
             return None
 
-        # Update the domain entity
+        old_snapshot = AppImageStatistics.snapshot(app_image)
+
+        # Update the domain entity, including the convenience fields that
+        # __post_init__ copied from the data
         app_image.data.version = new_version
         app_image.data.download_url = new_download_url
+        app_image.version = new_version
+        app_image.download_url = new_download_url
 
         # Update in the repository
         self.repository.update(app_image)
 
+        if self._statistics:
+            self._statistics.update(old_snapshot, app_image)
+
         return app_image
 
+    def remove_app_image(self, name: str) -> bool:
+        """Remove an AppImage.
+
+        Args:
+            name: Name of the AppImage to remove
+
+        Returns:
+            True if the AppImage was removed, False if it wasn't found
+        """
+        app_image = self.repository.get_by_name(name)
+        if not app_image:
+            return False
+
+        self.repository.remove(name)
+
+        if self._statistics:
+            self._statistics.remove(AppImageStatistics.snapshot(app_image))
+
+        return True
+
     def find_outdated_app_images(self, current_version: str) -> List[AppImage]:
         """Find AppImages with versions older than the given version.
 
         This demonstrates a domain service method that uses the repository
         to implement business logic.
 
+        The comparison is a range query on the repository's parsed version
+        keys, so "1.10" correctly counts as newer than "1.9".
+
         Args:
             current_version: Version to compare against
 
         Returns:
-            List of outdated AppImages
+            List of outdated AppImages, oldest version first
         """
-        # Fetch all AppImages using the repository
-        all_app_images = self.repository.get_all()
+        return self.repository.find_older_than(current_version)
 
-        # Apply domain logic to filter outdated ones
-        # In a real implementation, this might use semantic versioning comparison
-        outdated = [app for app in all_app_images if app.version < current_version]
+    def iter_outdated_app_images(self, current_version: str) -> Iterator[AppImage]:
+        """Lazily yield AppImages with versions older than the given version.
+
+        Streams the repository instead of loading it into a list first, so
+        memory use doesn't grow with the size of the catalog.
 
-        return outdated
+        Args:
+            current_version: Version to compare against
+
+        Yields:
+            Each outdated AppImage
+        """
+        # Apply domain logic to filter outdated ones
+        threshold = version_sort_key(current_version)
+        for app in self.repository.iter_all():
+            if version_sort_key(app.version) < threshold:
+                yield app
 
-    def get_app_image_statistics(self) -> Dict[str, Any]:
+    def get_app_image_statistics(self, verify: bool = False) -> Dict[str, Any]:
         """Get statistics about stored AppImages.
 
         This demonstrates complex domain operations using repository methods.
+        The first call streams the repository to build the aggregates; after
+        that they are maintained incrementally and reading them is O(1).
+
+        Args:
+            verify: Recompute from the repository and repair any drift first
 
         Returns:
             Dictionary of statistics
         """
-        all_app_images = self.repository.get_all()
+        if self._statistics is None:
+            self._statistics = AppImageStatistics.from_app_images(
+                self.repository.iter_all()
+            )
+        elif verify:
+            self.check_statistics()
 
-        # Assuming a real implementation would have more complex logic
-        versions = {}
-        for app in all_app_images:
-            if app.version in versions:
-                versions[app.version] += 1
-            else:
-                versions[app.version] = 1
+        return self._statistics.as_dict()
 
-        return {
-            "total_count": len(all_app_images),
-            "version_distribution": versions,
-            "average_name_length": sum(len(app.name) for app in all_app_images)
-            / max(1, len(all_app_images)),
-        }
+    def check_statistics(self) -> bool:
+        """Recompute the statistics from the repository and compare.
 
-    def change_repository(self, repository: Any) -> None:
+        Writes that bypass the service (or another process sharing the
+        storage) make the running aggregates drift. If they differ, the
+        recomputed statistics replace them.
+
+        Returns:
+            True if the running aggregates matched the repository
+        """
+        recomputed = AppImageStatistics.from_app_images(self.repository.iter_all())
+        consistent = (
+            self._statistics is not None
+            and self._statistics.as_dict() == recomputed.as_dict()
+        )
+        if not consistent:
+            print("Warning: AppImage statistics drifted, using recomputed values")
+        self._statistics = recomputed
+        return consistent
+
+    def change_repository(
+        self,
+        repository: Any,
+        migrate: bool = False,
+        batch_size: int = DEFAULT_SCAN_BATCH_SIZE,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """Change the underlying repository implementation.
 
         This demonstrates how the Repository Pattern allows switching
         storage mechanisms at runtime.
 
+        With migrate=True the existing AppImages move along. They are
+        streamed from the old repository in batches while the service keeps
+        working: reads are served by the old repository until the copy is
+        complete, and writes made meanwhile (e.g. from other threads) go to
+        both. The new repository only takes over once it has everything.
+        It must start out empty, so it ends up holding exactly the old
+        repository's AppImages and the running statistics stay valid.
+
         Args:
             repository: The new repository to use
+            migrate: Copy the AppImages from the current repository first
+            batch_size: Number of AppImages copied per batch
+            progress: Called with the progress dict after every batch;
+                progress is printed when not given
+
+        Returns:
+            Migration summary when migrate is True, None otherwise
+
+        Raises:
+            ValueError: If migrating into a repository that isn't empty
         """
-        self.repository = repository
-        print(f"Repository changed to: {repository.__class__.__name__}")
+        if not migrate:
+            self.repository = repository
+            # The new repository holds different data, so rebuild lazily
+            self._statistics = None
+            print(f"Repository changed to: {repository.__class__.__name__}")
+            return None
+
+        existing = repository.count()
+        if existing:
+            raise ValueError(
+                f"Cannot migrate into {repository.__class__.__name__}: "
+                f"it already holds {existing} AppImages"
+            )
+
+        source = self.repository
+        migrating = MigratingAppImageRepository(source, repository)
+        self.repository = migrating
+
+        start = time.perf_counter()
+        report: Dict[str, Any] = {
+            "copied": 0,
+            "skipped": 0,
+            "total": source.count(),
+            "elapsed": 0.0,
+            "records_per_second": 0.0,
+        }
+        try:
+            for batch in source.scan(batch_size):
+                copied = migrating.copy_batch(batch)
+                report["copied"] += copied
+                report["skipped"] += len(batch) - copied
+                report["elapsed"] = time.perf_counter() - start
+                report["records_per_second"] = report["copied"] / max(
+                    report["elapsed"], 1e-9
+                )
+                if progress:
+                    progress(dict(report))
+                else:
+                    print(
+                        f"Migrated {report['copied'] + report['skipped']}"
+                        f"/{report['total']} AppImages "
+                        f"({report['records_per_second']:,.0f} records/s)"
+                    )
+        except BaseException:
+            # Leave the old repository in charge; it saw every write
+            self.repository = source
+            raise
+
+        # The data is unchanged, so the running statistics stay valid
+        with migrating.writes_paused():
+            self.repository = repository
+
+        print(
+            f"Repository changed to: {repository.__class__.__name__} "
+            f"(migrated {report['copied']} AppImages in {report['elapsed']:.3f}s)"
+        )
+        return report
 
 
 def main():
@@ -943,7 +3398,8 @@ def main():
     print("1. Creating different repository implementations...")
     in_memory_repo = InMemoryAppImageRepository()
     file_repo = FileAppImageRepository("./tmp/appimages")
-    sqlite_repo = SQLiteAppImageRepository("./tmp/appimages.db")
+    log_repo = LogAppImageRepository("./tmp/appimages.log")
+    sqlite_repo = SQLiteAppImageRepository("./tmp/appimages.db", persistent=True)
 
     # 2. Create service with in-memory repository
     print("\n2. Creating service with in-memory repository...")
@@ -989,20 +3445,67 @@ def main():
     for app in apps:
         print(f"  - {app.name} (version {app.data.version})")
 
-    # 7. Switch to SQLite repository
-    print("\n7. Switching to SQLite repository...")
-    service.change_repository(sqlite_repo)
+    # 7. Switch to append-only log repository
+    print("\n7. Switching to append-only log repository...")
+    service.change_repository(log_repo)
 
-    # Add the same AppImages to the SQLite repository
-    print("Adding AppImages to SQLite repository...")
+    # All AppImages share one log file; the update appends a new record
+    print("Adding AppImages to log repository...")
     service.add_app_image(github_data)
     service.add_app_image(gitlab_data)
+    service.update_app_image(
+        name="gitlab-app",
+        new_version="2.1",
+        new_download_url="https://gitlab.com/owner/repo/-/releases/v2.1/app.AppImage",
+    )
+    print(f"Log repository contains {service.repository.count()} AppImages")
+    log_repo.close()
+
+    # 8. Switch to SQLite repository
+    print("\n8. Switching to SQLite repository...")
+    service.change_repository(sqlite_repo)
 
-    # 8. Get statistics
-    print("\n8. Getting AppImage statistics...")
+    # Add the same AppImages to the SQLite repository in one transaction
+    print("Adding AppImages to SQLite repository...")
+    with sqlite_repo.transaction():
+        service.add_app_image(github_data)
+        service.add_app_image(gitlab_data)
+
+    # 9. Get statistics
+    print("\n9. Getting AppImage statistics...")
     stats = service.get_app_image_statistics()
     print(f"Statistics from SQLite repository: {stats}")
 
+    # 10. Put a read-through cache in front of the SQLite repository
+    print("\n10. Wrapping SQLite repository with a cache...")
+    cached_repo = CachingAppImageRepository(sqlite_repo, max_size=100, ttl_seconds=30)
+    service.change_repository(cached_repo)
+    for _ in range(3):
+        service.repository.get_by_name("github-app")  # Only the first hits SQLite
+    service.update_app_image(
+        name="github-app",
+        new_version="1.2",
+        new_download_url="https://github.com/owner/repo/releases/download/v1.2/app.AppImage",
+    )
+    app = service.repository.get_by_name("github-app")  # Reloaded after update
+    print(f"github-app is now at version {app.data.version}")
+    print(f"Cache statistics: {cached_repo.get_stats()}")
+
+    # Statistics were rebuilt once after the switch, then kept up to date
+    stats = service.get_app_image_statistics(verify=True)
+    print(f"Version distribution after update: {stats['version_distribution']}")
+    cached_repo.close()
+
+    # 11. Move the file repository's AppImages into a new SQLite database
+    print("\n11. Migrating from file repository to a new SQLite database...")
+    service.change_repository(file_repo)
+    migrated_repo = SQLiteAppImageRepository("./tmp/migrated.db", persistent=True)
+    # Migration needs an empty target; drop what an earlier run left behind
+    migrated_repo.clear()
+    service.change_repository(migrated_repo, migrate=True, batch_size=1)
+    print(f"Migrated repository contains {service.repository.count()} AppImages")
+    migrated_repo.close()
+
     print("\n=== REPOSITORY PATTERN BENEFITS ===")
     print("* Separation of domain logic from data access mechanism")
     print("* Ability to switch storage implementations transparently")
@@ -0,0 +1,344 @@
+"""
+Benchmarks for the repository.py AppImage repositories.
+
+Run from this directory:
+
+    python repository_benchmark.py
+"""
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Optional
+
+from repository import (
+    AppImage,
+    AppImageData,
+    ColumnarAppImageStore,
+    FileAppImageRepository,
+    InMemoryAppImageRepository,
+    LogAppImageRepository,
+    SQLiteAppImageRepository,
+    version_sort_key,
+)
+
+
+def make_app_images(n_records):
+    """Create n_records AppImages with a realistic amount of repetition."""
+    return [
+        AppImage(
+            data=AppImageData(
+                name=f"app-{i}",
+                arch_keyword="x86_64" if i % 4 else "aarch64",
+                download_url=f"https://github.com/owner-{i % 50}/app-{i}/app.AppImage",
+                sha_download_url=f"https://github.com/owner-{i % 50}/app-{i}/app.sha256",
+                version=f"{i % 10}.{i % 7}",
+                display_name=f"App {i % 1000}",
+                sha_file_name="app.AppImage.sha256",
+                owner=f"owner-{i % 50}",
+                repo=f"app-{i}",
+            )
+        )
+        for i in range(n_records)
+    ]
+
+
+@dataclass
+class PlainAppImageData:
+    """AppImageData as it was before it was slotted and interned."""
+
+    name: str
+    arch_keyword: str
+    download_url: str
+    sha_download_url: str
+    version: str
+    display_name: str
+    sha_file_name: str
+    owner: str = ""
+    repo: str = ""
+
+
+@dataclass
+class PlainAppImage:
+    """AppImage as it was before it was slotted."""
+
+    data: PlainAppImageData
+    last_updated: Optional[datetime] = None
+
+    def __post_init__(self):
+        self.name = self.data.name
+        self.download_url = self.data.download_url
+        self.version = self.data.version
+        self.display_name = self.data.display_name
+
+
+def linear_find_by_version(repo, version):
+    """The pre-index implementation of find_by_version: scan everything."""
+    return [app for app in repo.get_all() if app.version == version]
+
+
+def linear_find_by_display_name(repo, display_name):
+    """The pre-index implementation of find_by_display_name."""
+    return [app for app in repo.get_all() if app.display_name == display_name]
+
+
+def benchmark_lookup(label, lookup, keys):
+    start = time.perf_counter()
+    for key in keys:
+        lookup(key)
+    duration = time.perf_counter() - start
+    per_lookup_us = duration / len(keys) * 1_000_000
+    print(f"{label}: {duration:.4f} seconds ({per_lookup_us:.2f} us/lookup)")
+    return duration
+
+
+def benchmark_indexed_lookups(n_records, n_lookups):
+    repo = InMemoryAppImageRepository()
+    for app_image in make_app_images(n_records):
+        repo.add(app_image)
+
+    versions = [f"{i % 10}.{i % 7}" for i in range(n_lookups)]
+    display_names = [f"App {i % 1000}" for i in range(n_lookups)]
+
+    print(f"\nfind_by_version over {n_records} records, {n_lookups} lookups")
+    linear = benchmark_lookup(
+        "  linear scan", lambda v: linear_find_by_version(repo, v), versions
+    )
+    indexed = benchmark_lookup("  hash index ", repo.find_by_version, versions)
+    print(f"  speedup: {linear / indexed:.0f}x")
+
+    print(f"\nfind_by_display_name over {n_records} records, {n_lookups} lookups")
+    linear = benchmark_lookup(
+        "  linear scan",
+        lambda d: linear_find_by_display_name(repo, d),
+        display_names,
+    )
+    indexed = benchmark_lookup(
+        "  hash index ", repo.find_by_display_name, display_names
+    )
+    print(f"  speedup: {linear / indexed:.0f}x")
+
+
+def benchmark_file_vs_log(n_records):
+    print(f"\nget_all/count over {n_records} records")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_repo = FileAppImageRepository(os.path.join(tmp_dir, "files"))
+        log_repo = LogAppImageRepository(os.path.join(tmp_dir, "appimages.log"))
+        for app_image in make_app_images(n_records):
+            file_repo.add(app_image)
+            log_repo.add(app_image)
+
+        repos = [("one file per app", file_repo), ("append-only log", log_repo)]
+        for label, repo in repos:
+            start = time.perf_counter()
+            repo.get_all()
+            get_all_duration = time.perf_counter() - start
+
+            start = time.perf_counter()
+            repo.count()
+            count_duration = time.perf_counter() - start
+            print(
+                f"  {label}: get_all {get_all_duration:.4f} seconds, "
+                f"count {count_duration:.6f} seconds"
+            )
+
+        log_repo.close()
+
+
+def benchmark_sqlite_connection_modes(n_records):
+    print(f"\nSQLite update sweep over {n_records} records")
+    app_images = make_app_images(n_records)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        modes = [
+            ("connection per call", False, False),
+            ("persistent WAL", True, False),
+            ("persistent WAL + transaction", True, True),
+        ]
+        for label, persistent, batched in modes:
+            repo = SQLiteAppImageRepository(
+                os.path.join(tmp_dir, f"{label}.db"), persistent=persistent
+            )
+            with repo.transaction():
+                for app_image in app_images:
+                    repo.add(app_image)
+
+            start = time.perf_counter()
+            if batched:
+                with repo.transaction():
+                    for app_image in app_images:
+                        repo.update(app_image)
+            else:
+                for app_image in app_images:
+                    repo.update(app_image)
+            duration = time.perf_counter() - start
+            print(f"  {label}: {duration:.4f} seconds")
+            repo.close()
+
+
+def benchmark_bulk_throughput(n_records):
+    print(f"\nBulk API throughput over {n_records} records (records/second)")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backends = [
+            ("in-memory", InMemoryAppImageRepository()),
+            ("file", FileAppImageRepository(os.path.join(tmp_dir, "files"))),
+            ("log", LogAppImageRepository(os.path.join(tmp_dir, "appimages.log"))),
+            (
+                "sqlite",
+                SQLiteAppImageRepository(
+                    os.path.join(tmp_dir, "appimages.db"), persistent=True
+                ),
+            ),
+        ]
+        for label, repo in backends:
+            app_images = make_app_images(n_records)
+            names = [app_image.name for app_image in app_images]
+            operations = [
+                ("add_many", repo.add_many, app_images),
+                ("update_many", repo.update_many, app_images),
+                ("upsert_many", repo.upsert_many, app_images),
+                ("remove_many", repo.remove_many, names),
+            ]
+
+            results = []
+            for op_name, operation, argument in operations:
+                start = time.perf_counter()
+                operation(argument)
+                duration = time.perf_counter() - start
+                results.append(f"{op_name} {n_records / duration:,.0f}")
+            print(f"  {label}: {', '.join(results)}")
+
+            if hasattr(repo, "close"):
+                repo.close()
+
+
+def benchmark_outdated_queries(n_records, n_queries):
+    print(f"\nfind_older_than over {n_records} records, {n_queries} queries")
+    # Only a handful of AppImages are older than the threshold
+    threshold = "0.1"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backends = [
+            ("in-memory", InMemoryAppImageRepository()),
+            (
+                "sqlite",
+                SQLiteAppImageRepository(
+                    os.path.join(tmp_dir, "appimages.db"), persistent=True
+                ),
+            ),
+        ]
+        for label, repo in backends:
+            repo.add_many(make_app_images(n_records))
+
+            def full_scan(repo=repo):
+                key = version_sort_key(threshold)
+                return [
+                    app
+                    for app in repo.iter_all()
+                    if version_sort_key(app.version) < key
+                ]
+
+            for query_label, query in [
+                ("full scan", full_scan),
+                ("range query", lambda repo=repo: repo.find_older_than(threshold)),
+            ]:
+                start = time.perf_counter()
+                for _ in range(n_queries):
+                    query()
+                duration = time.perf_counter() - start
+                print(f"  {label} {query_label}: {duration:.4f} seconds")
+
+            if hasattr(repo, "close"):
+                repo.close()
+
+
+def benchmark_record_memory(n_records):
+    print(f"\nMemory for {n_records} records loaded from storage")
+    # Decode each record separately, as a backend would, so repeated values
+    # are distinct string objects unless something interns them
+    lines = [json.dumps(asdict(app.data)) for app in make_app_images(n_records)]
+    now = datetime.now()
+
+    def plain_objects():
+        store = {}
+        for line in lines:
+            app = PlainAppImage(PlainAppImageData(**json.loads(line)), now)
+            store[app.name] = app
+        return store
+
+    def slotted_objects():
+        store = {}
+        for line in lines:
+            app = AppImage(AppImageData(**json.loads(line)), now)
+            store[app.name] = app
+        return store
+
+    def columnar_store():
+        store = ColumnarAppImageStore()
+        for line in lines:
+            app = AppImage(AppImageData(**json.loads(line)), now)
+            store[app.name] = app
+        return store
+
+    for label, build in [
+        ("plain dataclasses", plain_objects),
+        ("slotted + interned", slotted_objects),
+        ("columnar store", columnar_store),
+    ]:
+        tracemalloc.start()
+        store = build()
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"  {label}: {used / 1024 / 1024:.1f} MiB "
+            f"({used / len(store):.0f} bytes/record)"
+        )
+        del store
+
+
+def main():
+    benchmark_indexed_lookups(n_records=50_000, n_lookups=200)
+    benchmark_file_vs_log(n_records=5_000)
+    benchmark_sqlite_connection_modes(n_records=2_000)
+    benchmark_bulk_throughput(n_records=10_000)
+    benchmark_outdated_queries(n_records=10_000, n_queries=20)
+    benchmark_record_memory(n_records=100_000)
+
+    # ## Results:
+    #     find_by_version over 50000 records, 200 lookups
+    #       linear scan: 0.4729 seconds (2364.56 us/lookup)
+    #       hash index : 0.0021 seconds (10.31 us/lookup)
+    #     find_by_display_name over 50000 records, 200 lookups
+    #       linear scan: 0.4308 seconds (2153.92 us/lookup)
+    #       hash index : 0.0003 seconds (1.47 us/lookup)
+    #     get_all/count over 5000 records
+    #       one file per app: get_all 0.0978 seconds, count 0.002427 seconds
+    #       append-only log: get_all 0.0530 seconds, count 0.000008 seconds
+    #     SQLite update sweep over 2000 records
+    #       connection per call: 1.3805 seconds
+    #       persistent WAL: 0.0707 seconds
+    #       persistent WAL + transaction: 0.0201 seconds
+    #     Bulk API throughput over 10000 records (records/second)
+    #       in-memory: add_many 356,536, update_many 390,981,
+    #                  upsert_many 410,734, remove_many 3,255,042
+    #       file: add_many 6,614, update_many 12,357,
+    #             upsert_many 5,758, remove_many 19,434
+    #       log: add_many 44,544, update_many 36,887,
+    #            upsert_many 31,330, remove_many 114,329
+    #       sqlite: add_many 45,197, update_many 37,177,
+    #               upsert_many 34,895, remove_many 129,022
+    #     find_older_than over 10000 records, 20 queries
+    #       in-memory full scan: 1.1285 seconds
+    #       in-memory range query: 0.0006 seconds
+    #       sqlite full scan: 2.2358 seconds
+    #       sqlite range query: 0.0156 seconds
+    #     Memory for 100000 records loaded from storage
+    #       plain dataclasses: 87.5 MiB (918 bytes/record)
+    #       slotted + interned: 56.2 MiB (590 bytes/record)
+    #       columnar store: 47.5 MiB (498 bytes/record)
+
+
+if __name__ == "__main__":
+    main()
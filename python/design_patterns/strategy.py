@@ -32,8 +32,35 @@ algorithms in an AppImage management system, allowing flexible selection of diff
 methods based on requirements or preferences.
 """
 
-from dataclasses import dataclass
-from typing import Any, Protocol
+import inspect
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from functools import partial
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+from urllib.parse import urljoin, urlsplit
+
+# Bytes read from the socket and written to disk at a time
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Redirects followed before a download gives up (GitHub releases use one)
+MAX_REDIRECTS = 5
+
+# Seconds before the first retry of a failed segment request, doubled on
+# every further retry, and the longest wait (also caps Retry-After)
+RETRY_BACKOFF = 0.5
+MAX_RETRY_DELAY = 30.0
+
+# Size assumed when ranking download sources that don't report one
+ASSUMED_APPIMAGE_SIZE = 100 * 1024 * 1024
 
 
 # Reusing the AppImageData class concept from our previous examples
@@ -122,6 +149,87 @@ class VerificationStrategy(Protocol):
         ...
 
 
+# HTTP range download engine used by HTTPDownloadStrategy
+class RemoteFileChangedError(IOError):
+    """Raised when a remote file changes while it is being downloaded."""
+
+
+class DownloadCancelledError(IOError):
+    """Raised when a download is cancelled before it completes."""
+
+
+class HTTPConnectionPool:
+    """Keep-alive HTTP(S) connections, shared by the segments of a download.
+
+    Connections are pooled per scheme, host and port, so every segment (and
+    every later download from the same host) reuses an open connection
+    instead of paying a TCP and TLS handshake per request. On high-latency
+    links those round trips cost more than the transfer of a small segment.
+    """
+
+    def __init__(self, timeout: float = 30, max_idle_per_host: int = 8):
+        """Initialize an empty pool.
+
+        Args:
+            timeout: Socket timeout for new connections in seconds
+            max_idle_per_host: Maximum number of idle connections kept per host
+        """
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple[str, str, Optional[int]], List[HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> Tuple[str, str, Optional[int]]:
+        """Get the pool key of a URL."""
+        parts = urlsplit(url)
+        return (parts.scheme, parts.hostname or "", parts.port)
+
+    def acquire(self, url: str) -> HTTPConnection:
+        """Take an idle connection to the URL's host, or open a new one.
+
+        Args:
+            url: The URL about to be requested
+
+        Returns:
+            HTTPConnection: A connection for exclusive use until release()
+        """
+        key = self._key(url)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+
+        scheme, host, port = key
+        if scheme == "https":
+            return HTTPSConnection(host, port, timeout=self.timeout)
+        if scheme == "http":
+            return HTTPConnection(host, port, timeout=self.timeout)
+        raise ValueError(f"Unsupported URL scheme: {scheme}")
+
+    def release(self, url: str, conn: HTTPConnection) -> None:
+        """Return a connection whose last response was read completely.
+
+        Args:
+            url: The URL the connection was acquired for
+            conn: The connection
+        """
+        with self._lock:
+            idle = self._idle.setdefault(self._key(url), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            for idle in self._idle.values():
+                for conn in idle:
+                    conn.close()
+            self._idle.clear()
+
+
 # Concrete Download Strategies
 class HTTPDownloadStrategy:
     """HTTP Download Strategy - This is a 'Concrete Strategy' in the Strategy Pattern.
@@ -132,35 +240,475 @@ class HTTPDownloadStrategy:
 
     In the Strategy Pattern, concrete strategies implement the algorithm interface
     and can be used interchangeably by the context.
+
+    Files that are large enough, from servers that support range requests,
+    are split into byte-range segments fetched concurrently over pooled
+    keep-alive connections. Each segment is written in place with
+    os.pwrite() into a preallocated "<file>.part", and the progress of every
+    segment is checkpointed to "<file>.part.json", so an interrupted
+    download resumes where it stopped. Other files are fetched in one stream.
     """
 
-    def __init__(self, user_agent: str = "AppImageManager/1.0", timeout: int = 30):
+    def __init__(
+        self,
+        user_agent: str = "AppImageManager/1.0",
+        timeout: int = 30,
+        segments: int = 4,
+        min_segment_size: int = 8 * 1024 * 1024,
+        retries: int = 3,
+        pool: Optional[HTTPConnectionPool] = None,
+    ):
         """Initialize with HTTP-specific parameters.
 
         Args:
             user_agent: User agent string to use for HTTP requests
             timeout: Connection timeout in seconds
+            segments: Maximum number of segments fetched concurrently
+            min_segment_size: Smallest segment worth its own connection, in bytes
+            retries: Times a failed segment request is retried before giving up
+            pool: Connection pool (defaults to a new one per strategy)
         """
         self.user_agent = user_agent
         self.timeout = timeout
-
-    def download(self, appimage: AppImage, destination_dir: str) -> str:
+        self.segments = segments
+        self.min_segment_size = min_segment_size
+        self.retries = retries
+        self.pool = pool or HTTPConnectionPool(timeout=timeout)
+
+    def download(
+        self,
+        appimage: AppImage,
+        destination_dir: str,
+        cancel: Optional[threading.Event] = None,
+    ) -> str:
         """Download the AppImage using HTTP.
 
         Args:
             appimage: The AppImage to download
             destination_dir: Directory to download to
+            cancel: Event that stops the download when set
 
         Returns:
             str: The path to the downloaded file
+
+        Raises:
+            DownloadCancelledError: If cancel was set; a later call resumes it
+            IOError: If the download fails; a later call resumes it
         """
-        # In a real implementation, this would use requests, urllib, or another HTTP library
-        file_path = f"{destination_dir}/{appimage.name}.AppImage"
+        os.makedirs(destination_dir, exist_ok=True)
+        file_path = os.path.join(destination_dir, f"{appimage.name}.AppImage")
+        part_path = f"{file_path}.part"
+        state_path = f"{part_path}.json"
         print(f"[HTTP] Downloading {appimage.name} from {appimage.download_url}")
         print(f"[HTTP] Using User-Agent: {self.user_agent}, timeout: {self.timeout}s")
+
+        remote = self._probe(appimage.download_url)
+        if remote["ranges"] and remote["size"] >= 2 * self.min_segment_size:
+            try:
+                self._download_segments(remote, part_path, state_path, cancel)
+            except RemoteFileChangedError:
+                print(f"[HTTP] {appimage.name} changed on the server, restarting")
+                self._remove(state_path)
+                remote = self._probe(appimage.download_url)
+                self._download_segments(remote, part_path, state_path, cancel)
+        else:
+            self._download_stream(remote["url"], part_path, cancel)
+
+        os.replace(part_path, file_path)
+        self._remove(state_path)
         print(f"[HTTP] Downloaded to {file_path}")
         return file_path
 
+    @staticmethod
+    def _remove(path: str) -> None:
+        """Delete a file if it exists."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _request(
+        self, method: str, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[HTTPConnection, HTTPResponse, str]:
+        """Send a request on a pooled connection, following redirects.
+
+        Args:
+            method: The HTTP method
+            url: The URL to request
+            headers: Extra request headers
+
+        Returns:
+            Tuple[HTTPConnection, HTTPResponse, str]: The connection (to be
+            released once the response is read), the response and the URL
+            that finally answered
+
+        Raises:
+            IOError: If there are too many redirects
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            conn = self.pool.acquire(url)
+            parts = urlsplit(url)
+            target = parts.path or "/"
+            if parts.query:
+                target += f"?{parts.query}"
+            try:
+                conn.request(
+                    method,
+                    target,
+                    headers={"User-Agent": self.user_agent, **(headers or {})},
+                )
+                response = conn.getresponse()
+            except Exception:
+                conn.close()
+                raise
+
+            location = response.getheader("Location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                response.read()
+                self.pool.release(url, conn)
+                url = urljoin(url, location)
+                continue
+            return conn, response, url
+
+        raise IOError(f"Too many redirects for {url}")
+
+    def _probe(self, url: str) -> Dict[str, Any]:
+        """Find a file's final URL, size, range support and validator.
+
+        Args:
+            url: The download URL
+
+        Returns:
+            Dict[str, Any]: url, size (None if unknown), ranges and validator
+            (ETag or Last-Modified, used to detect changes when resuming)
+
+        Raises:
+            IOError: If the server doesn't answer with 200 OK
+        """
+        conn, response, final_url = self._request("HEAD", url)
+        response.read()
+        self.pool.release(final_url, conn)
+        if response.status != 200:
+            raise IOError(f"HEAD {url} failed: {response.status} {response.reason}")
+
+        length = response.getheader("Content-Length")
+        return {
+            "url": final_url,
+            "size": int(length) if length is not None else None,
+            "ranges": response.getheader("Accept-Ranges", "") == "bytes"
+            and length is not None,
+            "validator": response.getheader("ETag")
+            or response.getheader("Last-Modified"),
+        }
+
+    def measure(
+        self, appimage: AppImage, sample_size: int = 256 * 1024
+    ) -> Dict[str, Any]:
+        """Measure how fast the AppImage's server answers and transfers.
+
+        Fetches the first sample_size bytes on a pooled connection, which
+        stays warm for a download that follows.
+
+        Args:
+            appimage: The AppImage, whose download_url is measured
+            sample_size: Number of bytes to transfer
+
+        Returns:
+            Dict[str, Any]: ttfb (seconds until the response headers),
+            throughput (bytes per second) and size (None if unknown)
+
+        Raises:
+            IOError: If the server doesn't answer with the file
+        """
+        start = time.perf_counter()
+        conn, response, final_url = self._request(
+            "GET", appimage.download_url, {"Range": f"bytes=0-{sample_size - 1}"}
+        )
+        first_byte = time.perf_counter()
+        try:
+            if response.status not in (200, 206):
+                raise IOError(
+                    f"GET {appimage.download_url} failed: "
+                    f"{response.status} {response.reason}"
+                )
+            received = len(response.read(sample_size))
+        except BaseException:
+            conn.close()
+            raise
+        elapsed = max(time.perf_counter() - first_byte, 1e-6)
+
+        if response.status == 206:
+            self.pool.release(final_url, conn)
+            size = response.getheader("Content-Range", "").rpartition("/")[2]
+        else:
+            # The server ignored the range, don't read the rest of the file
+            conn.close()
+            size = response.getheader("Content-Length", "")
+        return {
+            "ttfb": first_byte - start,
+            "throughput": received / elapsed,
+            "size": int(size) if size.isdigit() else None,
+        }
+
+    def _download_stream(
+        self, url: str, part_path: str, cancel: Optional[threading.Event] = None
+    ) -> None:
+        """Fetch a file in a single request.
+
+        Args:
+            url: The download URL
+            part_path: File to write to
+            cancel: Event that stops the download when set
+
+        Raises:
+            DownloadCancelledError: If cancel was set
+            IOError: If the server doesn't answer with 200 OK
+        """
+        conn, response, final_url = self._request("GET", url)
+        try:
+            if response.status != 200:
+                raise IOError(f"GET {url} failed: {response.status} {response.reason}")
+            with open(part_path, "wb") as f:
+                while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                    if cancel is not None and cancel.is_set():
+                        raise DownloadCancelledError(f"Download of {url} cancelled")
+                    f.write(chunk)
+        except BaseException:
+            conn.close()
+            raise
+        self.pool.release(final_url, conn)
+
+    def _plan_segments(self, size: int) -> List[List[int]]:
+        """Split a file into [start, end, bytes done] segments.
+
+        Args:
+            size: File size in bytes
+
+        Returns:
+            List[List[int]]: Segments with inclusive byte ranges
+        """
+        count = max(1, min(self.segments, size // self.min_segment_size))
+        bounds = [size * i // count for i in range(count + 1)]
+        return [[bounds[i], bounds[i + 1] - 1, 0] for i in range(count)]
+
+    def _load_state(
+        self, remote: Dict[str, Any], part_path: str, state_path: str
+    ) -> Optional[Dict[str, Any]]:
+        """Load the state of an interrupted download of the same file version.
+
+        Args:
+            remote: Result of _probe()
+            part_path: The partially downloaded file
+            state_path: The sidecar state file
+
+        Returns:
+            Optional[Dict[str, Any]]: The state, or None if there is nothing to resume
+        """
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            state.get("size") != remote["size"]
+            or state.get("validator") != remote["validator"]
+            or not os.path.exists(part_path)
+            or os.path.getsize(part_path) != remote["size"]
+        ):
+            return None
+        return state
+
+    @staticmethod
+    def _save_state(state: Dict[str, Any], state_path: str) -> None:
+        """Atomically write the sidecar state file.
+
+        Args:
+            state: The download state
+            state_path: The sidecar state file
+        """
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+
+    def _download_segments(
+        self,
+        remote: Dict[str, Any],
+        part_path: str,
+        state_path: str,
+        cancel: Optional[threading.Event] = None,
+    ) -> None:
+        """Fetch a file as concurrent byte-range segments, resuming if possible.
+
+        Args:
+            remote: Result of _probe()
+            part_path: File to write to
+            state_path: Sidecar file recording the progress of each segment
+            cancel: Event that stops the download when set
+
+        Raises:
+            DownloadCancelledError: If cancel was set; progress is kept
+            RemoteFileChangedError: If the file changed since it was probed
+            IOError: If a segment keeps failing
+        """
+        state = self._load_state(remote, part_path, state_path)
+        if state is not None:
+            done = sum(segment[2] for segment in state["segments"])
+            print(f"[HTTP] Resuming at {done * 100 // remote['size']}%")
+        else:
+            state = {
+                "size": remote["size"],
+                "validator": remote["validator"],
+                "segments": self._plan_segments(remote["size"]),
+            }
+
+        fd = os.open(part_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size != remote["size"]:
+                # Cut off the tail of a stale, larger file (fallocate only
+                # grows), then reserve the space up front so segments can't
+                # hit ENOSPC halfway
+                os.ftruncate(fd, remote["size"])
+                try:
+                    os.posix_fallocate(fd, 0, remote["size"])
+                except (AttributeError, OSError):
+                    pass
+            self._save_state(state, state_path)
+
+            lock = threading.Lock()
+            failed = threading.Event()
+
+            def stopped() -> bool:
+                return failed.is_set() or (cancel is not None and cancel.is_set())
+
+            last_checkpoint = [time.monotonic()]
+
+            def checkpoint(force: bool = False) -> None:
+                # Only record progress that has reached the disk
+                with lock:
+                    if force or time.monotonic() - last_checkpoint[0] >= 1.0:
+                        os.fdatasync(fd)
+                        self._save_state(state, state_path)
+                        last_checkpoint[0] = time.monotonic()
+
+            pending = [s for s in state["segments"] if s[2] < s[1] - s[0] + 1]
+            print(f"[HTTP] Fetching {len(pending)} segments of {remote['size']} bytes")
+            with ThreadPoolExecutor(max_workers=max(1, len(pending))) as pool:
+                futures = [
+                    pool.submit(
+                        self._fetch_segment,
+                        remote,
+                        fd,
+                        segment,
+                        lock,
+                        stopped,
+                        checkpoint,
+                    )
+                    for segment in pending
+                ]
+                errors = []
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failed.set()
+                        errors.append(e)
+
+            checkpoint(force=True)
+            if errors:
+                changed = [e for e in errors if isinstance(e, RemoteFileChangedError)]
+                raise (changed or errors)[0]
+            if any(s[2] < s[1] - s[0] + 1 for s in state["segments"]):
+                raise DownloadCancelledError(f"Download of {remote['url']} cancelled")
+        finally:
+            os.close(fd)
+
+    def _fetch_segment(
+        self,
+        remote: Dict[str, Any],
+        fd: int,
+        segment: List[int],
+        lock: threading.Lock,
+        stopped: Callable[[], bool],
+        checkpoint: Callable[[], None],
+    ) -> None:
+        """Fetch the rest of one segment and write it in place.
+
+        Args:
+            remote: Result of _probe()
+            fd: File descriptor of the preallocated file
+            segment: The [start, end, bytes done] segment, updated as it goes
+            lock: Guards the segment progress
+            stopped: Tells whether to stop early (cancelled, or another segment failed)
+            checkpoint: Persists the progress periodically
+
+        Raises:
+            RemoteFileChangedError: If the server no longer serves the same file
+            IOError: If the segment keeps failing, including on error statuses
+        """
+        buffer = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+        attempts = 0
+        start, end = segment[0], segment[1]
+
+        while segment[2] < end - start + 1 and not stopped():
+            offset = start + segment[2]
+            headers = {"Range": f"bytes={offset}-{end}"}
+            if remote["validator"]:
+                # The server answers 200 with the whole file if it changed
+                headers["If-Range"] = remote["validator"]
+
+            conn = None
+            retry_after: Optional[float] = None
+            try:
+                conn, response, _ = self._request("GET", remote["url"], headers)
+                if response.status != 206:
+                    conn.close()
+                    if response.status == 416 or (
+                        response.status == 200 and "If-Range" in headers
+                    ):
+                        # If-Range didn't match, or the file no longer has
+                        # these bytes: either way it changed
+                        raise RemoteFileChangedError(
+                            f"Expected 206 for bytes {offset}-{end}, "
+                            f"got {response.status}"
+                        )
+                    # Anything else (503, 429, ...) is retried, keeping progress
+                    header = response.getheader("Retry-After", "")
+                    retry_after = float(header) if header.isdigit() else None
+                    raise IOError(
+                        f"Bytes {offset}-{end}: {response.status} {response.reason}"
+                    )
+
+                remaining = end - offset + 1
+                while remaining and not stopped():
+                    n = response.readinto(buffer[: min(len(buffer), remaining)])
+                    if not n:
+                        raise IOError("Connection closed before the segment ended")
+                    os.pwrite(fd, buffer[:n], offset)
+                    offset += n
+                    remaining -= n
+                    with lock:
+                        segment[2] += n
+                    checkpoint()
+
+                if remaining:
+                    conn.close()
+                else:
+                    self.pool.release(remote["url"], conn)
+            except RemoteFileChangedError:
+                raise
+            except (OSError, HTTPException) as e:
+                if conn is not None:
+                    conn.close()
+                attempts += 1
+                if attempts > self.retries:
+                    raise IOError(f"Segment {start}-{end} failed: {e}") from e
+                # Back off, so a busy or rate-limiting server gets time to recover
+                if retry_after is None:
+                    retry_after = RETRY_BACKOFF * 2 ** (attempts - 1)
+                time.sleep(min(retry_after, MAX_RETRY_DELAY))
+
 
 class FTPDownloadStrategy:
     """FTP Download Strategy - Another 'Concrete Strategy'.
@@ -237,6 +785,481 @@ class TorrentDownloadStrategy:
         return file_path
 
 
+# Composite download strategy over several sources
+@dataclass
+class MirrorSource:
+    """One place an AppImage can be downloaded from.
+
+    Attributes:
+        name: Unique name of the source, the key of its performance history
+        strategy: The download strategy that fetches from this source
+        url: URL to download from instead of the AppImage's download_url
+    """
+
+    name: str
+    strategy: Any  # Using Any to accommodate duck typing
+    url: Optional[str] = None
+
+    def appimage_for(self, appimage: AppImage) -> AppImage:
+        """Get the AppImage as served by this source.
+
+        Args:
+            appimage: The AppImage to download
+
+        Returns:
+            AppImage: The AppImage, pointing at this source's URL
+        """
+        if self.url is None:
+            return appimage
+        return AppImage(data=replace(appimage.data, download_url=self.url))
+
+
+class MirrorHistory:
+    """Per-source download performance, persisted as JSON between runs.
+
+    Each source keeps exponentially weighted averages of its time to first
+    byte and throughput, its consecutive failures and when it was last
+    measured. The last known size of each AppImage is kept too, so runs that
+    skip measuring still estimate download times from the real size.
+    """
+
+    def __init__(self, path: str, weight: float = 0.3):
+        """Load the history, starting empty if the file is missing or corrupt.
+
+        Args:
+            path: The JSON history file
+            weight: Weight of a new measurement in the running averages
+        """
+        self.path = path
+        self.weight = weight
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, float]] = {}
+        self._sizes: Dict[str, int] = {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            self._entries, self._sizes = data["sources"], data["sizes"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._entries, self._sizes = {}, {}
+
+    def get(self, name: str) -> Optional[Dict[str, float]]:
+        """Get a copy of a source's entry.
+
+        Args:
+            name: The source name
+
+        Returns:
+            Optional[Dict[str, float]]: The entry, or None if never recorded
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            return dict(entry) if entry else None
+
+    def record(
+        self, name: str, ttfb: Optional[float], throughput: Optional[float]
+    ) -> None:
+        """Blend a successful measurement or download into a source's entry.
+
+        Args:
+            name: The source name
+            ttfb: Time to first byte in seconds (None if not measured)
+            throughput: Bytes per second (None if not measured)
+        """
+        with self._lock:
+            entry = self._entries.setdefault(
+                name, {"ttfb": None, "throughput": None, "failures": 0}
+            )
+            for key, value in (("ttfb", ttfb), ("throughput", throughput)):
+                if value is None:
+                    continue
+                if entry[key] is None:
+                    entry[key] = value
+                else:
+                    entry[key] += self.weight * (value - entry[key])
+            entry["failures"] = 0
+            entry["updated"] = time.time()
+
+    def size(self, appimage_name: str) -> Optional[int]:
+        """Get the last known size of an AppImage.
+
+        Args:
+            appimage_name: The AppImage name
+
+        Returns:
+            Optional[int]: Size in bytes, or None if never recorded
+        """
+        with self._lock:
+            return self._sizes.get(appimage_name)
+
+    def record_size(self, appimage_name: str, size: int) -> None:
+        """Remember the size of an AppImage.
+
+        Args:
+            appimage_name: The AppImage name
+            size: Size in bytes
+        """
+        with self._lock:
+            self._sizes[appimage_name] = size
+
+    def record_failure(self, name: str) -> None:
+        """Count a failed measurement, download or verification for a source.
+
+        Args:
+            name: The source name
+        """
+        with self._lock:
+            entry = self._entries.setdefault(
+                name, {"ttfb": None, "throughput": None, "failures": 0}
+            )
+            entry["failures"] += 1
+            entry["updated"] = time.time()
+
+    def expected_seconds(self, name: str, size: int) -> float:
+        """Estimate how long a source takes to deliver a file.
+
+        Args:
+            name: The source name
+            size: File size in bytes
+
+        Returns:
+            float: Estimated seconds, inflated by recent failures, or
+            infinity if the source has never delivered
+        """
+        entry = self.get(name)
+        if not entry or not entry["throughput"]:
+            return float("inf")
+        seconds = (entry["ttfb"] or 0.0) + size / entry["throughput"]
+        return seconds * (1 + entry["failures"])
+
+    def save(self) -> None:
+        """Atomically write the history file."""
+        with self._lock:
+            data = json.dumps(
+                {"sources": self._entries, "sizes": self._sizes}, indent=2
+            )
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+
+class MirrorRacingStrategy:
+    """Mirror Racing Strategy - A 'Concrete Strategy' made of other strategies.
+
+    This class implements the DownloadStrategy interface on top of several
+    sources for the same AppImage (HTTP mirrors, FTP, torrent, ...), each
+    with its own strategy. It combines the Strategy Pattern with the
+    Composite Pattern: AppImageDownloader sees a single download strategy,
+    so its verification strategy runs on the winning file as usual.
+
+    A download goes through these steps:
+    1. Sources whose strategy can measure() them (like HTTPDownloadStrategy)
+       and have no recent history are measured concurrently, for time to
+       first byte and throughput.
+    2. Sources are ranked by expected download time from the measurements
+       and the persisted history. Sources never seen to deliver go last.
+    3. Up to race_width of the best sources, if expected to be within
+       race_margin of the best one, download concurrently into fresh
+       staging directories of their own. The first to finish wins and the others are
+       cancelled; strategies whose download() accepts a cancel event stop
+       promptly, and the winner is returned without waiting for the rest.
+       If every racer fails, the other sources are tried in turn.
+    4. The results are persisted, so later runs skip measuring and start on
+       the best source.
+    """
+
+    def __init__(
+        self,
+        sources: List[MirrorSource],
+        history_path: Optional[str] = None,
+        race_width: int = 2,
+        race_margin: float = 2.0,
+        remeasure_after: float = 24 * 60 * 60,
+        sample_size: int = 256 * 1024,
+    ):
+        """Initialize with the sources to choose from.
+
+        Args:
+            sources: The sources, in order of preference when nothing is known
+            history_path: JSON file for the performance history (defaults to
+                .mirror-history.json in the destination directory)
+            race_width: Maximum number of sources that download concurrently
+            race_margin: How many times slower than the best source a source
+                may be expected to be and still race it
+            remeasure_after: Age in seconds after which a source is measured again
+            sample_size: Bytes transferred when measuring a source
+        """
+        self.sources = sources
+        self.history_path = history_path
+        self.race_width = race_width
+        self.race_margin = race_margin
+        self.remeasure_after = remeasure_after
+        self.sample_size = sample_size
+        self._histories: Dict[str, MirrorHistory] = {}
+        # (destination_dir, AppImage name) -> name of the source that served it
+        self._winners: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def _history(self, destination_dir: str) -> MirrorHistory:
+        """Get the shared history used for a destination directory."""
+        path = self.history_path or os.path.join(
+            destination_dir, ".mirror-history.json"
+        )
+        with self._lock:
+            if path not in self._histories:
+                self._histories[path] = MirrorHistory(path)
+            return self._histories[path]
+
+    def download(self, appimage: AppImage, destination_dir: str) -> str:
+        """Download the AppImage from the fastest source.
+
+        Args:
+            appimage: The AppImage to download
+            destination_dir: Directory to download to
+
+        Returns:
+            str: The path to the downloaded file
+
+        Raises:
+            IOError: If every source failed
+        """
+        os.makedirs(destination_dir, exist_ok=True)
+        history = self._history(destination_dir)
+        print(f"[MIRRORS] Choosing among {len(self.sources)} sources")
+
+        try:
+            measurements = self._measure(appimage, history)
+            size = next((m["size"] for m in measurements.values() if m["size"]), None)
+            if size:
+                history.record_size(appimage.name, size)
+            else:
+                # Nothing measured this run: use the size seen last time
+                size = history.size(appimage.name) or ASSUMED_APPIMAGE_SIZE
+            expected = {
+                source.name: history.expected_seconds(source.name, size)
+                for source in self.sources
+            }
+            ranked = sorted(self.sources, key=lambda source: expected[source.name])
+            print(
+                "[MIRRORS] Ranking: "
+                + ", ".join(
+                    f"{source.name} ({expected[source.name]:.2f}s)"
+                    if expected[source.name] != float("inf")
+                    else f"{source.name} (unknown)"
+                    for source in ranked
+                )
+            )
+
+            # Only race sources that stand a chance against the best one
+            best = expected[ranked[0].name]
+            racers = [
+                source
+                for source in ranked[: self.race_width]
+                if expected[source.name] <= best * self.race_margin
+            ]
+            groups = [racers] + [[source] for source in ranked[len(racers) :]]
+            for group in groups:
+                file_path = self._race(appimage, group, destination_dir, history)
+                if file_path:
+                    return file_path
+        finally:
+            history.save()
+
+        raise IOError(f"All {len(self.sources)} sources failed for {appimage.name}")
+
+    def report_failure(self, appimage: AppImage, destination_dir: str) -> None:
+        """Count a bad file (e.g. failed verification) against its source.
+
+        Args:
+            appimage: The AppImage that was downloaded
+            destination_dir: Directory it was downloaded to
+        """
+        with self._lock:
+            name = self._winners.pop((destination_dir, appimage.name), None)
+        if name:
+            history = self._history(destination_dir)
+            history.record_failure(name)
+            history.save()
+
+    def _measure(
+        self, appimage: AppImage, history: MirrorHistory
+    ) -> Dict[str, Dict[str, Any]]:
+        """Concurrently measure the sources that can be measured and need it.
+
+        Args:
+            appimage: The AppImage to download
+            history: The history to record the measurements in
+
+        Returns:
+            Dict[str, Dict[str, Any]]: measure() results by source name
+        """
+        now = time.time()
+        stale = []
+        for source in self.sources:
+            entry = history.get(source.name)
+            if hasattr(source.strategy, "measure") and (
+                not entry
+                or entry["failures"]
+                or now - entry["updated"] > self.remeasure_after
+            ):
+                stale.append(source)
+        if not stale:
+            return {}
+
+        print(f"[MIRRORS] Measuring {', '.join(source.name for source in stale)}")
+        with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+            futures = {
+                source.name: pool.submit(
+                    source.strategy.measure,
+                    source.appimage_for(appimage),
+                    self.sample_size,
+                )
+                for source in stale
+            }
+
+        measurements = {}
+        for name, future in futures.items():
+            try:
+                measurements[name] = future.result()
+            except Exception as e:
+                print(f"[MIRRORS] Measuring {name} failed: {e}")
+                history.record_failure(name)
+                continue
+            history.record(
+                name, measurements[name]["ttfb"], measurements[name]["throughput"]
+            )
+        return measurements
+
+    def _race(
+        self,
+        appimage: AppImage,
+        sources: List[MirrorSource],
+        destination_dir: str,
+        history: MirrorHistory,
+    ) -> Optional[str]:
+        """Download from several sources at once and keep the first to finish.
+
+        Args:
+            appimage: The AppImage to download
+            sources: The sources to race
+            destination_dir: Directory to download to
+            history: The history to record the outcome in
+
+        Returns:
+            Optional[str]: The path to the downloaded file, or None if every
+            source failed
+        """
+        print(f"[MIRRORS] Racing {', '.join(source.name for source in sources)}")
+        cancels = {source.name: threading.Event() for source in sources}
+        # Unique per race, so a straggler from an earlier race (or another
+        # process) downloading the same AppImage can't write into them
+        staging = {
+            source.name: tempfile.mkdtemp(
+                dir=destination_dir, prefix=f".{appimage.name}.{source.name}."
+            )
+            for source in sources
+        }
+        winner: Optional[Tuple[MirrorSource, str, float]] = None
+        start = time.perf_counter()
+
+        pool = ThreadPoolExecutor(max_workers=len(sources))
+        futures = {
+            pool.submit(
+                self._fetch,
+                source,
+                appimage,
+                staging[source.name],
+                cancels[source.name],
+            ): source
+            for source in sources
+        }
+        try:
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    path = future.result()
+                except DownloadCancelledError:
+                    continue
+                except Exception as e:
+                    print(f"[MIRRORS] {source.name} failed: {e}")
+                    history.record_failure(source.name)
+                    continue
+
+                winner = (source, path, time.perf_counter() - start)
+                break
+        finally:
+            # Stop the losers without waiting for them: a strategy that can't
+            # be cancelled would otherwise hold up the winner until it finished
+            for cancel in cancels.values():
+                cancel.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if winner is not None:
+            source, path, seconds = winner
+            file_path = os.path.join(destination_dir, os.path.basename(path))
+            os.replace(path, file_path)
+        for future, racer in futures.items():
+            # The staging directories are never reused, so each goes once its
+            # download has stopped, or right away if it already has
+            future.add_done_callback(
+                lambda _, directory=staging[racer.name]: shutil.rmtree(
+                    directory, ignore_errors=True
+                )
+            )
+        if winner is None:
+            return None
+
+        size = os.path.getsize(file_path)
+        history.record(source.name, None, size / seconds)
+        history.record_size(appimage.name, size)
+        with self._lock:
+            self._winners[(destination_dir, appimage.name)] = source.name
+
+        cancelled = [s.name for s in sources if s is not source]
+        print(
+            f"[MIRRORS] {source.name} won in {seconds:.2f}s"
+            + (f", cancelled {', '.join(cancelled)}" if cancelled else "")
+        )
+        return file_path
+
+    @staticmethod
+    def _fetch(
+        source: MirrorSource,
+        appimage: AppImage,
+        staging_dir: str,
+        cancel: threading.Event,
+    ) -> str:
+        """Download from one source into its staging directory.
+
+        Args:
+            source: The source to download from
+            appimage: The AppImage to download
+            staging_dir: Directory reserved for this source
+            cancel: Set when another source won
+
+        Returns:
+            str: The path to the downloaded file
+
+        Raises:
+            DownloadCancelledError: If another source won first
+            IOError: If the source produced no file
+        """
+        mirrored = source.appimage_for(appimage)
+        if "cancel" in inspect.signature(source.strategy.download).parameters:
+            path = source.strategy.download(mirrored, staging_dir, cancel=cancel)
+        else:
+            path = source.strategy.download(mirrored, staging_dir)
+
+        if cancel.is_set():
+            raise DownloadCancelledError(f"{source.name} lost the race")
+        if not os.path.isfile(path):
+            raise IOError(f"{source.name} produced no file at {path}")
+        return path
+
+
 # Concrete Verification Strategies
 class ChecksumVerificationStrategy:
     """Checksum Verification Strategy - A 'Concrete Strategy' for verification.
@@ -346,6 +1369,10 @@ class AppImageDownloader:
                 return True
             else:
                 print(f"Verification failed for: {appimage.name}")
+                # Let strategies with several sources avoid the one that served it
+                report_failure = getattr(self.download_strategy, "report_failure", None)
+                if report_failure:
+                    report_failure(appimage, self.download_dir)
                 return False
 
         except Exception as e:
@@ -376,6 +1403,121 @@ class AppImageDownloader:
         self.verification_strategy = verification_strategy
 
 
+# Local range-capable HTTP server, standing in for a release host
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """SimpleHTTPRequestHandler that also serves single byte ranges.
+
+    http.server ignores Range headers, so this handler answers them with
+    206 Partial Content, honors If-Range against its ETag, and keeps
+    connections alive. It lets HTTPDownloadStrategy be exercised end to end
+    without network access:
+
+        handler = partial(RangeRequestHandler, directory=serve_dir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+
+    Latency and a per-connection rate limit can be added, to stand in for
+    a distant mirror or a high-latency link.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def __init__(
+        self,
+        *args: Any,
+        latency: float = 0.0,
+        bytes_per_second: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """Initialize and handle the connection.
+
+        Args:
+            *args: Arguments for SimpleHTTPRequestHandler
+            latency: Seconds to wait before answering each request
+            bytes_per_second: Per-connection rate limit (None for unlimited)
+            **kwargs: Keyword arguments for SimpleHTTPRequestHandler
+        """
+        self.latency = latency
+        self.bytes_per_second = bytes_per_second
+        super().__init__(*args, **kwargs)
+
+    def handle(self) -> None:
+        """Handle requests until the client disconnects."""
+        try:
+            super().handle()
+        except ConnectionError:
+            # The client dropped the connection, e.g. an abandoned segment
+            pass
+
+    def do_HEAD(self) -> None:
+        """Answer a HEAD request."""
+        self._serve(send_body=False)
+
+    def do_GET(self) -> None:
+        """Answer a GET request, honoring a Range header."""
+        self._serve(send_body=True)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep request logs out of the demo output."""
+
+    def _serve(self, send_body: bool) -> None:
+        """Send the requested file, or the requested range of it.
+
+        Args:
+            send_body: Whether to send the body (False for HEAD)
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            self.send_error(404)
+            return
+
+        stat = os.stat(path)
+        size = stat.st_size
+        etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+        start, end = 0, size - 1
+        status = 200
+
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", self.headers.get("Range", ""))
+        if_range = self.headers.get("If-Range")
+        if match and (match[1] or match[2]) and if_range in (None, etag):
+            if match[1]:
+                start = int(match[1])
+                end = min(int(match[2]), size - 1) if match[2] else size - 1
+            else:
+                start = max(0, size - int(match[2]))
+            if start > end:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if not send_body:
+            return
+
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining:
+                chunk = f.read(min(64 * 1024, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+                if self.bytes_per_second:
+                    time.sleep(len(chunk) / self.bytes_per_second)
+
+
 def main():
     """Example of the Strategy Design Pattern in action.
 
@@ -404,6 +1546,30 @@ def main():
     )
     github_image = AppImage(data=github_data)
 
+    # Serve a fake AppImage from a local range-capable server, so the HTTP
+    # strategy really downloads something without network access
+    work_dir = tempfile.mkdtemp(prefix="strategy-demo-")
+    serve_dir = os.path.join(work_dir, "releases")
+    os.makedirs(serve_dir)
+    with open(os.path.join(serve_dir, "local-app.AppImage"), "wb") as f:
+        f.write(os.urandom(32 * 1024 * 1024))
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(RangeRequestHandler, directory=serve_dir)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    local_url = f"http://127.0.0.1:{server.server_port}/local-app.AppImage"
+    local_image = AppImage(
+        data=AppImageData(
+            name="local-app",
+            arch_keyword="x86_64",
+            download_url=local_url,
+            sha_download_url=f"{local_url}.sha256",
+            version="1.0",
+            display_name="Local App",
+            sha_file_name="local-app.AppImage.sha256",
+        )
+    )
+
     # Create strategies
     print("1. Creating download and verification strategies...")
     http_strategy = HTTPDownloadStrategy(user_agent="AppImageManager/2.0", timeout=60)
@@ -418,12 +1584,14 @@ def main():
     downloader = AppImageDownloader(
         download_strategy=http_strategy,
         verification_strategy=checksum_strategy,
-        download_dir="/tmp/appimages",
+        download_dir=os.path.join(work_dir, "appimages"),
     )
 
     # Download using initial strategies
     print("\n3. Downloading with HTTP strategy and checksum verification...")
-    downloader.download_and_verify(github_image)
+    start = time.perf_counter()
+    downloader.download_and_verify(local_image)
+    print(f"Fetched 32 MiB in segments in {time.perf_counter() - start:.2f}s")
 
     # Change download strategy at runtime
     print("\n4. Changing to FTP download strategy...")
@@ -440,6 +1608,55 @@ def main():
     downloader.set_download_strategy(torrent_strategy)
     downloader.download_and_verify(github_image)
 
+    # Race two mirrors of the local AppImage, the way a distant mirror and
+    # a nearby one would compete, with an FTP mirror as a last resort
+    print("\n7. Racing mirrors with a composite download strategy...")
+    mirrors = [
+        ThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            partial(
+                RangeRequestHandler,
+                directory=serve_dir,
+                latency=latency,
+                bytes_per_second=bytes_per_second,
+            ),
+        )
+        for latency, bytes_per_second in [
+            (0.1, 4 * 1024 * 1024),
+            (0.02, 6 * 1024 * 1024),
+        ]
+    ]
+    for mirror in mirrors:
+        threading.Thread(target=mirror.serve_forever, daemon=True).start()
+    racing_strategy = MirrorRacingStrategy(
+        sources=[
+            MirrorSource(
+                "distant-mirror",
+                http_strategy,
+                f"http://127.0.0.1:{mirrors[0].server_port}/local-app.AppImage",
+            ),
+            MirrorSource(
+                "nearby-mirror",
+                http_strategy,
+                f"http://127.0.0.1:{mirrors[1].server_port}/local-app.AppImage",
+            ),
+            MirrorSource("ftp-mirror", ftp_strategy),
+        ],
+        history_path=os.path.join(work_dir, "mirror-history.json"),
+    )
+    downloader.set_download_strategy(racing_strategy)
+    downloader.set_verification_strategy(checksum_strategy)
+    downloader.download_and_verify(local_image)
+
+    print("\nDownloading again, starting on the best source from the history...")
+    downloader.download_and_verify(local_image)
+
+    for mirror in mirrors:
+        mirror.shutdown()
+    server.shutdown()
+    http_strategy.pool.close()
+    shutil.rmtree(work_dir)
+
     print("\n=== STRATEGY PATTERN BENEFITS ===")
     print("* Algorithms can be selected at runtime")
     print("* New algorithms can be added without modifying existing code")
@@ -0,0 +1,144 @@
+"""
+Benchmarks for the strategy.py download strategies.
+
+Run from this directory:
+
+    python strategy_benchmark.py
+"""
+
+import os
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import ThreadingHTTPServer
+
+from strategy import (
+    AppImage,
+    AppImageData,
+    HTTPDownloadStrategy,
+    MirrorRacingStrategy,
+    MirrorSource,
+    RangeRequestHandler,
+)
+
+
+def make_app_image(url):
+    return AppImage(
+        data=AppImageData(
+            name="bench-app",
+            arch_keyword="x86_64",
+            download_url=url,
+            sha_download_url=f"{url}.sha256",
+            version="1.0",
+            display_name="Bench App",
+            sha_file_name="bench-app.AppImage.sha256",
+        )
+    )
+
+
+def benchmark_segmented_download(size_mib, segment_counts):
+    print(f"\nHTTP download of {size_mib} MiB, 8 MiB/s per connection")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        serve_dir = os.path.join(tmp_dir, "releases")
+        os.makedirs(serve_dir)
+        with open(os.path.join(serve_dir, "bench-app.AppImage"), "wb") as f:
+            f.write(os.urandom(size_mib * 1024 * 1024))
+
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            # Cap each connection, like a long fat link does per TCP flow
+            partial(
+                RangeRequestHandler,
+                directory=serve_dir,
+                bytes_per_second=8 * 1024 * 1024,
+            ),
+        )
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/bench-app.AppImage"
+
+        for segments in segment_counts:
+            strategy = HTTPDownloadStrategy(
+                segments=segments, min_segment_size=1024 * 1024
+            )
+            destination_dir = os.path.join(tmp_dir, f"segments-{segments}")
+            start = time.perf_counter()
+            strategy.download(make_app_image(url), destination_dir)
+            duration = time.perf_counter() - start
+            strategy.pool.close()
+            print(
+                f"  {segments} segment(s): {duration:.2f} seconds "
+                f"({size_mib / duration:.1f} MiB/s)"
+            )
+
+        server.shutdown()
+        server.server_close()
+
+
+def benchmark_mirror_selection(size_mib):
+    print(f"\nDownload of {size_mib} MiB from a distant and a nearby mirror")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        serve_dir = os.path.join(tmp_dir, "releases")
+        os.makedirs(serve_dir)
+        with open(os.path.join(serve_dir, "bench-app.AppImage"), "wb") as f:
+            f.write(os.urandom(size_mib * 1024 * 1024))
+
+        urls = []
+        servers = []
+        for latency, bytes_per_second in [(0.1, 2 * 1024 * 1024), (0.01, None)]:
+            server = ThreadingHTTPServer(
+                ("127.0.0.1", 0),
+                partial(
+                    RangeRequestHandler,
+                    directory=serve_dir,
+                    latency=latency,
+                    bytes_per_second=bytes_per_second,
+                ),
+            )
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            servers.append(server)
+            urls.append(f"http://127.0.0.1:{server.server_port}/bench-app.AppImage")
+
+        http_strategy = HTTPDownloadStrategy(min_segment_size=1024 * 1024)
+        racing_strategy = MirrorRacingStrategy(
+            sources=[
+                MirrorSource("distant", http_strategy, urls[0]),
+                MirrorSource("nearby", http_strategy, urls[1]),
+            ],
+            history_path=os.path.join(tmp_dir, "mirror-history.json"),
+        )
+        runs = [
+            ("first listed mirror", http_strategy, urls[0]),
+            ("racing, first run", racing_strategy, urls[0]),
+            ("racing, with history", racing_strategy, urls[0]),
+        ]
+        for i, (label, strategy, url) in enumerate(runs):
+            destination_dir = os.path.join(tmp_dir, f"run-{i}")
+            start = time.perf_counter()
+            strategy.download(make_app_image(url), destination_dir)
+            duration = time.perf_counter() - start
+            print(f"  {label}: {duration:.2f} seconds")
+
+        http_strategy.pool.close()
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+
+def main():
+    benchmark_segmented_download(size_mib=64, segment_counts=[1, 4, 8])
+    benchmark_mirror_selection(size_mib=32)
+
+    # ## Results:
+    #     HTTP download of 64 MiB, 8 MiB/s per connection
+    #       1 segment(s): 8.23 seconds (7.8 MiB/s)
+    #       4 segment(s): 2.07 seconds (30.9 MiB/s)
+    #       8 segment(s): 1.05 seconds (60.8 MiB/s)
+    #     Download of 32 MiB from a distant and a nearby mirror
+    #       first listed mirror: 4.30 seconds
+    #       racing, first run: 0.28 seconds
+    #       racing, with history: 0.08 seconds
+
+
+if __name__ == "__main__":
+    main()